@@ -1,6 +1,15 @@
+import io
+
 import pandas as pd
 from pathlib import Path
-import matplotlib.pyplot as plt
+
+from downsample import plot_downsampled
+from frame_cache import content_hash, prefix_hash, read_csv_cached
+from grid import to_grid
+from mtu import parse_mtu_start, mtu_tz_for_column
+from pipeline import Stage, run_pipeline, tail_offset, truncate
+from profiling import instrument, profiled, report, stage
+from series_store import store_for_csv
 
 # --- Muted color palette centered on #75896b ---
 palette = {
@@ -11,8 +20,8 @@ palette = {
     "amber":   "#b09b6b"
 }
 
-# Update global Matplotlib style
-plt.rcParams.update({
+# Matplotlib style, applied only when a plot is drawn (data-only runs never import matplotlib)
+PLOT_STYLE = {
     "font.family": "serif",
     "font.serif": ["Georgia", "DejaVu Serif", "Garamond"],
     "font.size": 12,
@@ -31,7 +40,13 @@ plt.rcParams.update({
     "axes.spines.right": False,
     "figure.facecolor": "white",
     "axes.facecolor": "white",
-})
+}
+
+def _pyplot():
+    """Import pyplot and apply PLOT_STYLE on first use."""
+    import matplotlib.pyplot as plt
+    plt.rcParams.update(PLOT_STYLE)
+    return plt
 
 # ---------- Config ----------
 data_dir = Path("Load Data")
@@ -45,10 +60,24 @@ f_2022_hr = data_dir / "TotalLoadDayAhead_Hour_2022.csv"
 out_2023_hr = data_dir / "TotalLoadDayAhead_Hour_2023.csv"
 out_2024_hr = data_dir / "TotalLoadDayAhead_Hour_2024.csv"
 out_2022_aligned = data_dir / "TotalLoadDayAhead_Hour_2022_aligned.csv"
+out_combined = data_dir / "TotalLoadDayAhead_Hour_2022_2024_combined.csv"
+
+# (raw input, hourly output, resolution) in chronological order.
+# To add a year, append its entry: only the new file is processed and appended to the combined output.
+SOURCES = [
+    (f_2022_hr, out_2022_aligned, "hour"),
+    (f_2023_15, out_2023_hr, "15min"),
+    (f_2024_15, out_2024_hr, "15min"),
+]
+
+# Raw rows re-read in front of new data when a 15-min file only grew: more than the 8
+# quarter hours of a fall-back hour, so the last (possibly partial) hour is rebuilt whole
+TAIL_ROWS = 16
 
 # Possible datetime column names from ENTSO-E
 POSSIBLE_TIME_COLS = ["MTU (CET/CEST)", "MTU (UTC)", "datetime"]
 
+@instrument
 def load_and_clean_time_col(df: pd.DataFrame) -> pd.DataFrame:
     """Find and clean the datetime column, parse as datetime, and set as index."""
     time_col = next((col for col in POSSIBLE_TIME_COLS if col in df.columns), None)
@@ -56,59 +85,62 @@ def load_and_clean_time_col(df: pd.DataFrame) -> pd.DataFrame:
         raise ValueError(f"Could not find a time column in {POSSIBLE_TIME_COLS}")
 
     df = df.rename(columns={time_col: "datetime"}).copy()
-    df["datetime"] = (
-        df["datetime"]
-        .astype(str)
-        .str.replace(r"\s*\(CET\)|\s*\(CEST\)|\s*\(UTC\)", "", regex=True)
-        .str.split(" - ").str[0]  # take the start of the interval
-        .str.strip()
-    )
-    df["datetime"] = pd.to_datetime(df["datetime"], format="%d/%m/%Y %H:%M", errors="coerce")
+    # Start of the interval as local wall-clock time (fall-back hour stays duplicated)
+    df["datetime"] = parse_mtu_start(df["datetime"], tz=mtu_tz_for_column(time_col), utc=False)
+    bad = int(df["datetime"].isna().sum())
+    if bad:
+        print(f"⚠️ Dropping {bad} rows with unparseable '{time_col}' (listed by quality.py as bad_time).")
     df = df.dropna(subset=["datetime"]).set_index("datetime")
     return df
 
+@instrument
 def coerce_numeric(df: pd.DataFrame) -> pd.DataFrame:
     """Convert all columns (except datetime) to numeric, coercing errors to NaN."""
     for c in df.columns:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
+        num = pd.to_numeric(df[c], errors="coerce")
+        bad = int((num.isna() & df[c].notna()).sum())
+        if bad and num.notna().any():  # text columns (Area) are all-NaN, not bad values
+            print(f"⚠️ {c}: {bad} non-numeric values set to NaN.")
+        df[c] = num
     return df
 
-def collapse_duplicates(df: pd.DataFrame, how: str = "mean") -> pd.DataFrame:
-    """
-    Collapse duplicate timestamps (e.g., at DST fallback).
-    how='mean' for MW-like series, 'sum' if you have energy quantities.
-    """
-    dups = df.index.duplicated(keep=False).sum()
-    if dups:
-        print(f"⚠️ Found {dups} duplicate timestamp rows; collapsing by {how}.")
-        if how == "sum":
-            df = df.groupby(level=0).sum()
-        else:
-            df = df.groupby(level=0).mean()
-    return df
+def clean_load_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Datetime index + numeric columns for a raw ENTSO-E load table."""
+    return coerce_numeric(load_and_clean_time_col(df))
 
-def process_15min_to_hour(in_path: Path, out_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(in_path)
-    df = load_and_clean_time_col(df)
-    df = coerce_numeric(df)
+@instrument
+def read_load_file(in_path: Path) -> pd.DataFrame:
+    """Read and clean a raw load file, served from the frame cache when unchanged."""
+    return read_csv_cached(in_path, postprocess=clean_load_frame)
 
-    # Resample to hourly mean (use .sum() if your columns are energy per 15-min)
-    df_hr = df.resample("h").mean().reset_index()
-    df_hr.to_csv(out_path, index=False)
+def process_15min_to_hour(in_path: Path, out_path: Path) -> pd.DataFrame:
+    df = read_load_file(in_path)
+
+    # Resample to hourly mean (use how="sum" if your columns are energy per 15-min)
+    with stage("resample", rows_in=len(df)) as st:
+        df_hr, _ = to_grid(df, "h", how="mean")
+        df_hr = df_hr.reset_index()
+        st.rows_out = len(df_hr)
+    with stage("to_csv", rows_in=len(df_hr)):
+        df_hr.to_csv(out_path, index=False)
     print(f"✅ Hourly resampling done: {in_path.name} → {out_path.name}")
     return df_hr
 
 def clean_hourly_file(in_path: Path) -> pd.DataFrame:
     """Normalize and clean an already-hourly file."""
-    df = pd.read_csv(in_path)
-    df = load_and_clean_time_col(df)
-    df = coerce_numeric(df)
-
-    # 1) Collapse any duplicate hourly timestamps first (DST fallback etc.)
-    df = collapse_duplicates(df, how="mean")  # change to "sum" if appropriate
+    df = read_load_file(in_path)
 
-    # 2) Now it's safe to force a perfect hourly grid
-    df = df.asfreq("h").reset_index()
+    # Collapse duplicate hourly timestamps (DST fallback etc.) and force a perfect hourly grid
+    # in one pass; missing hours come back as NaN rows
+    dups = df.index.duplicated(keep=False).sum()
+    if dups:
+        print(f"⚠️ Found {dups} duplicate timestamp rows; collapsing by mean.")
+    with stage("to_grid", rows_in=len(df)) as st:
+        df, missing = to_grid(df, "h", how="mean")  # change to "sum" if appropriate
+        df = df.reset_index()
+        st.rows_out = len(df)
+    if missing.any():
+        print(f"⚠️ {int(missing.sum())} missing hours in {in_path.name} (left as NaN).")
     return df
 
 def align_headers(df: pd.DataFrame, ref_cols: list) -> pd.DataFrame:
@@ -122,86 +154,295 @@ def align_headers(df: pd.DataFrame, ref_cols: list) -> pd.DataFrame:
     df = df[ref_cols]
     return df
 
-def main():
-    df_2023_hr = process_15min_to_hour(f_2023_15, out_2023_hr)
-    df_2024_hr = process_15min_to_hour(f_2024_15, out_2024_hr)
-
-    # Make a canonical schema from 2023 + 2024
-    ref_cols = list(df_2023_hr.columns)
-    for c in df_2024_hr.columns:
-        if c not in ref_cols:
-            ref_cols.append(c)
+def header_path(out_path: Path) -> Path:
+    """Header-only copy of an hourly output, e.g. TotalLoadDayAhead_Hour_2023.header.csv."""
+    return out_path.with_suffix(".header.csv")
+
+def write_header(df: pd.DataFrame, out_path: Path) -> Path:
+    """Write the column row of `df` next to `out_path`; unchanged columns give an unchanged file."""
+    path = header_path(out_path)
+    df.head(0).to_csv(path, index=False)
+    return path
+
+def read_rows(path: Path, start: int, stop: int = None) -> pd.DataFrame:
+    """Rows of a CSV between two byte offsets on row boundaries, parsed with the file's own header."""
+    with open(path, "rb") as fh:
+        header = fh.readline()
+        fh.seek(start)
+        body = fh.read() if stop is None else fh.read(stop - start)
+    return pd.read_csv(io.BytesIO(header + body))
+
+def _outputs_intact(prev: dict, paths: list) -> bool:
+    """True if every output is still the file this stage wrote last time."""
+    return all(Path(p).exists() and prev["outputs"].get(str(p)) == content_hash(p) for p in paths)
+
+def _only_grew(path: Path, prev: dict, size: int) -> bool:
+    """True if `path` is its previous content (`size` bytes) plus new bytes at the end."""
+    return path.stat().st_size >= size and prefix_hash(path, size) == prev["inputs"].get(str(path))
+
+def append_15min_tail(in_path: Path, out_path: Path, state: dict):
+    """
+    Hourly rows for data appended to a 15-min file since `state`: the last hour is rebuilt
+    from the re-read tail rows and everything after it is appended to the hourly output.
+    Returns None when the tail does not allow that (full rebuild needed).
+    """
+    last = pd.Timestamp(state["last_slot"])
+    old = clean_load_frame(read_rows(in_path, state["raw_tail"], state["raw_size"]))
+    new = clean_load_frame(read_rows(in_path, state["raw_size"]))
+    with open(in_path, "rb") as fh:
+        from_start = state["raw_tail"] <= len(fh.readline())
+    if old.empty or (old.index.min() >= last and not from_start) or (len(new) and new.index.min() < last):
+        return None  # re-read rows miss part of the last hour, or new rows go back in time
+
+    with stage("resample", rows_in=len(old) + len(new)) as st:
+        df_hr, _ = to_grid(pd.concat([old, new]), "h", how="mean", origin=last)
+        df_hr = df_hr.reset_index()
+        st.rows_out = len(df_hr)
+    with stage("to_csv", rows_in=len(df_hr)):
+        truncate(out_path, state["out_tail"])
+        df_hr.to_csv(out_path, mode="a", header=False, index=False)
+    print(f"✅ Appended {len(new)} new rows: {in_path.name} → {out_path.name} (+{len(df_hr) - 1} hours)")
+    return df_hr
 
-    df_2022_clean = clean_hourly_file(f_2022_hr)
-    df_2022_aligned = align_headers(df_2022_clean, ref_cols)
-    df_2022_aligned.to_csv(out_2022_aligned, index=False)
-    print(f"✅ 2022 aligned: {f_2022_hr.name} → {out_2022_aligned.name}")
+def hourly_stage(in_path: Path, out_path: Path):
+    """
+    Stage: 15-min raw file → hourly file (+ its header file, the schema the align stages read).
+    When the raw file only grew since the last run, just its new rows are resampled and appended.
+    """
+    def run(prev):
+        state = (prev or {}).get("state")
+        df_hr = None
+        if state and _outputs_intact(prev, [out_path]) and _only_grew(in_path, prev, state["raw_size"]):
+            df_hr = append_15min_tail(in_path, out_path, state)
+        if df_hr is None:
+            df_hr = process_15min_to_hour(in_path, out_path)
+        write_header(df_hr, out_path)
+        if df_hr.empty:
+            return None
+        return {
+            "raw_size": in_path.stat().st_size,
+            "raw_tail": tail_offset(in_path, TAIL_ROWS),
+            "out_tail": tail_offset(out_path, 1),
+            "last_slot": str(df_hr["datetime"].iloc[-1]),
+        }
+    return run
+
+def align_stage(in_path: Path, out_path: Path, ref_paths: list):
+    """Stage: raw hourly file → cleaned file aligned to the 15-min schema."""
+    def run(prev):
+        # Make a canonical schema from the hourly header files, so new 15-min data
+        # does not re-align this file unless the columns themselves changed
+        ref_cols = []
+        for ref in ref_paths:
+            for c in pd.read_csv(ref, nrows=0).columns:
+                if c not in ref_cols:
+                    ref_cols.append(c)
+
+        df_clean = clean_hourly_file(in_path)
+        df_aligned = align_headers(df_clean, ref_cols or list(df_clean.columns))
+        with stage("to_csv", rows_in=len(df_aligned)):
+            df_aligned.to_csv(out_path, index=False)
+        print(f"✅ Aligned: {in_path.name} → {out_path.name}")
+    return run
+
+def _append_part(part: Path, out_path: Path, header: list, offset: int = 0) -> int:
+    """Append the rows of `part` from byte `offset` on to the combined file, in its column order."""
+    df = pd.read_csv(part) if offset == 0 else read_rows(part, offset)
+    df = align_headers(df, header)
+    with stage("to_csv", rows_in=len(df)):
+        df.to_csv(out_path, mode="a", header=False, index=False)
+    return len(df)
+
+def combine_stage(parts: list, out_path: Path):
+    """
+    Stage: concat all hourly parts into one file.
+    The state keeps every part's byte offsets in the combined file. A changed part cuts the
+    file back to where that part starts and only it and the later parts are re-appended;
+    a part that only grew (new rows after its old last row) appends just those rows.
+    """
+    def run(prev):
+        header = []
+        for p in parts:
+            for c in pd.read_csv(p, nrows=0).columns:
+                if c not in header:
+                    header.append(c)
+        state = (prev or {}).get("state") or {}
+        done = state.get("parts", [])
+        if state.get("header") != header or not _outputs_intact(prev, [out_path]):
+            done = []
+
+        # first part that is new, moved or changed since the last run
+        i = next((i for i, p in enumerate(parts)
+                  if i >= len(done) or done[i]["path"] != str(p) or prev["inputs"].get(str(p)) != content_hash(p)),
+                 len(parts))
+        entries, offset, start = done[:i], 0, None
+        if not done:
+            pd.DataFrame(columns=header).to_csv(out_path, index=False)
+        elif i < len(done) and done[i]["path"] == str(parts[i]):
+            old = done[i]
+            grew = parts[i].stat().st_size >= old["tail"] and prefix_hash(parts[i], old["tail"]) == old["tail_hash"]
+            truncate(out_path, old["out_tail"] if grew else old["start"])
+            offset, start = (old["tail"], old["start"]) if grew else (0, None)
+        else:
+            truncate(out_path, done[i]["start"] if i < len(done) else out_path.stat().st_size)
+
+        appended = 0
+        for j, p in enumerate(parts[i:]):
+            begin = out_path.stat().st_size if start is None or j else start
+            appended += _append_part(p, out_path, header, offset if j == 0 else 0)
+            tail = tail_offset(p, 1)
+            entries.append({
+                "path": str(p),
+                "start": begin,
+                "out_tail": tail_offset(out_path, 1) if out_path.stat().st_size > begin else begin,
+                "tail": tail,
+                "tail_hash": prefix_hash(p, tail),
+            })
+        if done:
+            print(f"✅ Appended {appended} rows from {len(parts) - i} part(s) → {out_path.name}")
+        else:
+            print(f"✅ Combined file saved: {out_path.name} ({appended} rows)")
+        return {"header": header, "parts": entries}
+    return run
+
+def quality_stage(in_path: Path, out_paths: list):
+    """Stage: raw file → quality reports (gaps, duplicates, bad/stuck/out-of-range values, spikes)."""
+    def run(prev):
+        from quality import check_file, print_summary, write_reports
+        summary, series, issues = check_file(in_path)
+        write_reports(summary, series, issues, out_paths[0].parent)
+        print_summary(summary)
+    return run
+
+def sketch_stage(in_path: Path, out_path: Path):
+    """Stage: raw file → quantile sketches (read chunk by chunk, never whole)."""
+    def run(prev):
+        from quantiles import sketch_file
+        sketch_file(in_path).save(out_path)
+    return run
+
+def merge_sketches_stage(parts: list, out_path: Path):
+    """Stage: per-file sketches → one merged sketch set."""
+    def run(prev):
+        from quantiles import QuantileSketches
+        merged = QuantileSketches()
+        for part in parts:
+            merged.merge(QuantileSketches.load(part))
+        merged.save(out_path)
+    return run
+
+def dataset_stage(combined: Path, root: Path):
+    """Stage: combined hourly file → load table of the Parquet dataset (changed months only)."""
+    def run(prev):
+        from dataset import write_source
+        n = write_source("load", combined, root=root)
+        print(f"✅ Dataset load table: {n} partitions written → {root / 'load'}")
+    return run
+
+def build_stages(sources: list = SOURCES, combined: Path = out_combined) -> list:
+    """Pipeline stages for every (raw input, hourly output, resolution) entry plus the final concat."""
+    headers = [header_path(out) for _, out, kind in sources if kind == "15min"]
+    stages = []
+    for in_path, out_path, kind in sources:
+        if kind == "15min":
+            stages.append(Stage(f"hourly:{in_path.name}", hourly_stage(in_path, out_path), [in_path],
+                                [out_path, header_path(out_path)]))
+        else:
+            stages.append(Stage(
+                f"align:{in_path.name}",
+                align_stage(in_path, out_path, headers),
+                [in_path] + headers,
+                [out_path],
+            ))
+
+    parts = [out for _, out, _ in sources]
+    stages.append(Stage("combine", combine_stage(parts, combined), parts, [combined]))
+
+    # Keep the queryable dataset in step with the combined file
+    from dataset import DATASET_ROOT, stats_path
+    stages.append(Stage("dataset:load", dataset_stage(combined, DATASET_ROOT), [combined],
+                        [stats_path("load", DATASET_ROOT)]))
+
+    # Quality report of every raw input, before anything is dropped or filled
+    from quality import QUALITY_DIR
+    for in_path, _, _ in sources:
+        reports = [QUALITY_DIR / f"{in_path.stem}_series.csv", QUALITY_DIR / f"{in_path.stem}_issues.csv"]
+        stages.append(Stage(f"quality:{in_path.name}", quality_stage(in_path, reports), [in_path], reports))
+
+    # Quantile sketches of the raw 15-min/hourly inputs (duration curves, P5/P50/P95 bands)
+    from quantiles import SKETCH_DIR
+    sketches = [SKETCH_DIR / f"{in_path.stem}.npz" for in_path, _, _ in sources]
+    for (in_path, _, _), sk in zip(sources, sketches):
+        stages.append(Stage(f"sketch:{in_path.name}", sketch_stage(in_path, sk), [in_path], [sk]))
+    merged = SKETCH_DIR / "sketches.npz"
+    stages.append(Stage("merge_sketches", merge_sketches_stage(sketches, merged), sketches, [merged]))
+    return stages
+
+def main(force: bool = False, sources: list = SOURCES, combined: Path = out_combined):
+    ran = run_pipeline(build_stages(sources, combined), force=force)
 
     print("\n=== Summary ===")
-    for name, df in [("2023", df_2023_hr), ("2024", df_2024_hr), ("2022 (aligned)", df_2022_aligned)]:
-        print(f"{name}: {len(df)} rows, columns: {list(df.columns)}")
-        print(df.head(3), "\n")
-
-    # 5) Combine all three aligned dataframes into one
-    df_all = pd.concat([df_2022_aligned, df_2023_hr, df_2024_hr], ignore_index=True)
-    df_all.to_csv(data_dir / "TotalLoadDayAhead_Hour_2022_2024_combined.csv", index=False)
-    print("✅ Combined file saved: TotalLoadDayAhead_Hour_2022_2024_combined.csv")
+    for name, did_run in ran.items():
+        print(f"{name}: {'rebuilt' if did_run else 'up to date'}")
+
+def plot_combined(combined_file: Path = out_combined, plots_dir: Path = Path("plots")):
+    """Plot actual vs day-ahead load for the full combined period and a zoomed window."""
+    plt = _pyplot()
+    # Timed savefig (shows up as the "savefig" stage in the profile report)
+    savefig = profiled(plt.Figure.savefig, "savefig")
+
+    # Load and prepare
+    df_all = read_csv_cached(combined_file, parse_dates=["datetime"])
+    df_all = df_all.sort_values("datetime")
+
+    # Try to auto-detect column names
+    cols = [c.lower() for c in df_all.columns]
+
+    # Common ENTSO-E names: 'Total Load - Day Ahead [MW]', 'Total Load - Actual [MW]'
+    col_actual = next((c for c in df_all.columns if "actual" in c.lower()), None)
+    col_forecast = next((c for c in df_all.columns if "day" in c.lower() or "forecast" in c.lower()), None)
+
+    if not col_actual or not col_forecast:
+        raise ValueError(f"Couldn’t find expected 'actual' and 'day-ahead' columns. Columns found: {df_all.columns.tolist()}")
+
+    # --- Plot full period ---
+    fig, ax = plt.subplots(figsize=(14, 6))
+    plot_downsampled(ax, df_all["datetime"], df_all[col_actual], dpi=300,
+                     color=palette["primary"], label="Actual Load")
+    plot_downsampled(ax, df_all["datetime"], df_all[col_forecast], dpi=300,
+                     color=palette["blue"], label="Day-Ahead Forecast", alpha=0.8, linewidth=1.6)
+
+    ax.set_title("Electric Load – Actual vs Day-Ahead Forecast (2022-2024)")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Load [MW]")
+    ax.grid(True)
+    ax.legend(frameon=False)
+
+    plt.tight_layout()
+    savefig(fig, plots_dir / "TotalLoad_Actual_vs_DayAhead_2022_2024.png", dpi=300)
+
+    # --- Optional: Zoom on a single period for clarity ---
+    start, end = "2023-01-01", "2023-12-01"
+    # Offset slice of the memory-mapped hourly grid instead of a boolean scan
+    df_zoom = store_for_csv(combined_file).window(start, end, [col_actual, col_forecast])
+
+    fig, ax = plt.subplots(figsize=(14, 6))
+    plot_downsampled(ax, df_zoom.index, df_zoom[col_actual], dpi=300,
+                     color=palette["primary"], label="Actual Load")
+    plot_downsampled(ax, df_zoom.index, df_zoom[col_forecast], dpi=300,
+                     color=palette["blue"], label="Day-Ahead Forecast", alpha=0.8)
+
+    ax.set_title(f"Zoomed View: {start} to {end}")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Load [MW]")
+    ax.legend(frameon=False)
+    ax.grid(True)
+
+    plt.tight_layout()
+    savefig(fig, plots_dir / f"TotalLoad_Zoom_{start}_to_{end}.png", dpi=300)
+    plt.show()
 
 if __name__ == "__main__":
     main()
-# Path to combined file
-data_dir = Path("Load Data")
-plots_dir = Path("plots")
-combined_file = data_dir / "TotalLoadDayAhead_Hour_2022_2024_combined.csv"
-
-
-# Load and prepare
-df_all = pd.read_csv(combined_file, parse_dates=["datetime"])
-df_all = df_all.sort_values("datetime")
-
-# Try to auto-detect column names
-cols = [c.lower() for c in df_all.columns]
-
-# Common ENTSO-E names: 'Total Load - Day Ahead [MW]', 'Total Load - Actual [MW]'
-col_actual = next((c for c in df_all.columns if "actual" in c.lower()), None)
-col_forecast = next((c for c in df_all.columns if "day" in c.lower() or "forecast" in c.lower()), None)
-
-if not col_actual or not col_forecast:
-    raise ValueError(f"Couldn’t find expected 'actual' and 'day-ahead' columns. Columns found: {df_all.columns.tolist()}")
-
-# --- Plot full period ---
-fig, ax = plt.subplots(figsize=(14, 6))
-ax.plot(df_all["datetime"], df_all[col_actual],
-        color=palette["primary"], label="Actual Load")
-ax.plot(df_all["datetime"], df_all[col_forecast],
-        color=palette["blue"], label="Day-Ahead Forecast", alpha=0.8, linewidth=1.6)
-
-ax.set_title("Electric Load – Actual vs Day-Ahead Forecast (2022-2024)")
-ax.set_xlabel("Date")
-ax.set_ylabel("Load [MW]")
-ax.grid(True)
-ax.legend(frameon=False)
-
-plt.tight_layout()
-fig.savefig(plots_dir / "TotalLoad_Actual_vs_DayAhead_2022_2024.png", dpi=300)
-
-# --- Optional: Zoom on a single period for clarity ---
-start, end = "2023-01-01", "2023-12-01"
-mask = (df_all["datetime"] >= start) & (df_all["datetime"] < end)
-df_zoom = df_all.loc[mask]
-
-fig, ax = plt.subplots(figsize=(14, 6))
-ax.plot(df_zoom["datetime"], df_zoom[col_actual],
-        color=palette["primary"], label="Actual Load")
-ax.plot(df_zoom["datetime"], df_zoom[col_forecast],
-        color=palette["blue"], label="Day-Ahead Forecast", alpha=0.8)
-
-ax.set_title(f"Zoomed View: {start} to {end}")
-ax.set_xlabel("Date")
-ax.set_ylabel("Load [MW]")
-ax.legend(frameon=False)
-ax.grid(True)
-
-plt.tight_layout()
-fig.savefig(plots_dir / f"TotalLoad_Zoom_{start}_to_{end}.png", dpi=300)
-plt.show()
+    plot_combined()
+    report("preprocess")
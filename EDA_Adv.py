@@ -2,29 +2,28 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-plt.style.use("ggplot")
-
-# 1. Load datasets
-df_load = pd.read_csv("TotalLoad_DayAhead_Hourly.csv", parse_dates=["datetime"])
-df_gen = pd.read_csv("TotalGen_Hourly.csv", parse_dates=["Hourly_Time_Start"])
-df_types = pd.read_csv("generation_hourly_all_types.csv", parse_dates=["Time_Interval"])
+from correlation import CorrelationEngine, lagged_corr
+from forecast_error import hour_of_day_metrics, rolling_metrics
+from master import LOAD_COLUMNS, TOTAL_GEN, master_groups, read_master
+from profiling import profiled, report, stage
+from rollups import rollup, update_cube
 
-# 2. Rename + clean
-df_gen.rename(columns={"Hourly_Time_Start": "datetime"}, inplace=True)
-df_types.rename(columns={"Time_Interval": "datetime"}, inplace=True)
+plt.style.use("ggplot")
+savefig = profiled(plt.savefig, "savefig")
 
-# Drop useless string columns
-for df in [df_load, df_gen, df_types]:
-    df.drop(columns=["Country_Area", "Area"], errors="ignore", inplace=True)
+# 1. Load only the needed columns of the aligned master table (numeric, one time index)
+with stage("load_inputs"):
+    df_load = read_master(LOAD_COLUMNS, local=True)
+    df_gen = read_master([TOTAL_GEN], local=True)
+    df_types = read_master(master_groups()["types"], local=True)
 
-# 3. Set index and resample
-df_load.set_index("datetime", inplace=True)
-df_gen.set_index("datetime", inplace=True)
-df_types.set_index("datetime", inplace=True)
+# 2. Fold new hours into the rollup cube (daily / monthly / hour-of-day stats)
+with stage("update_cube", rows_in=len(df_load) + len(df_gen) + len(df_types)):
+    cube = update_cube([df_load, df_gen, df_types])
 
-daily_load = df_load.resample('D').mean(numeric_only=True)/1000
-daily_gen = df_gen.resample('D').mean(numeric_only=True)/1000
-daily_types = df_types.resample('D').mean(numeric_only=True)/1000
+daily_load = rollup(cube, "day", columns=list(df_load.columns))/1000
+daily_gen = rollup(cube, "day", columns=list(df_gen.columns))/1000
+daily_types = rollup(cube, "day", columns=list(df_types.columns))/1000
 
 
 
@@ -33,13 +32,13 @@ daily_types = df_types.resample('D').mean(numeric_only=True)/1000
 plt.figure(figsize=(14, 5))
 plt.plot(daily_load.index, daily_load["Actual Total Load (MW)"], label="Actual Load")
 plt.plot(daily_load.index, daily_load["Day-ahead Total Load Forecast (MW)"], label="Forecast Load", linestyle='--')
-plt.plot(daily_gen.index, daily_gen["Average_Hourly_Generation"], label="Total Generation", alpha=0.7)
+plt.plot(daily_gen.index, daily_gen[TOTAL_GEN], label="Total Generation", alpha=0.7)
 plt.title("Daily Load vs Forecast vs Total Generation")
 plt.xlabel("Date")
 plt.ylabel("Power (GW)")
 plt.legend()
 plt.tight_layout()
-plt.savefig("plots/daily_load_vs_gen.png", dpi=300, bbox_inches='tight')
+savefig("plots/daily_load_vs_gen.png", dpi=300, bbox_inches='tight')
 plt.show()
 
 
@@ -51,18 +50,18 @@ plt.title("Daily Generation by Type (Stacked Area)")
 plt.xlabel("Date")
 plt.ylabel("Power (GW)")
 plt.tight_layout()
-plt.savefig("plots/gen_type.png", dpi=300, bbox_inches='tight')
+savefig("plots/gen_type.png", dpi=300, bbox_inches='tight')
 plt.show()
 
 
 #Monthly average
-monthly_load = df_load.resample('M').mean()/1000
-monthly_gen = df_gen.resample('M').mean()/1000
+monthly_load = rollup(cube, "month", columns=list(df_load.columns))/1000
+monthly_gen = rollup(cube, "month", columns=list(df_gen.columns))/1000
 
 monthly = pd.DataFrame({
     "Actual Load": monthly_load["Actual Total Load (MW)"],
     "Forecast Load": monthly_load["Day-ahead Total Load Forecast (MW)"],
-    "Total Generation": monthly_gen["Average_Hourly_Generation"]
+    "Total Generation": monthly_gen[TOTAL_GEN]
 })
 
 monthly.plot(kind='bar', figsize=(14, 6))
@@ -70,21 +69,18 @@ plt.title("Monthly Average: Load and Generation")
 plt.ylabel("Power (GW)")
 plt.xticks(rotation=45)
 plt.tight_layout()
-plt.savefig("plots/monthly_gen_load.png", dpi=300, bbox_inches='tight')
+savefig("plots/monthly_gen_load.png", dpi=300, bbox_inches='tight')
 plt.show()
 
 
 #Peak Hour Analysis
 
-df_load["hour"] = df_load.index.hour
-df_gen["hour"] = df_gen.index.hour
-
-load_by_hour = df_load.groupby("hour")[["Actual Total Load (MW)"]].mean()/1000
-gen_by_hour = df_gen.groupby("hour")[["Average_Hourly_Generation"]].mean()/1000
+load_by_hour = rollup(cube, "hour_of_day", columns=["Actual Total Load (MW)"])/1000
+gen_by_hour = rollup(cube, "hour_of_day", columns=[TOTAL_GEN])/1000
 
 plt.figure(figsize=(10, 5))
 plt.plot(load_by_hour.index, load_by_hour["Actual Total Load (MW)"], label="Load by Hour")
-plt.plot(gen_by_hour.index, gen_by_hour["Average_Hourly_Generation"], label="Generation by Hour", linestyle="--")
+plt.plot(gen_by_hour.index, gen_by_hour[TOTAL_GEN], label="Generation by Hour", linestyle="--")
 plt.title("Average Load and Generation by Hour of Day")
 plt.xlabel("Hour")
 plt.ylabel("Power (GW)")
@@ -92,17 +88,66 @@ plt.xticks(range(0, 24))
 plt.legend()
 plt.grid(True)
 plt.tight_layout()
-plt.savefig("plots/Peak_analysis.png", dpi=300, bbox_inches='tight')
+savefig("plots/Peak_analysis.png", dpi=300, bbox_inches='tight')
+plt.show()
+
+
+#Day-ahead forecast error (rolling windows + by hour of day)
+
+actual, forecast = df_load[LOAD_COLUMNS[0]], df_load[LOAD_COLUMNS[1]]
+with stage("forecast_error", len(df_load)):
+    err = rolling_metrics(actual, forecast, windows=("7D", "30D"))
+    err_by_hour = hour_of_day_metrics(actual, forecast)
+
+fig, axes = plt.subplots(1, 2, figsize=(15, 5))
+axes[0].plot(err.index, err["mape_7D"], label="MAPE 7d", alpha=0.6)
+axes[0].plot(err.index, err["mape_30D"], label="MAPE 30d")
+axes[0].set_title("Rolling Day-ahead Forecast Error")
+axes[0].set_ylabel("MAPE (%)")
+axes[0].legend()
+axes[0].grid(True)
+axes[1].bar(err_by_hour.index, err_by_hour["mae"], label="MAE")
+axes[1].plot(err_by_hour.index, err_by_hour["bias"], color="red", marker="o", label="Bias (forecast - actual)")
+axes[1].set_title("Forecast Error by Hour of Day")
+axes[1].set_xlabel("Hour")
+axes[1].set_ylabel("MW")
+axes[1].set_xticks(range(0, 24))
+axes[1].legend()
+axes[1].grid(True)
+plt.tight_layout()
+savefig("plots/forecast_error.png", dpi=300, bbox_inches='tight')
 plt.show()
 
 
 #Correlation heatmap
 #When one variable changes, how likely is the other to change with it, and in which direction
 
+hourly = read_master(list(df_types.columns) + LOAD_COLUMNS[:1])  # UTC: no DST duplicates
+with stage("correlation", len(hourly)):
+    corr = CorrelationEngine.from_frame(hourly).corr()  # hourly, pairwise-complete
+    lags = lagged_corr(hourly[df_types.columns], hourly[LOAD_COLUMNS[0]], max_lag=48)
+
 plt.figure(figsize=(12, 10))
-corr = daily_types.corr()
 sns.heatmap(corr, annot=True, cmap="coolwarm", fmt=".2f")
-plt.title("Correlation Heatmap: Generation Types")
+plt.title("Correlation Heatmap: Generation Types and Load (hourly)")
+plt.tight_layout()
+savefig("plots/correlation_matrix.png", dpi=300, bbox_inches='tight')
+plt.show()
+
+
+#Lagged correlation with load: at lag L, generation at t vs load at t + L hours
+
+plt.figure(figsize=(12, 6))
+for col in lags.columns:
+    plt.plot(lags.index, lags[col], label=col)
+plt.axvline(0, color="black", linewidth=0.8)
+plt.title("Lagged Correlation of Generation Types with Load")
+plt.xlabel("Lag (hours, positive = generation leads load)")
+plt.ylabel("Correlation")
+plt.legend(fontsize=8, ncol=2)
+plt.grid(True)
 plt.tight_layout()
-plt.savefig("plots/correlation_matrix.png", dpi=300, bbox_inches='tight')
+savefig("plots/lagged_correlation.png", dpi=300, bbox_inches='tight')
 plt.show()
+
+report("eda_adv")
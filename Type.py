@@ -13,61 +13,76 @@ output_dir = 'generation_by_type'
 # Col 3: Generation Value
 COLUMNS = ['Time_Interval', 'Country_Area', 'Production_Type', 'Generation_Value']
 
-# 确保输出目录存在
-if not os.path.exists(output_dir):
-    os.makedirs(output_dir)
-    print(f"已创建输出目录: {output_dir}")
-
-try:
-    # Step 1: 读取 CSV 文件
-    # 使用 header=None 读取，并指定列名，避免因文件开头不一致导致的错误。
-    # 假设第一行是标题，我们跳过它。
-    df = pd.read_csv(
-        input_file,
-        header=None,
-        names=COLUMNS,
-        skiprows=1  # 假设数据有标题行，跳过它
-    )
-
-    # 再次检查并确保 'Generation_Value' 列是数值类型 (可选但推荐，以防数据中仍有脏数据)
-    df['Generation_Value'] = pd.to_numeric(df['Generation_Value'], errors='coerce')
-
-    # Step 2: 获取所有不同的 Generation Type
-    production_types = df['Production_Type'].unique()
-
-    # 记录处理类型数量
-    count = 0
-
-    print(f"文件中发现 {len(production_types)} 种不同的发电类型，开始拆分...")
-
-    # Step 3 & 4: 遍历所有类型，并保存为新的 CSV 文件
-    for gen_type in production_types:
-        if pd.isna(gen_type):
-            # 跳过空值（NaN）类型
-            print("⚠️ 跳过空/缺失值的发电类型。")
-            continue
-
-        # 1. 清理类型名称，用于安全的文件名 (替换特殊字符为空格，然后用下划线连接)
-        # 例如 'Hydro Pumped Storage' -> 'Hydro_Pumped_Storage'
-        safe_type_name = str(gen_type).replace('(', '').replace(')', '').replace('/', '_').replace(' ', '_').strip()
-
-        # 2. 构造输出文件名
-        output_filename = os.path.join(output_dir, f"{safe_type_name}_GENERATION.csv")
-
-        # 3. 过滤数据
-        df_filtered = df[df['Production_Type'] == gen_type].copy()
-
-        # 4. 保存文件 (不包含索引)
-        df_filtered.to_csv(output_filename, index=False, encoding='utf-8')
-
-        count += 1
-        print(f"   - 已处理并保存: {gen_type} -> {output_filename}")
-
-    print("-" * 50)
-    print(f"✅ 批处理完成。总共生成了 {count} 个文件，保存在目录 '{output_dir}' 中。")
-    print("-" * 50)
-
-except FileNotFoundError:
-    print(f"错误：文件未找到。请确保文件名 '{input_file}' 正确且文件存在。")
-except Exception as e:
-    print(f"处理过程中发生未知错误: {e}")
\ No newline at end of file
+# 每次读取的行数：内存占用只与该值有关，与输入文件总大小无关
+CHUNK_SIZE = 500_000
+# 每个输出文件的写缓冲区大小
+WRITE_BUFFER = 1 << 20
+
+
+def safe_type_name(gen_type) -> str:
+    """清理类型名称，用于安全的文件名，例如 'Hydro Pumped Storage' -> 'Hydro_Pumped_Storage'"""
+    return str(gen_type).replace('(', '').replace(')', '').replace('/', '_').replace(' ', '_').strip()
+
+
+def split_by_type(input_file: str, output_dir: str, chunksize: int = CHUNK_SIZE) -> dict:
+    """
+    单次流式拆分：分块读取输入，每块用 groupby 按类型路由到已打开的缓冲文件句柄。
+    返回 {发电类型: 写入行数}。
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    handles = {}
+    rows_written = {}
+    skipped_na = 0
+
+    try:
+        # 使用 header=None 读取，并指定列名，避免因文件开头不一致导致的错误。
+        # 假设第一行是标题，我们跳过它。
+        reader = pd.read_csv(
+            input_file,
+            header=None,
+            names=COLUMNS,
+            skiprows=1,
+            dtype={'Time_Interval': str, 'Country_Area': str, 'Production_Type': str},
+            chunksize=chunksize,
+        )
+        for chunk in reader:
+            # 确保 'Generation_Value' 列是数值类型 (统一为 float，保证各块输出格式一致)
+            chunk['Generation_Value'] = pd.to_numeric(chunk['Generation_Value'], errors='coerce').astype('float64')
+            skipped_na += int(chunk['Production_Type'].isna().sum())
+
+            # 一次 groupby 完成本块的全部路由（dropna=True 跳过空/缺失值的发电类型）
+            for gen_type, group in chunk.groupby('Production_Type', sort=False):
+                fh = handles.get(gen_type)
+                if fh is None:
+                    output_filename = os.path.join(output_dir, f"{safe_type_name(gen_type)}_GENERATION.csv")
+                    fh = open(output_filename, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER)
+                    handles[gen_type] = fh
+                    rows_written[gen_type] = 0
+                    group.to_csv(fh, index=False, header=True)
+                    print(f"   - 新类型: {gen_type} -> {output_filename}")
+                else:
+                    group.to_csv(fh, index=False, header=False)
+                rows_written[gen_type] += len(group)
+    finally:
+        for fh in handles.values():
+            fh.close()
+
+    if skipped_na:
+        print(f"⚠️ 跳过 {skipped_na} 行空/缺失值的发电类型。")
+    return rows_written
+
+
+if __name__ == "__main__":
+    try:
+        counts = split_by_type(input_file, output_dir)
+
+        print("-" * 50)
+        print(f"✅ 批处理完成。总共生成了 {len(counts)} 个文件，保存在目录 '{output_dir}' 中。")
+        for gen_type, n in counts.items():
+            print(f"   - {gen_type}: {n} 行")
+        print("-" * 50)
+
+    except FileNotFoundError:
+        print(f"错误：文件未找到。请确保文件名 '{input_file}' 正确且文件存在。")
+    except Exception as e:
+        print(f"处理过程中发生未知错误: {e}")
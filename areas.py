@@ -0,0 +1,192 @@
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+# Multi-zone runs: split a raw ENTSO-E export by its Area / Country_Area column, process
+# every zone independently on a process pool and write one output folder per zone:
+#   by_area/<zone>/...
+# A zone that fails is reported and skipped; the other zones still finish.
+
+AREA_COLUMNS = ["Area", "Country_Area"]
+AREA_ROOT = Path("by_area")
+PARTITION_DIR = "_partitions"
+
+# Rows per read chunk while partitioning; memory depends only on this, not on the file size
+CHUNK_SIZE = 500_000
+WRITE_BUFFER = 1 << 20
+
+# Column names for generation exports without a header row (same layout as Type.py)
+GENERATION_COLUMNS = ["Time_Interval", "Country_Area", "Production_Type", "Generation_Value"]
+
+
+def area_slug(area) -> str:
+    """Filesystem-safe zone name, e.g. 'CTA|ES' -> 'CTA_ES', 'Spain (ES)' -> 'Spain_ES'."""
+    return re.sub(r"[^0-9A-Za-z]+", "_", str(area)).strip("_") or "unknown"
+
+
+def _has_header(path) -> bool:
+    with open(path, encoding="utf-8-sig") as fh:
+        first = fh.readline().lstrip('"')
+    return not first[:1].isdigit()
+
+
+def partition_by_area(input_file, output_dir, chunksize: int = CHUNK_SIZE) -> dict:
+    """
+    Single streaming pass that routes every row to <output_dir>/<zone>.csv, keeping the
+    raw text untouched. Returns {area: partition path}.
+    """
+    input_file, output_dir = Path(input_file), Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    header = _has_header(input_file)
+    reader = pd.read_csv(
+        input_file,
+        header=0 if header else None,
+        names=None if header else GENERATION_COLUMNS,
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunksize,
+    )
+
+    handles, paths = {}, {}
+    try:
+        for chunk in reader:
+            area_col = next((c for c in AREA_COLUMNS if c in chunk.columns), None)
+            if area_col is None:
+                raise ValueError(f"{input_file.name}: no area column, expected one of {AREA_COLUMNS}")
+            for area, group in chunk.groupby(area_col, sort=False):
+                fh = handles.get(area)
+                if fh is None:
+                    paths[area] = output_dir / f"{area_slug(area)}.csv"
+                    fh = handles[area] = open(paths[area], "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER)
+                    group.to_csv(fh, index=False, header=True)
+                else:
+                    group.to_csv(fh, index=False, header=False)
+    finally:
+        for fh in handles.values():
+            fh.close()
+    return paths
+
+
+def run_by_area(worker, tasks: dict, workers: int = None) -> tuple:
+    """
+    Call worker(*args) for every {area: args} on a process pool (workers=1 runs serially).
+    Returns ({area: result}, {area: error message}); one failing zone never stops the others.
+    """
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    results, failures = {}, {}
+
+    if workers == 1:
+        for area, args in tasks.items():
+            try:
+                results[area] = worker(*args)
+            except Exception as exc:
+                failures[area] = f"{type(exc).__name__}: {exc}"
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(worker, *args): area for area, args in tasks.items()}
+            for fut in as_completed(futures):
+                area = futures[fut]
+                try:
+                    results[area] = fut.result()
+                except Exception as exc:  # includes a crashed worker (BrokenProcessPool)
+                    failures[area] = f"{type(exc).__name__}: {exc}"
+
+    for area, err in failures.items():
+        print(f"⚠️ {area}: failed ({err}); other zones continue.")
+    return results, failures
+
+
+# ---------- Per-zone workers (top level so they can be pickled) ----------
+def load_area_worker(raw_path: Path, out_path: Path, area: str) -> Path:
+    """One zone of a raw load export (15-min or hourly) → hourly file with the Area column kept."""
+    from DataPreProcessing import read_load_file
+    from grid import to_grid
+
+    # 15-min averaging, duplicate collapsing and gap filling are the same grid pass
+    df, _ = to_grid(read_load_file(raw_path), "h", how="mean")
+    df = df.reset_index()
+    df["Area"] = area
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(out_path, index=False)
+    return out_path
+
+
+def generation_area_worker(raw_path: Path, out_dir: Path) -> dict:
+    """One zone of a generation-per-type export → TotalGen, per-type split and hourly wide table."""
+    from gen_by_type_hourly import hourly_all_types
+    from temp import aggregate_total_generation
+    from Type import split_by_type
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    total = out_dir / "TotalGen.csv"
+    aggregate_total_generation(str(raw_path), str(total))
+    split_by_type(str(raw_path), str(out_dir / "generation_by_type"))
+    # one process per zone already; no nested pool
+    hourly_all_types(str(out_dir / "generation_by_type"), workers=1).to_csv(out_dir / "generation_hourly_all_types.csv")
+    return {"total": total, "hourly_types": out_dir / "generation_hourly_all_types.csv"}
+
+
+# ---------- Pipelines ----------
+def _combine(paths: dict, out_path: Path, area_col: str) -> None:
+    """Concat per-zone outputs into one file, zone column included."""
+    frames = []
+    for area, path in sorted(paths.items()):
+        df = pd.read_csv(path)
+        if area_col not in df.columns:
+            df.insert(1, area_col, area)
+        frames.append(df)
+    pd.concat(frames, ignore_index=True).to_csv(out_path, index=False)
+    print(f"✅ Combined {len(frames)} zones → {out_path}")
+
+
+def load_by_area(in_path, out_root: Path = AREA_ROOT, workers: int = None, combined: Path = None) -> tuple:
+    """Hourly load per zone: by_area/<zone>/<input stem>_hourly.csv (+ optional combined file)."""
+    from quality import check_files
+
+    in_path = Path(in_path)
+    check_files([in_path])  # per-zone coverage of the raw export before it is split
+    parts = partition_by_area(in_path, out_root / PARTITION_DIR / in_path.stem)
+    tasks = {
+        area: (raw, out_root / area_slug(area) / f"{in_path.stem}_hourly.csv", area)
+        for area, raw in parts.items()
+    }
+    results, failures = run_by_area(load_area_worker, tasks, workers)
+    print(f"✅ Load: {len(results)}/{len(tasks)} zones done → {out_root}")
+    if combined and results:
+        _combine(results, Path(combined), "Area")
+    return results, failures
+
+
+def generation_by_area(in_path, out_root: Path = AREA_ROOT, workers: int = None, combined: Path = None) -> tuple:
+    """TotalGen, per-type files and hourly wide table per zone under by_area/<zone>/ (+ optional combined TotalGen)."""
+    from quality import check_files
+
+    in_path = Path(in_path)
+    check_files([in_path])  # per-zone coverage of the raw export before it is split
+    parts = partition_by_area(in_path, out_root / PARTITION_DIR / in_path.stem)
+    tasks = {area: (raw, out_root / area_slug(area)) for area, raw in parts.items()}
+    results, failures = run_by_area(generation_area_worker, tasks, workers)
+    print(f"✅ Generation: {len(results)}/{len(tasks)} zones done → {out_root}")
+    if combined and results:
+        _combine({a: r["total"] for a, r in results.items()}, Path(combined), "Country_Area")
+    return results, failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process every bidding zone of an ENTSO-E export in parallel.")
+    parser.add_argument("kind", choices=["load", "generation"])
+    parser.add_argument("input")
+    parser.add_argument("--out", type=Path, default=AREA_ROOT)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--combined", type=Path, help="also write all zones into this file")
+    args = parser.parse_args()
+
+    if args.kind == "load":
+        _, failed = load_by_area(args.input, args.out, args.workers, args.combined)
+    else:
+        _, failed = generation_by_area(args.input, args.out, args.workers, args.combined)
+    raise SystemExit(1 if failed else 0)
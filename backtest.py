@@ -0,0 +1,210 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from grid import to_grid
+
+# Rolling-origin backtest of simple load forecasting baselines against the ENTSO-E
+# day-ahead forecast. Every origin forecasts the next `horizon` hours from data strictly
+# before it. All origins are evaluated at once: target windows are rows gathered from a
+# strided view, the baselines are fancy-indexed gathers, and the per-origin ridge fits
+# come from prefix sums of xxᵀ solved as one batched linear system.
+COMBINED_LOAD = Path("Load Data") / "TotalLoadDayAhead_Hour_2022_2024_combined.csv"
+ACTUAL = "Actual Total Load (MW)"
+DAY_AHEAD = "Day-ahead Total Load Forecast (MW)"
+ENTSOE = "ENTSO-E day-ahead"
+
+HORIZON = 24
+WEEK = 168
+MODELS = ("naive_daily", "naive_weekly", "hour_of_week", "ridge")
+
+# Hours of origins per chunk (one pool task): bounds memory of the per-row xxᵀ products and
+# the (origins, features, features) ridge systems, while keeping the shared fit window small
+# relative to the chunk
+CHUNK_HOURS = 4096
+
+
+def load_series(path: Path = COMBINED_LOAD) -> pd.DataFrame:
+    """Actual and day-ahead load on a gap-free hourly grid (missing hours NaN, DST duplicates averaged)."""
+    df = pd.read_csv(path, parse_dates=["datetime"], index_col="datetime")[[ACTUAL, DAY_AHEAD]]
+    grid, _ = to_grid(df, "h", how="mean")
+    return grid
+
+
+def _calendar(index: pd.DatetimeIndex) -> tuple:
+    """(hour of day, day of week) per grid row as int arrays."""
+    return index.hour.to_numpy(np.int64), index.dayofweek.to_numpy(np.int64)
+
+
+# ---------- Baselines (all origins at once) ----------
+def seasonal_naive(y: np.ndarray, origins: np.ndarray, season: int, horizon: int = HORIZON) -> np.ndarray:
+    """ŷ[o, h] = y[o + h - season·k] with the smallest k that lies before the origin."""
+    h = np.arange(horizon)
+    back = season * (h // season + 1)
+    return y[origins[:, None] + h - back]
+
+
+def hour_of_week(y: np.ndarray, origins: np.ndarray, weeks: int = 4, horizon: int = HORIZON) -> np.ndarray:
+    """Mean of the same hour of week over the last `weeks` weeks (NaNs skipped)."""
+    h = np.arange(horizon)
+    lags = WEEK * np.arange(1, weeks + 1) + WEEK * (h[:, None] // WEEK)  # (horizon, weeks)
+    with np.errstate(invalid="ignore"):
+        samples = y[origins[:, None, None] + h[:, None] - lags]
+        n = (~np.isnan(samples)).sum(axis=2)
+        return np.where(n > 0, np.nansum(samples, axis=2) / np.maximum(n, 1), np.nan)
+
+
+def ridge_features(y: np.ndarray, hour: np.ndarray, dow: np.ndarray, scale: float) -> np.ndarray:
+    """(T, 33) design: hour-of-day and day-of-week one-hots, y[t-24], y[t-168] (scaled); NaN if a lag is missing."""
+    T = len(y)
+    x = np.zeros((T, 24 + 7 + 2))
+    x[np.arange(T), hour] = 1.0
+    x[np.arange(T), 24 + dow] = 1.0
+    lag = np.full((T, 2), np.nan)
+    lag[24:, 0] = y[:-24]
+    lag[WEEK:, 1] = y[:-WEEK]
+    x[:, 31:] = lag / scale
+    return x
+
+
+# (feature column, lag in hours) of the lagged-load columns of ridge_features()
+RIDGE_LAGS = ((31, 24), (32, WEEK))
+
+
+def ridge(y: np.ndarray, x: np.ndarray, origins: np.ndarray, window: int = 8 * WEEK, alpha: float = 1.0,
+          horizon: int = HORIZON, lags: tuple = RIDGE_LAGS) -> np.ndarray:
+    """
+    Ridge regression refitted at every origin on the `window` hours before it. Normal
+    equations come from cumulative sums of xxᵀ and xy taken only at the needed positions
+    (origin and origin - window), then one batched np.linalg.solve for all origins.
+    Forecast step h of a lag column (col, lag) reads the actual y only while h < lag; from
+    h ≥ lag on it takes the model's own forecast, so horizons beyond 24 h never see actuals
+    at or after the origin. Steps are predicted in blocks of the shortest lag.
+    """
+    ok = ~np.isnan(y) & ~np.isnan(x).any(axis=1)
+    r0, r1 = int(origins.min()) - window, int(origins.max())  # rows any fit of this chunk uses
+    xm = np.where(ok[r0:r1, None], x[r0:r1], 0.0)
+    ym = np.where(ok[r0:r1], y[r0:r1], 0.0)
+
+    # cumulative sums over rows [r0, r0 + pos) at every needed position
+    pos = np.unique(np.concatenate([origins - window, origins])) - r0
+    starts = np.r_[0, pos[:-1]]
+    xx = np.add.reduceat(xm[:, :, None] * xm[:, None, :], starts, axis=0)
+    xy = np.add.reduceat(xm * ym[:, None], starts, axis=0)
+    empty = np.r_[pos[0], np.diff(pos)] == 0  # reduceat returns a row, not 0, for empty segments
+    xx[empty], xy[empty] = 0.0, 0.0
+    cxx, cxy = np.cumsum(xx, axis=0), np.cumsum(xy, axis=0)
+    hi, lo = np.searchsorted(pos, origins - r0), np.searchsorted(pos, origins - window - r0)
+
+    p = x.shape[1]
+    A = cxx[hi] - cxx[lo] + alpha * np.eye(p)
+    b = cxy[hi] - cxy[lo]
+    beta = np.linalg.solve(A, b[:, :, None])[:, :, 0]  # (origins, p)
+
+    future = x[origins[:, None] + np.arange(horizon)]  # (origins, horizon, p), a gathered copy
+    pred = np.empty((len(origins), horizon))
+    block = min((lag for _, lag in lags), default=horizon)
+    for h0 in range(0, horizon, block):
+        h1 = min(h0 + block, horizon)
+        for col, lag in lags:
+            hs = np.arange(max(h0, lag), h1)
+            future[:, hs, col] = pred[:, hs - lag]  # recursive: earlier forecast steps
+        pred[:, h0:h1] = np.einsum("ohp,op->oh", future[:, h0:h1], beta)
+    return pred
+
+
+def _forecast_chunk(y: np.ndarray, hour: np.ndarray, dow: np.ndarray, origins: np.ndarray,
+                    models: tuple, horizon: int, scale: float) -> dict:
+    out = {}
+    if "naive_daily" in models:
+        out["naive_daily"] = seasonal_naive(y, origins, 24, horizon)
+    if "naive_weekly" in models:
+        out["naive_weekly"] = seasonal_naive(y, origins, WEEK, horizon)
+    if "hour_of_week" in models:
+        out["hour_of_week"] = hour_of_week(y, origins, horizon=horizon)
+    if "ridge" in models:
+        x = ridge_features(y, hour, dow, scale)
+        out["ridge"] = ridge(y / scale, x, origins, horizon=horizon) * scale
+    return out
+
+
+# ---------- Engine ----------
+def make_origins(n: int, horizon: int = HORIZON, step: int = 24, warmup: int = 9 * WEEK, hour: np.ndarray = None) -> np.ndarray:
+    """Origin rows every `step` hours after `warmup` hours of history (at midnight when step is 24)."""
+    first = warmup
+    if hour is not None and step % 24 == 0:
+        first += (-hour[first]) % 24
+    return np.arange(first, n - horizon + 1, step)
+
+
+def _scores(actual: np.ndarray, preds: dict) -> pd.DataFrame:
+    """MAE, RMSE, MAPE, bias over the cells where the actual and every forecast exist."""
+    mask = ~np.isnan(actual)
+    for p in preds.values():
+        mask &= ~np.isnan(p)
+    a = actual[mask]
+    rows = {}
+    for name, p in preds.items():
+        e = p[mask] - a
+        rows[name] = {
+            "MAE": np.abs(e).mean(),
+            "RMSE": np.sqrt((e ** 2).mean()),
+            "MAPE (%)": 100 * np.mean(np.abs(e) / np.abs(a)),
+            "bias": e.mean(),
+            "n": int(mask.sum()),
+        }
+    return pd.DataFrame(rows).T.sort_values("MAE")
+
+
+def backtest(frame: pd.DataFrame, models: tuple = MODELS, horizon: int = HORIZON, step: int = 24,
+             workers: int = 1) -> tuple:
+    """
+    Rolling-origin backtest on an hourly grid with actual and day-ahead columns. Returns
+    (scores, forecasts): scores per model next to the ENTSO-E day-ahead forecast, and
+    {model: origins × horizon frame}. workers > 1 splits the origins across processes.
+    """
+    y = frame[ACTUAL].to_numpy(np.float64)
+    hour, dow = _calendar(pd.DatetimeIndex(frame.index))
+    origins = make_origins(len(y), horizon, step, hour=hour)
+    scale = float(np.nanmean(y[:origins[0]])) if len(origins) else 1.0  # warm-up only: no future data
+    per_chunk = max(CHUNK_HOURS // step, 1)
+    chunks = [origins[i:i + per_chunk] for i in range(0, len(origins), per_chunk)]
+
+    args = [(y, hour, dow, c, tuple(models), horizon, scale) for c in chunks]
+    if workers == 1 or len(chunks) == 1:
+        parts = [_forecast_chunk(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            parts = list(pool.map(_forecast_chunk, *zip(*args)))
+    preds = {m: np.concatenate([p[m] for p in parts]) for m in models}
+
+    target = sliding_window_view(y, horizon)[origins]  # (origins, horizon); fancy indexing copies only these rows
+    preds[ENTSOE] = sliding_window_view(frame[DAY_AHEAD].to_numpy(np.float64), horizon)[origins]
+    scores = _scores(target, preds)
+
+    cols = pd.RangeIndex(horizon, name="horizon")
+    index = pd.DatetimeIndex(frame.index[origins], name="origin")
+    forecasts = {m: pd.DataFrame(p, index=index, columns=cols) for m, p in preds.items()}
+    forecasts["actual"] = pd.DataFrame(target, index=index, columns=cols)
+    return scores, forecasts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rolling-origin backtest of load baselines vs the ENTSO-E day-ahead forecast.")
+    parser.add_argument("--input", type=Path, default=COMBINED_LOAD)
+    parser.add_argument("--step", type=int, default=24, help="hours between forecast origins")
+    parser.add_argument("--horizon", type=int, default=HORIZON)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--out", type=Path, help="write the score table as CSV")
+    args = parser.parse_args()
+
+    scores, _ = backtest(load_series(args.input), horizon=args.horizon, step=args.step,
+                         workers=args.workers)
+    print(scores.round(2).to_string())
+    if args.out:
+        scores.to_csv(args.out)
+        print(f"✅ Backtest scores saved: {args.out}")
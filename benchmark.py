@@ -0,0 +1,190 @@
+import argparse
+import io
+import json
+import platform
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import frame_cache
+import synthetic_data
+
+# Stage-by-stage scaling benchmark on synthetic ENTSO-E data. Throughput is input rows/s.
+#   python benchmark.py --years 1
+#   python benchmark.py --years 20 --areas 30 --stages mtu_parse total_gen
+# Each run is written to benchmark_results/<timestamp>.json for regression tracking.
+
+RESULTS_DIR = Path("benchmark_results")
+
+
+def _stage_mtu_parse(ctx):
+    from mtu import parse_mtu_start
+    s = pd.read_csv(ctx["load_15min"], usecols=["MTU (CET/CEST)"])["MTU (CET/CEST)"]
+    t0 = time.perf_counter()
+    parse_mtu_start(s)
+    return len(s), time.perf_counter() - t0
+
+
+def _stage_mtu_parse_legacy(ctx):
+    from mtu import _legacy_parse
+    s = pd.read_csv(ctx["load_15min"], usecols=["MTU (CET/CEST)"])["MTU (CET/CEST)"]
+    t0 = time.perf_counter()
+    _legacy_parse(s)
+    return len(s), time.perf_counter() - t0
+
+
+def _stage_resample_15min_to_hour(ctx):
+    from DataPreProcessing import process_15min_to_hour
+    frame_cache.invalidate()  # measure a cold parse, not a cache hit
+    t0 = time.perf_counter()
+    process_15min_to_hour(ctx["load_15min"], ctx["tmp"] / "hourly_out.csv")
+    return ctx["load_rows"], time.perf_counter() - t0
+
+
+def _stage_clean_hourly(ctx):
+    from DataPreProcessing import clean_hourly_file
+    frame_cache.invalidate()
+    t0 = time.perf_counter()
+    clean_hourly_file(ctx["load_hourly"])
+    return ctx["load_hourly_rows"], time.perf_counter() - t0
+
+
+def _stage_split_types(ctx):
+    from Type import split_by_type
+    out = ctx["tmp"] / "split_bench"
+    shutil.rmtree(out, ignore_errors=True)
+    t0 = time.perf_counter()
+    counts = split_by_type(str(ctx["generation"]), str(out))
+    return sum(counts.values()), time.perf_counter() - t0
+
+
+def _stage_total_gen(ctx):
+    from temp import aggregate_total_generation
+    t0 = time.perf_counter()
+    aggregate_total_generation(str(ctx["generation"]), str(ctx["tmp"] / "total_gen.csv"))
+    return ctx["generation_rows"], time.perf_counter() - t0
+
+
+def _stage_wide_merge(ctx):
+    from gen_by_type_hourly import hourly_all_types
+    t0 = time.perf_counter()
+    hourly_all_types(str(ctx["split_dir"]))
+    return ctx["generation_rows"], time.perf_counter() - t0
+
+
+def _stage_plot_render(ctx):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from downsample import plot_downsampled
+    from schemas import read_typed
+
+    df = read_typed(ctx["load_15min"], cache=False).select_dtypes("number")
+    df = df[~df.index.duplicated()]
+    t0 = time.perf_counter()
+    fig, ax = plt.subplots(figsize=(14, 6))
+    for col in df.columns:
+        plot_downsampled(ax, df.index, df[col], dpi=300, linewidth=1)
+    buf = io.BytesIO()
+    fig.savefig(buf, dpi=300)
+    plt.close(fig)
+    return len(df) * df.shape[1], time.perf_counter() - t0
+
+
+STAGES = {
+    "mtu_parse": _stage_mtu_parse,
+    "mtu_parse_legacy": _stage_mtu_parse_legacy,
+    "resample_15min_to_hour": _stage_resample_15min_to_hour,
+    "clean_hourly": _stage_clean_hourly,
+    "split_types": _stage_split_types,
+    "total_gen": _stage_total_gen,
+    "wide_merge": _stage_wide_merge,
+    "plot_render": _stage_plot_render,
+}
+
+
+def prepare(tmp: Path, years: int, areas: int, types: int, seed: int) -> dict:
+    """Generate the synthetic inputs every stage needs (not timed)."""
+    type_names = list(synthetic_data.PRODUCTION_TYPES)[:types]
+    ctx = {"tmp": tmp}
+    ctx["load_15min"] = tmp / "load_15min.csv"
+    ctx["load_hourly"] = tmp / "load_hourly.csv"
+    ctx["generation"] = tmp / "generation.csv"
+    ctx["load_rows"] = synthetic_data.write_load_csv(ctx["load_15min"], years=years, areas=areas, seed=seed)
+    ctx["load_hourly_rows"] = synthetic_data.write_load_csv(ctx["load_hourly"], years=years, freq="h", seed=seed)
+    ctx["generation_rows"] = synthetic_data.write_generation_csv(
+        ctx["generation"], years=years, areas=areas, types=type_names, seed=seed
+    )
+
+    from Type import split_by_type
+    ctx["split_dir"] = tmp / "split"
+    split_by_type(str(ctx["generation"]), str(ctx["split_dir"]))
+    return ctx
+
+
+def run(years: int = 1, areas: int = 1, types: int = 20, repeat: int = 3, stages: list = None,
+        seed: int = 0, out: Path = None) -> dict:
+    """Run the selected stages `repeat` times each and write a JSON report."""
+    stages = stages or list(STAGES)
+    tmp = Path(tempfile.mkdtemp(prefix="entsoe_bench_"))
+    old_cache_dir = frame_cache.CACHE_DIR
+    frame_cache.CACHE_DIR = tmp / "cache"
+    try:
+        t0 = time.perf_counter()
+        ctx = prepare(tmp, years, areas, types, seed)
+        print(f"Generated {ctx['load_rows']:,} load rows and {ctx['generation_rows']:,} generation rows "
+              f"in {time.perf_counter() - t0:.1f} s")
+
+        results = []
+        for name in stages:
+            times, rows = [], 0
+            for _ in range(repeat):
+                rows, elapsed = STAGES[name](ctx)
+                times.append(elapsed)
+            best = min(times)
+            results.append({
+                "stage": name, "rows": int(rows), "best_s": best, "median_s": float(np.median(times)),
+                "runs_s": times, "rows_per_s": rows / best if best else None,
+            })
+    finally:
+        frame_cache.CACHE_DIR = old_cache_dir
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "config": {"years": years, "areas": areas, "types": types, "repeat": repeat, "seed": seed},
+        "environment": {
+            "python": platform.python_version(), "platform": platform.platform(),
+            "pandas": pd.__version__, "numpy": np.__version__,
+        },
+        "results": results,
+    }
+
+    out = out or RESULTS_DIR / f"bench_{datetime.now():%Y%m%d_%H%M%S}_{years}y_{areas}z.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=1)
+
+    print(f"\n{'stage':24s} {'rows':>12s} {'best s':>9s} {'median s':>9s} {'rows/s':>14s}")
+    for r in results:
+        print(f"{r['stage']:24s} {r['rows']:12,d} {r['best_s']:9.3f} {r['median_s']:9.3f} {r['rows_per_s'] or 0:14,.0f}")
+    print(f"\n✅ Results saved: {out}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark each pipeline stage on synthetic ENTSO-E data.")
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--areas", type=int, default=1)
+    parser.add_argument("--types", type=int, default=len(synthetic_data.PRODUCTION_TYPES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES))
+    parser.add_argument("--out", type=Path)
+    args = parser.parse_args()
+    run(args.years, args.areas, args.types, args.repeat, args.stages, args.seed, args.out)
@@ -0,0 +1,217 @@
+import argparse
+import os
+import runpy
+import sys
+from pathlib import Path
+
+# Single entry point for the processing scripts:
+#   python cli.py preprocess-load [--source IN OUT {hour,15min}]... [--combined PATH] [--plot]
+#   python cli.py split-types INPUT [--out-dir DIR]
+#   python cli.py total-gen INPUT [--out PATH]
+#   python cli.py hourly-types [--in-dir DIR] [--out PATH] [--workers N]
+#   python cli.py eda {ini,adv} [--headless]
+#   python cli.py report [--out DIR] [--workers N] [--force] [--dpi N]
+#   python cli.py dataset [--root DIR] [--area NAME] [--by-area DIR]
+#   python cli.py backtest [--input CSV] [--step H] [--horizon H] [--workers N] [--out CSV]
+#   python cli.py quantiles FILE... [--area NAME] [--workers N] [--out NPZ]
+#   python cli.py quality [FILE...] [--area NAME] [--out DIR] [--period {year,file}|START END]
+# Every command imports its module only when it runs, and matplotlib/seaborn are only
+# imported by plotting commands, so scheduled data-only runs start quickly.
+
+HERE = Path(__file__).resolve().parent
+EDA_SCRIPTS = {"ini": "EDA_Ini.py", "adv": "EDA_Adv.py"}
+
+
+def _check_inputs(paths: list) -> None:
+    """Quality reports (quality/, coverage.csv) of the raw inputs an ingest command is about to read."""
+    from quality import check_files
+
+    if paths:
+        check_files([Path(p) for p in paths])
+
+
+def cmd_preprocess_load(args) -> int:
+    import DataPreProcessing as dp
+    from profiling import report
+
+    bad = [res for _, _, res in args.source or [] if res not in ("hour", "15min")]
+    if bad:
+        print(f"⚠️ --source resolution must be 'hour' or '15min', got {bad}")
+        return 2
+    sources = [(Path(i), Path(o), res) for i, o, res in args.source] if args.source else dp.SOURCES
+    combined = args.combined or dp.out_combined
+    dp.main(force=args.force, sources=sources, combined=combined)
+    if args.plot:
+        dp.plot_combined(combined, args.plots_dir)
+    report("preprocess")
+    return 0
+
+
+def cmd_split_types(args) -> int:
+    from Type import split_by_type, output_dir
+
+    _check_inputs([args.input])
+    counts = split_by_type(args.input, args.out_dir or output_dir)
+    print(f"✅ {len(counts)} generation types → {args.out_dir or output_dir}")
+    return 0
+
+
+def cmd_total_gen(args) -> int:
+    from temp import aggregate_total_generation, output_file
+
+    _check_inputs([args.input])
+    aggregate_total_generation(args.input, args.out or output_file)
+    print(f"✅ Total generation saved: {args.out or output_file}")
+    return 0
+
+
+def cmd_hourly_types(args) -> int:
+    from gen_by_type_hourly import hourly_all_types, input_folder, output_path
+
+    in_dir = args.in_dir or input_folder
+    _check_inputs(sorted(Path(in_dir).glob("*.csv")))
+    out = args.out or output_path
+    hourly_all_types(in_dir, workers=args.workers).to_csv(out)
+    print(f"✅ Hourly generation by type saved: {out}")
+    return 0
+
+
+def cmd_eda(args) -> int:
+    if args.headless:
+        os.environ["MPLBACKEND"] = "Agg"  # picked up when matplotlib is first imported
+    sys.path.insert(0, str(HERE))
+    runpy.run_path(str(HERE / EDA_SCRIPTS[args.which]), run_name="__main__")
+    return 0
+
+
+def cmd_report(args) -> int:
+    from profiling import report
+    from render_report import render_report
+
+    render_report(out_dir=args.out, workers=args.workers, force=args.force, dpi=args.dpi)
+    report("render_report")
+    return 0
+
+
+def cmd_dataset(args) -> int:
+    from dataset import build_dataset
+
+    for table, n in build_dataset(args.root, args.area, args.by_area).items():
+        print(f"✅ {table}: {n} partitions written → {args.root / table}")
+    return 0
+
+
+def cmd_backtest(args) -> int:
+    from backtest import COMBINED_LOAD, backtest, load_series
+
+    scores, _ = backtest(load_series(args.input or COMBINED_LOAD), horizon=args.horizon, step=args.step,
+                         workers=args.workers)
+    print(scores.round(2).to_string())
+    if args.out:
+        scores.to_csv(args.out)
+        print(f"✅ Backtest scores saved: {args.out}")
+    return 0
+
+
+def cmd_quantiles(args) -> int:
+    from quantiles import sketch_files
+
+    sk = sketch_files(args.files, args.area, args.workers)
+    path = sk.save(args.out)
+    print(f"✅ {len(sk.keys)} sketches ({sk.memory() / 1e6:.1f} MB) → {path}")
+    for series in dict.fromkeys(k[1] for k in sk.keys):
+        print(f"\n{series}\n{sk.bands(series).round(1).T.to_string()}")
+    return 0
+
+
+def cmd_quality(args) -> int:
+    from quality import COVERAGE_FILE, check_files
+
+    period = args.period[0] if len(args.period) == 1 else tuple(args.period)
+    if len(args.period) > 2 or (len(args.period) == 1 and period not in ("year", "file")):
+        print(f"⚠️ --period must be 'year', 'file' or START END, got {args.period}")
+        return 2
+    check_files(args.files, args.area, args.out, period)
+    print(f"✅ Coverage report → {args.out / COVERAGE_FILE}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="ENTSO-E load and generation processing.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("preprocess-load", help="raw load exports → hourly files + combined file")
+    p.add_argument("--source", nargs=3, action="append", metavar=("IN", "OUT", "RES"),
+                   help="raw input, hourly output and resolution (hour|15min); repeat in chronological order")
+    p.add_argument("--combined", type=Path, help="combined hourly output file")
+    p.add_argument("--force", action="store_true", help="re-run stages even if inputs are unchanged")
+    p.add_argument("--plot", action="store_true", help="also draw the actual vs day-ahead plots")
+    p.add_argument("--plots-dir", type=Path, default=Path("plots"))
+    p.set_defaults(func=cmd_preprocess_load)
+
+    p = sub.add_parser("split-types", help="generation-per-type export → one file per type")
+    p.add_argument("input")
+    p.add_argument("--out-dir")
+    p.set_defaults(func=cmd_split_types)
+
+    p = sub.add_parser("total-gen", help="generation-per-type export → total generation per interval")
+    p.add_argument("input")
+    p.add_argument("--out")
+    p.set_defaults(func=cmd_total_gen)
+
+    p = sub.add_parser("hourly-types", help="per-type files → hourly wide table")
+    p.add_argument("--in-dir")
+    p.add_argument("--out")
+    p.add_argument("--workers", type=int)
+    p.set_defaults(func=cmd_hourly_types)
+
+    p = sub.add_parser("eda", help="run an EDA report script")
+    p.add_argument("which", choices=sorted(EDA_SCRIPTS))
+    p.add_argument("--headless", action="store_true", help="non-interactive backend, figures only saved")
+    p.set_defaults(func=cmd_eda)
+
+    p = sub.add_parser("report", help="render all EDA figures headless, skipping unchanged ones")
+    p.add_argument("--out", type=Path, default=Path("plots/report"))
+    p.add_argument("--workers", type=int)
+    p.add_argument("--force", action="store_true", help="redraw every figure")
+    p.add_argument("--dpi", type=int, default=300)
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("dataset", help="write hourly outputs as a Parquet dataset partitioned by area/year/month")
+    p.add_argument("--root", type=Path, default=Path(".dataset"))
+    p.add_argument("--area", default="default", help="area name for the top-level files")
+    p.add_argument("--by-area", type=Path, help="also add every zone of an areas.py output folder")
+    p.set_defaults(func=cmd_dataset)
+
+    p = sub.add_parser("backtest", help="rolling-origin backtest of load baselines vs the ENTSO-E day-ahead forecast")
+    p.add_argument("--input", type=Path, help="combined hourly load file")
+    p.add_argument("--step", type=int, default=24, help="hours between forecast origins")
+    p.add_argument("--horizon", type=int, default=24)
+    p.add_argument("--workers", type=int, default=1)
+    p.add_argument("--out", type=Path, help="write the score table as CSV")
+    p.set_defaults(func=cmd_backtest)
+
+    p = sub.add_parser("quantiles", help="quantile sketches per area/series/hour/month → P5/P50/P95 by hour")
+    p.add_argument("files", nargs="+", type=Path, help="load/generation CSVs (15-min or hourly)")
+    p.add_argument("--area", default="default", help="area for files without an area column")
+    p.add_argument("--workers", type=int, default=1)
+    p.add_argument("--out", type=Path, default=Path(".quantile_sketches") / "sketches.npz")
+    p.set_defaults(func=cmd_quantiles)
+
+    p = sub.add_parser("quality", help="gap, duplicate and anomaly checks with per-file/per-series coverage reports")
+    p.add_argument("files", nargs="*", type=Path, help="defaults to the known raw load and generation inputs")
+    p.add_argument("--area", default="default", help="area for files without an area column")
+    p.add_argument("--out", type=Path, default=Path("quality"))
+    p.add_argument("--period", nargs="+", default=["year"], metavar="SPAN",
+                   help="'year' (default), 'file' or START END (local times) every series should cover")
+    p.set_defaults(func=cmd_quality)
+    return parser
+
+
+def main(argv: list = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
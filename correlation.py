@@ -0,0 +1,212 @@
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from grid import to_grid
+
+# Correlation engine: per block (default one day) it keeps the pairwise-complete running
+# sums n, Σx, Σx² and Σxy of every pair of series, with a running prefix sum over blocks.
+# The correlation matrix of any window is then a difference of two prefix entries plus
+# the partial blocks at the edges, and new data is appended without touching old blocks.
+# Values are shifted by a fixed per-series reference before summing (the shift-invariant
+# form of Welford's update), so the sums stay precise on multi-year MW data.
+CORR_DIR = Path(os.environ.get("CORR_STATE_DIR", ".corr_state"))
+
+# order of the 4 stacked k × k moment matrices
+_N, _SX, _SXX, _SXY = range(4)
+
+
+def _moments(values: np.ndarray) -> np.ndarray:
+    """
+    (..., 4, k, k) pairwise-complete moments of (..., rows, k) shifted values (NaN = missing):
+    n[i,j] rows where i and j are both present, Σx[i,j] / Σx²[i,j] of series i over those
+    rows, Σxy[i,j]. Four batched matrix products, no per-pair loop.
+    """
+    ok = ~np.isnan(values)
+    m = ok.astype(np.float64)
+    x = np.where(ok, values, 0.0)
+    xt = np.swapaxes(x, -1, -2)
+    return np.stack([
+        np.swapaxes(m, -1, -2) @ m,
+        xt @ m,
+        np.swapaxes(x * x, -1, -2) @ m,
+        xt @ x,
+    ], axis=-3)
+
+
+def _corr(mom: np.ndarray, cov: bool = False) -> np.ndarray:
+    """Pearson correlation (or sample covariance) matrix from summed moments."""
+    n, sx, sxx, sxy = mom
+    sy = sx.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        c = sxy - sx * sy / n
+        if cov:
+            return np.where(n > 1, c / (n - 1), np.nan)
+        vx = sxx - sx * sx / n
+        vy = sxx.T - sy * sy / n
+        r = c / np.sqrt(vx * vy)
+    r = np.where(n > 1, np.clip(r, -1.0, 1.0), np.nan)
+    np.fill_diagonal(r, np.where(np.diag(n) > 1, 1.0, np.nan))
+    return r
+
+
+class CorrelationEngine:
+    """
+    Correlation / covariance matrices of many series over any time window.
+
+        eng = CorrelationEngine.from_frame(hourly)   # datetime index, one column per series
+        eng.append(new_hours)                        # only the new rows are summed
+        eng.corr("2023-07-01", "2023-10-01")         # window from prefix sums
+    """
+
+    def __init__(self, columns: list, freq: str = "h", block: str = "D"):
+        self.columns = list(columns)
+        self.freq = pd.tseries.frequencies.to_offset(freq)
+        self.block = pd.tseries.frequencies.to_offset(block)
+        self.step = pd.Timedelta(self.freq.nanos, unit="ns")
+        self.per_block = self.block.nanos // self.freq.nanos
+        if self.per_block < 1 or self.block.nanos % self.freq.nanos:
+            raise ValueError(f"block {block!r} must be a whole multiple of freq {freq!r}")
+        k = len(self.columns)
+        self.shift = np.zeros(k)
+        self.start = None  # first grid timestamp (block aligned)
+        self.values = np.empty((0, k))  # shifted values on the regular grid
+        self.prefix = np.zeros((1, 4, k, k))  # prefix[b] = moments of blocks [0, b)
+        self._partial_tail = False  # last prefix entry ends in an incomplete block
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, freq: str = "h", block: str = "D") -> "CorrelationEngine":
+        eng = cls(frame.select_dtypes("number").columns, freq, block)
+        eng.append(frame)
+        return eng
+
+    # ---------- building ----------
+    def append(self, frame: pd.DataFrame) -> "CorrelationEngine":
+        """
+        Add rows after the current end (earlier rows are ignored). The frame is put on the
+        grid first, so 15-min or gappy input is fine; the last partial block is re-summed.
+        """
+        frame = frame[self.columns]
+        if self.start is None:
+            if frame.empty:
+                return self
+            first = pd.Timestamp(frame.index.min())
+            self.start = first.floor(self.block)
+            valid = frame.apply(lambda s: s.dropna().iloc[0] if s.notna().any() else 0.0)
+            self.shift = valid.to_numpy(np.float64)
+        end = self.end
+        frame = frame[frame.index >= end]
+        if frame.empty:
+            return self
+        grid, _ = to_grid(frame, self.freq, how="mean", origin=end)
+        self.values = np.vstack([self.values, grid.to_numpy(np.float64) - self.shift])
+
+        complete = len(self.prefix) - 1 - (1 if self._partial_tail else 0)
+        self.prefix = self.prefix[:complete + 1]
+        rows = self.values[complete * self.per_block:]
+        nblocks = -(-len(rows) // self.per_block)
+        pad = np.full((nblocks * self.per_block - len(rows), len(self.columns)), np.nan)
+        blocks = np.vstack([rows, pad]).reshape(nblocks, self.per_block, len(self.columns))
+        sums = np.cumsum(_moments(blocks), axis=0) + self.prefix[-1]
+        self.prefix = np.concatenate([self.prefix, sums])
+        self._partial_tail = len(self.values) % self.per_block != 0
+        return self
+
+    @property
+    def end(self) -> pd.Timestamp:
+        """First timestamp not yet covered."""
+        return self.start + len(self.values) * self.step
+
+    # ---------- queries ----------
+    def _row(self, t, default: int) -> int:
+        if t is None:
+            return default
+        return int(np.clip((pd.Timestamp(t) - self.start) // self.step, 0, len(self.values)))
+
+    def moments(self, start=None, end=None) -> np.ndarray:
+        """Summed (4, k, k) moments for rows in [start, end)."""
+        r0, r1 = self._row(start, 0), self._row(end, len(self.values))
+        if r1 <= r0:
+            return np.zeros_like(self.prefix[0])
+        b0, b1 = -(-r0 // self.per_block), r1 // self.per_block  # whole blocks inside the window
+        if b1 <= b0:
+            return _moments(self.values[r0:r1])
+        return (self.prefix[b1] - self.prefix[b0]
+                + _moments(self.values[r0:b0 * self.per_block])
+                + _moments(self.values[b1 * self.per_block:r1]))
+
+    def corr(self, start=None, end=None) -> pd.DataFrame:
+        """Pairwise-complete Pearson correlation for [start, end), like DataFrame.corr()."""
+        return pd.DataFrame(_corr(self.moments(start, end)), index=self.columns, columns=self.columns)
+
+    def cov(self, start=None, end=None) -> pd.DataFrame:
+        """Pairwise-complete sample covariance for [start, end), like DataFrame.cov()."""
+        return pd.DataFrame(_corr(self.moments(start, end), cov=True), index=self.columns, columns=self.columns)
+
+    def rolling_corr(self, a: str, b: str, window: str = "30D") -> pd.Series:
+        """Correlation of two series over a trailing window, one value per block."""
+        i, j = self.columns.index(a), self.columns.index(b)
+        w = max(int(pd.Timedelta(window).value // self.block.nanos), 1)
+        p = self.prefix[:, :, [i, i, j, j], [i, j, i, j]]  # (blocks + 1, 4 moments, 4 pairs)
+        hi = np.arange(1, len(p))
+        m = p[hi] - p[np.maximum(hi - w, 0)]
+        n, sx, sy, sxx, syy, sxy = m[:, 0, 1], m[:, 1, 1], m[:, 1, 2], m[:, 2, 1], m[:, 2, 2], m[:, 3, 1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            r = (sxy - sx * sy / n) / np.sqrt((sxx - sx * sx / n) * (syy - sy * sy / n))
+        index = pd.date_range(self.start, periods=len(hi), freq=self.block, name="datetime")
+        return pd.Series(np.where(n > 1, r, np.nan), index=index, name=f"{a} ~ {b}")
+
+    # ---------- persistence ----------
+    def save(self, state_dir: Path = CORR_DIR, name: str = "engine") -> Path:
+        state_dir = Path(state_dir)
+        state_dir.mkdir(parents=True, exist_ok=True)
+        path = state_dir / f"{name}.pkl"
+        with open(path, "wb") as fh:
+            pickle.dump(self, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+
+    @staticmethod
+    def load(state_dir: Path = CORR_DIR, name: str = "engine") -> "CorrelationEngine":
+        with open(Path(state_dir) / f"{name}.pkl", "rb") as fh:
+            return pickle.load(fh)
+
+
+# ---------- Lagged cross-correlation ----------
+def _xcorr(a: np.ndarray, b: np.ndarray, max_lag: int, nfft: int) -> np.ndarray:
+    """Σ_t a[t]·b[t+lag] for lag = -max_lag..max_lag, column-wise, via FFT."""
+    full = np.fft.irfft(np.conj(np.fft.rfft(a, nfft, axis=0)) * np.fft.rfft(b, nfft, axis=0), nfft, axis=0)
+    return np.concatenate([full[nfft - max_lag:], full[:max_lag + 1]])
+
+
+def lagged_corr(frame: pd.DataFrame, target: pd.Series, max_lag: int = 48) -> pd.DataFrame:
+    """
+    Correlation of every column x with the target y at each lag, corr(x[t], y[t + lag]),
+    for lag = -max_lag..max_lag steps (positive lag: x leads the target). Same values as
+    frame[c].corr(target.shift(-lag)) with missing values, but all lags and columns come
+    from six FFT cross-correlations instead of 2·max_lag shifts.
+    """
+    target = target.reindex(frame.index)
+    x = frame.select_dtypes("number").to_numpy(np.float64)
+    y = target.to_numpy(np.float64)[:, None]
+    x = x - np.nanmean(x, axis=0)  # centring keeps the FFT sums well conditioned
+    y = y - np.nanmean(y)
+    mx, my = ~np.isnan(x), ~np.isnan(y)
+    x0, y0 = np.where(mx, x, 0.0), np.where(my, y, 0.0)
+    mx, my = mx.astype(np.float64), my.astype(np.float64)
+
+    max_lag = min(max_lag, len(frame) - 1)
+    nfft = 1 << int(np.ceil(np.log2(len(frame) + max_lag + 1)))
+    n = _xcorr(mx, my, max_lag, nfft)
+    sx, sy = _xcorr(x0, my, max_lag, nfft), _xcorr(mx, y0, max_lag, nfft)
+    sxx, syy = _xcorr(x0 * x0, my, max_lag, nfft), _xcorr(mx, y0 * y0, max_lag, nfft)
+    sxy = _xcorr(x0, y0, max_lag, nfft)
+
+    n = np.rint(n)  # counts are integers; drop FFT round-off
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = (sxy - sx * sy / n) / np.sqrt((sxx - sx * sx / n) * (syy - sy * sy / n))
+    r = np.where(n > 1, np.clip(r, -1.0, 1.0), np.nan)
+    cols = frame.select_dtypes("number").columns
+    return pd.DataFrame(r, index=pd.RangeIndex(-max_lag, max_lag + 1, name="lag"), columns=cols)
@@ -0,0 +1,276 @@
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from areas import area_slug
+from DataPreProcessing import out_combined
+from rollups import DEFAULT_AREA
+
+try:
+    import duckdb
+except ImportError:  # sql() is optional; query()/aggregate() cover the same ground
+    duckdb = None
+
+# Hourly outputs as a Parquet dataset partitioned by area / year / month:
+#   .dataset/<table>/area=<zone>/year=2024/month=03/part.parquet
+# plus <table>/_stats.json with per-partition row counts, time range, value min/max/nulls
+# and the generation types present. Queries prune partitions from those stats before any
+# file is opened, then read only the projected columns with the remaining predicates
+# pushed down to Parquet row-group statistics.
+DATASET_ROOT = Path(os.environ.get("DATASET_DIR", ".dataset"))
+_STATS = "_stats.json"
+TIME_COL = "datetime"
+TYPE_COL = "type"
+VALUE_COL = "value"
+
+# Rows per Parquet row group; generation rows are sorted by type so a type filter skips groups
+ROW_GROUP = 8_760
+
+# table: (source file, long format?) for build_dataset(); long tables have type/value columns.
+# Load comes from the multi-year combined output of DataPreProcessing (2022 onwards).
+TABLES = {
+    "load": (out_combined, False),
+    "generation": ("generation_hourly_all_types.csv", True),
+}
+
+
+def _frame_hash(df: pd.DataFrame) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    h.update(repr(list(df.columns)).encode())
+    return h.hexdigest()
+
+
+def stats_path(table: str, root: Path = DATASET_ROOT) -> Path:
+    """The table's _stats.json; it changes whenever a partition of the table is rewritten."""
+    return Path(root) / table / _STATS
+
+
+def _read_stats(table_dir: Path) -> dict:
+    try:
+        with open(table_dir / _STATS, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _partition_stats(part: pd.DataFrame, values: list) -> dict:
+    t = part[TIME_COL]
+    stats = {
+        "rows": len(part),
+        "start": str(t.min()),
+        "end": str(t.max()),
+        "columns": {
+            c: {"min": float(part[c].min()), "max": float(part[c].max()), "nulls": int(part[c].isna().sum())}
+            for c in values
+        },
+    }
+    if TYPE_COL in part.columns:
+        stats["types"] = sorted(part[TYPE_COL].astype(str).unique().tolist())
+    return stats
+
+
+def to_long(wide: pd.DataFrame) -> pd.DataFrame:
+    """Time × type table → (datetime, type, value) rows, e.g. generation_hourly_all_types.csv."""
+    wide = wide.select_dtypes("number")
+    return pd.DataFrame({
+        TIME_COL: np.tile(wide.index.to_numpy(), wide.shape[1]),
+        TYPE_COL: pd.Categorical(np.repeat(wide.columns.astype(str), len(wide))),
+        VALUE_COL: wide.to_numpy(np.float32).ravel(order="F"),
+    })
+
+
+def write_table(frame: pd.DataFrame, table: str, area: str = DEFAULT_AREA, root: Path = DATASET_ROOT) -> int:
+    """
+    Write one area of a table. `frame` has a naive local datetime index (or column) and
+    numeric columns, plus type/value for long tables. Only partitions whose content
+    changed are rewritten. Returns the number of partitions written.
+    """
+    table_dir = Path(root) / table
+    df = frame.reset_index() if TIME_COL not in frame.columns else frame.copy()
+    df = df.rename(columns={df.columns[0]: TIME_COL}) if TIME_COL not in df.columns else df
+    df[TIME_COL] = pd.to_datetime(df[TIME_COL]).astype("datetime64[us]")
+    df = df.dropna(subset=[TIME_COL])
+    keep = [TIME_COL] + ([TYPE_COL] if TYPE_COL in df.columns else [])
+    values = [c for c in df.columns if c not in keep and pd.api.types.is_numeric_dtype(df[c])]
+    df = df[keep + values]
+    for c in values:
+        df[c] = df[c].astype(np.float32)
+    df = df.sort_values(keep[::-1], kind="stable")  # type-clustered row groups for long tables
+
+    stats = _read_stats(table_dir)
+    slug = area_slug(area)
+    written = 0
+    years, months = df[TIME_COL].dt.year.to_numpy(), df[TIME_COL].dt.month.to_numpy()
+    for (year, month), idx in pd.Series(np.arange(len(df))).groupby([years, months]).groups.items():
+        part = df.iloc[idx]
+        key = f"area={slug}/year={year}/month={month:02d}"
+        digest = _frame_hash(part)
+        if stats.get(key, {}).get("hash") == digest and (table_dir / key / "part.parquet").exists():
+            continue
+        (table_dir / key).mkdir(parents=True, exist_ok=True)
+        tmp = table_dir / key / "part.parquet.tmp"
+        pq.write_table(pa.Table.from_pandas(part, preserve_index=False), tmp,
+                       row_group_size=ROW_GROUP, write_statistics=True)
+        os.replace(tmp, table_dir / key / "part.parquet")
+        stats[key] = {"area": str(area), "year": int(year), "month": int(month), "hash": digest,
+                      **_partition_stats(part, values)}
+        written += 1
+
+    table_dir.mkdir(parents=True, exist_ok=True)
+    with open(table_dir / _STATS, "w", encoding="utf-8") as fh:
+        json.dump(stats, fh, indent=1, sort_keys=True)
+    return written
+
+
+def write_source(table: str, path: Path = None, area: str = DEFAULT_AREA, root: Path = DATASET_ROOT) -> int:
+    """Write one hourly output file into `table` (default: its TABLES source). Returns partitions written."""
+    from schemas import read_typed
+
+    source, long = TABLES[table]
+    df = read_typed(path or source).select_dtypes("number")
+    return write_table(to_long(df) if long else df, table, area, root)
+
+
+def build_dataset(root: Path = DATASET_ROOT, area: str = DEFAULT_AREA, area_root: Path = None) -> dict:
+    """
+    Write the hourly load and generation-by-type outputs into the dataset: the top-level
+    files under `area`, plus every zone of an areas.py output folder (by_area/<zone>/).
+    Returns {table: partitions written}.
+    """
+    written = {t: 0 for t in TABLES}
+    for table, (path, _) in TABLES.items():
+        if Path(path).exists():
+            written[table] += write_source(table, path, area, root)
+
+    if area_root is not None:
+        for zone_dir in sorted(p for p in Path(area_root).iterdir() if p.is_dir() and not p.name.startswith("_")):
+            for f in zone_dir.glob("*_hourly.csv"):
+                df = pd.read_csv(f, parse_dates=[TIME_COL], index_col=TIME_COL)
+                written["load"] += write_table(df.select_dtypes("number"), "load", zone_dir.name, root)
+            f = zone_dir / "generation_hourly_all_types.csv"
+            if f.exists():
+                df = pd.read_csv(f, parse_dates=[0], index_col=0)
+                written["generation"] += write_table(to_long(df), "generation", zone_dir.name, root)
+    return written
+
+
+# ---------- Queries ----------
+def _as_list(x) -> list:
+    return None if x is None else [x] if isinstance(x, (str, int)) else list(x)
+
+
+def partitions(table: str, start=None, end=None, areas=None, types=None, root: Path = DATASET_ROOT) -> list:
+    """Partition keys that can hold rows in [start, end) for the given areas/types (stats only, no file access)."""
+    stats = _read_stats(Path(root) / table)
+    start = None if start is None else str(pd.Timestamp(start))
+    end = None if end is None else str(pd.Timestamp(end))
+    areas = _as_list(areas)
+    types = _as_list(types)
+    keep = []
+    for key, s in sorted(stats.items()):
+        if areas is not None and s["area"] not in areas and area_slug(s["area"]) not in map(area_slug, areas):
+            continue
+        if start is not None and s["end"] < start:
+            continue
+        if end is not None and s["start"] >= end:
+            continue
+        if types is not None and "types" in s and not set(types) & set(s["types"]):
+            continue
+        keep.append(key)
+    return keep
+
+
+def _filter(start, end, types, where):
+    expr = None
+    parts = []
+    if start is not None:
+        parts.append(ds.field(TIME_COL) >= pa.scalar(pd.Timestamp(start).to_pydatetime(), pa.timestamp("us")))
+    if end is not None:
+        parts.append(ds.field(TIME_COL) < pa.scalar(pd.Timestamp(end).to_pydatetime(), pa.timestamp("us")))
+    if types is not None:
+        parts.append(ds.field(TYPE_COL).isin(types))
+    if where is not None:
+        parts.append(where)
+    for p in parts:
+        expr = p if expr is None else expr & p
+    return expr
+
+
+def scan(table: str, columns: list = None, start=None, end=None, areas=None, types=None, where=None,
+         root: Path = DATASET_ROOT) -> pa.Table:
+    """
+    Arrow table of the matching rows. Partitions are pruned by area/time/type from the
+    stats, only `columns` (plus partition columns asked for) are read, and the time/type/
+    `where` predicates (a pyarrow.dataset expression) are pushed down to the row groups.
+    """
+    table_dir = Path(root) / table
+    keys = partitions(table, start, end, areas, types, root)
+    files = [str(table_dir / k / "part.parquet") for k in keys]
+    if not files:
+        schema_cols = columns or []
+        return pa.table({c: pa.array([], pa.float32()) for c in schema_cols})
+    dataset = ds.dataset(files, format="parquet", partitioning=ds.partitioning(flavor="hive"),
+                         partition_base_dir=str(table_dir))
+    return dataset.to_table(columns=columns, filter=_filter(start, end, _as_list(types), where))
+
+
+def query(table: str, columns: list = None, start=None, end=None, areas=None, types=None, where=None,
+          root: Path = DATASET_ROOT) -> pd.DataFrame:
+    """scan() as a pandas frame, e.g. query("load", ["datetime", "Actual Total Load (MW)"], "2024-03-01", "2024-04-01")."""
+    return scan(table, columns, start, end, areas, types, where, root).to_pandas()
+
+
+# Time parts aggregate() can group by besides stored columns
+_TIME_PARTS = {"year": pc.year, "month": pc.month, "day": pc.day, "hour": pc.hour, "day_of_week": pc.day_of_week}
+
+
+def aggregate(table: str, by: list, values=VALUE_COL, how: str = "mean", start=None, end=None, areas=None,
+              types=None, where=None, root: Path = DATASET_ROOT) -> pd.DataFrame:
+    """
+    Group-by over the dataset without loading it into pandas, e.g. monthly average per type:
+        aggregate("generation", ["year", "month", "type"], "value", "mean")
+    `by` may name stored columns, the area partition or year/month/day/hour/day_of_week.
+    `how` is any Arrow hash aggregation (mean, sum, min, max, count, stddev, ...).
+    """
+    values = _as_list(values)
+    stored = [b for b in by if b not in _TIME_PARTS and b != "area"]
+    need_time = any(b in _TIME_PARTS for b in by)
+    cols = list(dict.fromkeys(stored + values + ([TIME_COL] if need_time else []) + (["area"] if "area" in by else [])))
+    tbl = scan(table, cols, start, end, areas, types, where, root)
+    for b in by:
+        if b in _TIME_PARTS:
+            tbl = tbl.append_column(b, _TIME_PARTS[b](tbl[TIME_COL]))
+    out = tbl.group_by(by).aggregate([(v, how) for v in values]).to_pandas()
+    out.columns = [c.removesuffix(f"_{how}") if c.endswith(f"_{how}") else c for c in out.columns]
+    return out.sort_values(by, kind="stable").reset_index(drop=True)
+
+
+def sql(text: str, root: Path = DATASET_ROOT) -> pd.DataFrame:
+    """SQL over the dataset (each table is a view, hive columns area/year/month included). Needs duckdb."""
+    if duckdb is None:
+        raise ImportError("sql() needs duckdb (pip install duckdb); query()/aggregate() work without it")
+    con = duckdb.connect()
+    for table in TABLES:
+        glob = str(Path(root) / table / "**" / "*.parquet")
+        con.execute(f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{glob}', hive_partitioning = true)")
+    return con.execute(text).df()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the partitioned hourly dataset.")
+    parser.add_argument("--root", type=Path, default=DATASET_ROOT)
+    parser.add_argument("--area", default=DEFAULT_AREA, help="area name for the top-level files")
+    parser.add_argument("--by-area", type=Path, help="also add every zone of an areas.py output folder")
+    args = parser.parse_args()
+    for table, n in build_dataset(args.root, args.area, args.by_area).items():
+        print(f"✅ {table}: {n} partitions written → {args.root / table}")
@@ -0,0 +1,148 @@
+import io
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Downsampling in front of long line/area plots. A plot can't show more than a couple of
+# points per horizontal pixel, so we keep per-pixel extremes (min-max) or the visually
+# most significant points (LTTB) and drop the rest before matplotlib ever sees them.
+
+
+def _as_float(x) -> np.ndarray:
+    """x positions as float64 (datetimes as ns relative to the first point)."""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype("datetime64[ns]").view(np.int64)
+        return (x - x[0]).astype(np.float64) if len(x) else x.astype(np.float64)
+    return x.astype(np.float64)
+
+
+def minmax_indices(y, n_buckets: int) -> np.ndarray:
+    """
+    Indices of the min and max of each of `n_buckets` equal buckets (plus first/last point,
+    and the first NaN of a bucket so line gaps survive). Fully vectorized.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_buckets <= 0 or n <= 2 * n_buckets:
+        return np.arange(n)
+
+    size = -(-n // n_buckets)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(n_buckets, size)
+    nan = np.isnan(blocks)
+    base = np.arange(n_buckets) * size
+
+    lo = base + np.where(nan, np.inf, blocks).argmin(axis=1)
+    hi = base + np.where(nan, -np.inf, blocks).argmax(axis=1)
+    gaps = (base + nan.argmax(axis=1))[nan.any(axis=1)]
+
+    idx = np.unique(np.concatenate([[0, n - 1], lo, hi, gaps]))
+    return idx[idx < n]
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: `n_out` indices that best preserve the visual shape."""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = _as_float(x)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        nxt_hi = edges[i + 2] if i + 2 < len(edges) else n
+        nxt = y[hi:nxt_hi]
+        nxt = nxt[~np.isnan(nxt)]
+        avg_x = x[hi:nxt_hi].mean() if nxt_hi > hi else x[-1]
+        avg_y = nxt.mean() if len(nxt) else y[a]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        area = np.where(np.isnan(area), -1.0, area)
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return np.unique(out)
+
+
+def pixel_width(ax, dpi: float = None) -> int:
+    """Width of an axes in output pixels (pass the savefig dpi if it differs from the figure's)."""
+    fig = ax.figure
+    dpi = dpi or fig.dpi
+    return max(1, int(ax.get_position().width * fig.get_figwidth() * dpi))
+
+
+def downsample(data, n_px: int, method: str = "minmax"):
+    """
+    Downsample a Series or DataFrame (index = x) to roughly `n_px` horizontal pixels.
+    For frames the union of every column's kept rows is used, so all columns (e.g. the
+    layers of a stacked area chart) stay on a common x.
+    """
+    if len(data) <= 2 * n_px:
+        return data
+    cols = [data] if isinstance(data, pd.Series) else [data[c] for c in data.columns]
+
+    keep = []
+    for col in cols:
+        if method == "lttb":
+            keep.append(lttb_indices(data.index, col.to_numpy(np.float64), 2 * n_px))
+        else:
+            keep.append(minmax_indices(col.to_numpy(np.float64), n_px))
+    return data.iloc[np.unique(np.concatenate(keep))]
+
+
+def plot_downsampled(ax, x, y, dpi: float = None, method: str = "minmax", **kwargs):
+    """ax.plot(x, y, **kwargs) after reducing the points to what the axes can display."""
+    s = pd.Series(np.asarray(y, dtype=np.float64), index=pd.Index(x))
+    s = downsample(s, pixel_width(ax, dpi), method)
+    return ax.plot(s.index, s.to_numpy(), **kwargs)
+
+
+# ---------- Benchmark ----------
+def benchmark(dpi: int = 300) -> None:
+    """Render time and PNG size of the actual-vs-forecast load plot, raw vs downsampled."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from schemas import read_typed
+
+    cases = {
+        "hourly 2022-2024": read_typed(Path("Load Data") / "TotalLoadDayAhead_Hour_2022_2024_combined.csv"),
+        "15-min 2023-2024": pd.concat([
+            read_typed(Path("Load Data") / "TotalLoadDayAhead_15min_2023.csv"),
+            read_typed(Path("Load Data") / "TotalLoadDayAhead_15min_2024.csv"),
+        ]),
+    }
+    # 10 years of 15-min data: the 2023-2024 series repeated on a continuous grid
+    base = cases["15-min 2023-2024"].select_dtypes("number")
+    long = pd.concat([base] * 5, ignore_index=True)
+    long.index = pd.date_range("2015-01-01", periods=len(long), freq="15min")
+    cases["15-min 10 years"] = long
+
+    for name, df in cases.items():
+        df = df.select_dtypes("number")
+        for mode in ("raw", "minmax", "lttb"):
+            t0 = time.perf_counter()
+            fig, ax = plt.subplots(figsize=(14, 6))
+            n_points = 0
+            for col in df.columns:
+                if mode == "raw":
+                    lines = ax.plot(df.index, df[col], linewidth=1)
+                else:
+                    lines = plot_downsampled(ax, df.index, df[col], dpi=dpi, method=mode, linewidth=1)
+                n_points += len(lines[0].get_xdata())
+            buf = io.BytesIO()
+            fig.savefig(buf, dpi=dpi)
+            plt.close(fig)
+            elapsed = time.perf_counter() - t0
+            print(f"{name:18s} {mode:7s} points={n_points:8,d}  render={elapsed:6.2f} s  png={buf.tell() / 1e3:8.1f} kB")
+
+
+if __name__ == "__main__":
+    benchmark()
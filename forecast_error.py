@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+
+from grid import to_grid
+
+# Forecast-error analytics for actual vs day-ahead load. error = forecast - actual, so a
+# positive bias means over-forecasting. Every window is a difference of two prefix sums
+# (O(1) per step, any number of windows from the same cumsums).
+
+WINDOWS = ("24h", "7D", "30D")
+METRICS = ("bias", "mae", "rmse", "mape")
+
+# Per-step terms whose sums give every metric: valid count, error, |error|, error²,
+# |error| / |actual| and its count (actual == 0 is left out of MAPE)
+_TERMS = ("n", "e", "abs", "sq", "ape", "n_ape")
+
+
+def _terms(actual: np.ndarray, forecast: np.ndarray) -> np.ndarray:
+    """(..., 6) array of per-step terms; missing values contribute nothing."""
+    a = np.asarray(actual, dtype=np.float64)
+    e = np.asarray(forecast, dtype=np.float64) - a
+    ok = ~np.isnan(e)
+    e0 = np.where(ok, e, 0.0)
+    ok_ape = ok & (a != 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ape = np.where(ok_ape, np.abs(e0) / np.abs(a), 0.0)
+    return np.stack([ok, e0, np.abs(e0), e0 * e0, ape, ok_ape], axis=-1).astype(np.float64)
+
+
+def _metrics(sums: np.ndarray, min_periods: int = 1) -> dict:
+    """{metric: array} from summed terms (last axis = _TERMS)."""
+    n, n_ape = sums[..., 0], sums[..., 5]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = {
+            "bias": sums[..., 1] / n,
+            "mae": sums[..., 2] / n,
+            "rmse": np.sqrt(sums[..., 3] / n),
+            "mape": 100 * sums[..., 4] / n_ape,
+        }
+    for k in out:
+        out[k] = np.where(n >= max(min_periods, 1), out[k], np.nan)
+    return out
+
+
+def _steps(window: str, step: pd.Timedelta) -> int:
+    return max(int(pd.Timedelta(window) // step), 1)
+
+
+def _align(actual, forecast, freq: str = None) -> tuple:
+    """Actual and forecast on one regular grid: (actual 2-D, forecast 2-D, index, step, columns)."""
+    a = actual.to_frame() if isinstance(actual, pd.Series) else actual
+    f = forecast.to_frame(a.columns[0]) if isinstance(forecast, pd.Series) else forecast
+    if freq is None:
+        diffs = np.diff(pd.DatetimeIndex(a.index).asi8[:10_000])
+        unit = pd.Timedelta(1, unit=pd.DatetimeIndex(a.index).unit)
+        freq = pd.Timedelta(int(np.median(diffs[diffs > 0])) * unit) if len(diffs) else pd.Timedelta("1h")
+    step = pd.Timedelta(freq)
+    both, _ = to_grid(pd.concat({"a": a, "f": f[a.columns]}, axis=1), pd.tseries.frequencies.to_offset(step))
+    return both["a"].to_numpy(), both["f"].to_numpy(), both.index, step, list(a.columns)
+
+
+def rolling_metrics(actual, forecast, windows=WINDOWS, freq: str = None, min_periods: int = 1) -> pd.DataFrame:
+    """
+    Trailing-window bias, MAE, RMSE and MAPE (%) for every window at every step.
+    `actual`/`forecast` are Series, or DataFrames with one column per area. Irregular or
+    gappy input is put on a regular grid first (15-min data stays 15-min). Columns are
+    '<metric>_<window>', or (area, '<metric>_<window>') for DataFrames.
+    """
+    a, f, index, step, cols = _align(actual, forecast, freq)
+    terms = _terms(a, f)  # (time, areas, terms)
+    prefix = np.zeros((len(index) + 1,) + terms.shape[1:])
+    np.cumsum(terms, axis=0, out=prefix[1:])
+
+    hi = np.arange(1, len(index) + 1)
+    out = {}
+    for w in windows:
+        lo = np.maximum(hi - _steps(w, step), 0)
+        for metric, values in _metrics(prefix[hi] - prefix[lo], min_periods).items():
+            for j, col in enumerate(cols):
+                out[(col, f"{metric}_{w}")] = values[:, j]
+
+    df = pd.DataFrame(out, index=index)
+    if isinstance(actual, pd.Series):
+        df.columns = df.columns.droplevel(0)
+    return df
+
+
+def hour_of_day_metrics(actual, forecast, freq: str = None) -> pd.DataFrame:
+    """Bias, MAE, RMSE and MAPE (%) per hour of day (0-23) over the whole period."""
+    a, f, index, _, cols = _align(actual, forecast, freq)
+    terms = _terms(a, f)
+    hours = pd.DatetimeIndex(index).hour.to_numpy()
+    sums = np.zeros((24,) + terms.shape[1:])
+    np.add.at(sums, hours, terms)
+
+    out = {(col, m): v[:, j] for m, v in _metrics(sums).items() for j, col in enumerate(cols)}
+    df = pd.DataFrame(out, index=pd.RangeIndex(24, name="hour"))
+    if isinstance(actual, pd.Series):
+        df.columns = df.columns.droplevel(0)
+    return df
+
+
+class StreamingErrorMetrics:
+    """
+    Rolling forecast-error metrics updated one step at a time (e.g. as each new hour
+    arrives). Each window keeps a running sum; the step falling out of the window is
+    subtracted from a ring buffer, so an update costs O(windows). Sums are rebuilt
+    from the buffer once per buffer length to stop floating-point drift.
+    """
+
+    def __init__(self, windows=WINDOWS, freq: str = "1h"):
+        self.step = pd.Timedelta(freq)
+        self.sizes = {w: _steps(w, self.step) for w in windows}
+        self.capacity = max(self.sizes.values())
+        self._buf = np.zeros((self.capacity, len(_TERMS)))
+        self._sums = {w: np.zeros(len(_TERMS)) for w in windows}
+        self._hod = np.zeros((24, len(_TERMS)))
+        self.n = 0
+        self.last_time = None
+
+    def update(self, actual: float, forecast: float, time=None) -> dict:
+        """Add one step and return the current metrics. Missing steps before `time` count as gaps."""
+        if time is not None:
+            time = pd.Timestamp(time)
+            if self.last_time is not None:
+                for _ in range(int((time - self.last_time) // self.step) - 1):
+                    self._push(np.zeros(len(_TERMS)))
+            self.last_time = time
+        terms = _terms(np.array([actual]), np.array([forecast]))[0]
+        if time is not None:
+            self._hod[time.hour] += terms
+        self._push(terms)
+        return self.metrics()
+
+    def _push(self, terms: np.ndarray) -> None:
+        pos = self.n % self.capacity
+        for w, size in self.sizes.items():
+            self._sums[w] += terms
+            if self.n >= size:
+                self._sums[w] -= self._buf[(self.n - size) % self.capacity]
+        self._buf[pos] = terms
+        self.n += 1
+        if self.n % self.capacity == 0:  # exact re-sum, amortized O(1)
+            for w, size in self.sizes.items():
+                idx = (self.n - 1 - np.arange(min(size, self.n))) % self.capacity
+                self._sums[w] = self._buf[idx].sum(axis=0)
+
+    def metrics(self) -> dict:
+        """{'<metric>_<window>': value} for the windows ending at the latest step."""
+        return {f"{m}_{w}": float(v) for w, s in self._sums.items() for m, v in _metrics(s).items()}
+
+    def hour_of_day(self) -> pd.DataFrame:
+        """Metrics per hour of day over everything seen so far (needs `time` in update)."""
+        return pd.DataFrame(_metrics(self._hod), index=pd.RangeIndex(24, name="hour"))
+
+
+if __name__ == "__main__":
+    from master import LOAD_COLUMNS, read_master
+
+    load = read_master(LOAD_COLUMNS, local=True)
+    actual, forecast = load[LOAD_COLUMNS[0]], load[LOAD_COLUMNS[1]]
+    rolling = rolling_metrics(actual, forecast)
+    rolling.to_csv("forecast_error_rolling.csv")
+    print(hour_of_day_metrics(actual, forecast).round(2))
+    print(f"✅ Rolling metrics ({', '.join(WINDOWS)}) saved: forecast_error_rolling.csv")
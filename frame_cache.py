@@ -0,0 +1,249 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sys
+import types
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # fall back to pickle when Arrow is not installed
+    pa = None
+    feather = None
+
+# ---------- Config ----------
+CACHE_DIR = Path(os.environ.get("FRAME_CACHE_DIR", ".frame_cache"))
+MAX_CACHE_BYTES = int(os.environ.get("FRAME_CACHE_MAX_BYTES", 1 << 30))  # 1 GiB
+CACHE_VERSION = 1  # bump to invalidate every entry after a format change
+# Loader code is part of the key too (see _code_key), so editing a loader needs no bump
+
+_INDEX_FILE = "index.json"
+_EXT = ".feather" if feather is not None else ".pkl"
+
+
+def _file_digest(path: Path, size: int = None) -> str:
+    """Content hash of a file, or of its first `size` bytes (blake2b, 128 bit)."""
+    h = hashlib.blake2b(digest_size=16)
+    left = float("inf") if size is None else size
+    with open(path, "rb") as fh:
+        while left > 0:
+            block = fh.read(int(min(1 << 20, left)))
+            if not block:
+                break
+            h.update(block)
+            left -= len(block)
+    return h.hexdigest()
+
+
+def _load_index() -> dict:
+    try:
+        with open(CACHE_DIR / _INDEX_FILE, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_index(index: dict) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_DIR / f"{_INDEX_FILE}.{os.getpid()}.tmp"  # per process: parallel workers share the index
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(index, fh)
+    os.replace(tmp, CACHE_DIR / _INDEX_FILE)
+
+
+def content_hash(path) -> str:
+    """
+    Content hash of `path`, reusing the stored hash while path, size and mtime are unchanged.
+    A touched-but-identical file is re-hashed once and still hits the same cache entries.
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    index = _load_index()
+    entry = index.get(str(path))
+    if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+        return entry["hash"]
+
+    digest = _file_digest(path)
+    index[str(path)] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest}
+    _save_index(index)
+    return digest
+
+
+def prefix_hash(path, size: int) -> str:
+    """
+    Hash of the first `size` bytes of `path`. Equals the content_hash() the file had when it
+    was `size` bytes long, so a match means the file only grew since then.
+    """
+    return _file_digest(Path(path), size)
+
+
+def _callable_key(fn) -> str:
+    """Stable identity of a postprocess callable (functools.partial included)."""
+    if fn is None:
+        return ""
+    if isinstance(fn, functools.partial):
+        return f"{_callable_key(fn.func)}{fn.args!r}{sorted(fn.keywords.items())!r}"
+    return f"{fn.__module__}.{fn.__qualname__}"
+
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(path: str, mtime_ns: int, size: int) -> str:
+    return _file_digest(Path(path))
+
+
+def _code_key(fn) -> str:
+    """
+    Digest of the source files behind a callable: its module plus every module next to it
+    that the module imports from (e.g. DataPreProcessing → mtu, grid). Editing any of them
+    changes the key, so stale parses are never served.
+    """
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    module = sys.modules.get(getattr(fn, "__module__", None) or "")
+    path = getattr(module, "__file__", None)
+    if path is None:
+        return ""
+    root = Path(path).resolve().parent
+    files = {Path(path).resolve()}
+    for obj in vars(module).values():
+        dep = obj if isinstance(obj, types.ModuleType) else sys.modules.get(getattr(obj, "__module__", None) or "")
+        dep_file = getattr(dep, "__file__", None)
+        if isinstance(dep_file, str) and Path(dep_file).resolve().parent == root:
+            files.add(Path(dep_file).resolve())
+    digests = []
+    for f in sorted(files):
+        st = f.stat()
+        digests.append(_source_digest(str(f), st.st_mtime_ns, st.st_size))
+    return "".join(digests)
+
+
+def _params_key(loader, params: dict) -> str:
+    items = sorted((k, _callable_key(v) + _code_key(v) if callable(v) else repr(v)) for k, v in params.items())
+    raw = repr((CACHE_VERSION, _callable_key(loader), _code_key(loader), items))
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+
+def _write_frame(df: pd.DataFrame, dest: Path) -> None:
+    tmp = dest.with_suffix(f"{dest.suffix}.{os.getpid()}.tmp")
+    if feather is not None:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        feather.write_feather(table, tmp)
+    else:
+        with open(tmp, "wb") as fh:
+            pickle.dump(df, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, dest)
+
+
+def _read_frame(src: Path) -> pd.DataFrame:
+    if feather is not None:
+        return feather.read_table(src, memory_map=True).to_pandas()
+    with open(src, "rb") as fh:
+        return pickle.load(fh)
+
+
+def _entries() -> list:
+    if not CACHE_DIR.exists():
+        return []
+    return [p for p in CACHE_DIR.iterdir() if p.suffix in (".feather", ".pkl")]
+
+
+def evict(max_bytes: int = None) -> int:
+    """Delete least-recently-used entries until the cache fits in `max_bytes`. Returns bytes freed."""
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    entries = sorted(_entries(), key=lambda p: p.stat().st_mtime)  # mtime is bumped on every hit
+    total = sum(p.stat().st_size for p in entries)
+    freed = 0
+    for p in entries:
+        if total <= max_bytes:
+            break
+        size = p.stat().st_size
+        p.unlink(missing_ok=True)
+        total -= size
+        freed += size
+    return freed
+
+
+def invalidate(path=None) -> int:
+    """Drop cached frames for one source file, or the whole cache if `path` is None. Returns entries removed."""
+    if path is None:
+        removed = 0
+        for p in _entries():
+            p.unlink(missing_ok=True)
+            removed += 1
+        (CACHE_DIR / _INDEX_FILE).unlink(missing_ok=True)
+        return removed
+
+    path = Path(path).resolve()
+    index = _load_index()
+    entry = index.pop(str(path), None)
+    _save_index(index)
+    if entry is None:
+        return 0
+    removed = 0
+    for p in _entries():
+        if p.name.startswith(entry["hash"]):
+            p.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def load_cached(path, loader, **params) -> pd.DataFrame:
+    """
+    Serve `loader(path, **params)` from a binary cache keyed on the file content,
+    the loader and its parameters. Use module-level functions (or partials of them) as loaders.
+    """
+    path = Path(path)
+    digest = content_hash(path)
+    entry = CACHE_DIR / f"{digest}-{_params_key(loader, params)}{_EXT}"
+
+    if entry.exists():
+        try:
+            df = _read_frame(entry)
+            os.utime(entry)  # mark as recently used for LRU eviction
+            return df
+        except Exception as e:
+            print(f"⚠️ Unreadable cache entry {entry.name} ({e}); re-parsing {path.name}.")
+            entry.unlink(missing_ok=True)
+
+    df = loader(path, **params)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        _write_frame(df, entry)
+    except Exception as e:  # an uncacheable frame must never break the caller
+        print(f"⚠️ Could not cache {path.name}: {e}")
+    evict()
+    return df
+
+
+def _read_csv(path, postprocess=None, **read_kwargs) -> pd.DataFrame:
+    df = pd.read_csv(path, **read_kwargs)
+    return df if postprocess is None else postprocess(df)
+
+
+def read_csv_cached(path, postprocess=None, **read_kwargs) -> pd.DataFrame:
+    """
+    Drop-in for pd.read_csv(path, **read_kwargs) (optionally followed by `postprocess(df)`),
+    served from the cache.
+    """
+    return load_cached(path, _read_csv, postprocess=postprocess, **read_kwargs)
+
+
+if __name__ == "__main__":
+    # python frame_cache.py clear [file ...]   -> invalidate all, or only the given source files
+    # python frame_cache.py evict [max_bytes]  -> shrink the cache
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "clear"
+    if cmd == "clear":
+        targets = sys.argv[2:] or [None]
+        n = sum(invalidate(t) for t in targets)
+        print(f"✅ Removed {n} cached frame(s) from {CACHE_DIR}")
+    elif cmd == "evict":
+        freed = evict(int(sys.argv[2]) if len(sys.argv) > 2 else None)
+        print(f"✅ Freed {freed / 1e6:.1f} MB from {CACHE_DIR}")
+    else:
+        print(f"Unknown command '{cmd}'. Use 'clear' or 'evict'.")
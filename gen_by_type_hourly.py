@@ -1,29 +1,65 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
 
+from grid import to_grid
+from mtu import parse_mtu_start
+
+try:
+    import pyarrow  # noqa: F401  (only needed for the faster CSV engine)
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 input_folder = "generation_by_type"
 output_path = "generation_hourly_all_types.csv"
 
-hourly_dfs = {}
+# Only these are needed; Country_Area / Production_Type are constant per file
+USECOLS = ["Time_Interval", "Generation_Value"]
+
+
+def hourly_from_file(file_path: str):
+    """Read one per-type file and resample to hourly sums. Returns (gen_type, hour starts as int64 ns, values)."""
+    gen_type = os.path.basename(file_path).replace("_GENERATION.csv", "")
+    df = pd.read_csv(file_path, usecols=USECOLS, engine=CSV_ENGINE)
+
+    # Clean and convert time
+    start = parse_mtu_start(df["Time_Interval"], utc=False)
+    values = pd.Series(pd.to_numeric(df["Generation_Value"], errors="coerce").to_numpy(), index=start)
+    values = values[start.notna()]
+
+    # Resample to hourly (empty hours sum to 0, like resample().sum())
+    hourly, _ = to_grid(values, "h", how="sum")
+    return gen_type, hourly.index.asi8, hourly.to_numpy(np.float64)
+
+
+def build_wide_matrix(results: list) -> pd.DataFrame:
+    """Assemble a time × type frame straight from per-type (index, values) arrays."""
+    all_idx = np.unique(np.concatenate([idx for _, idx, _ in results])) if results else np.array([], np.int64)
+    matrix = np.full((len(all_idx), len(results)), np.nan)
+    for j, (_, idx, vals) in enumerate(results):
+        matrix[np.searchsorted(all_idx, idx), j] = vals
 
-for file in os.listdir(input_folder):
-    if file.endswith(".csv"):
-        file_path = os.path.join(input_folder, file)
-        df = pd.read_csv(file_path)
+    index = pd.DatetimeIndex(all_idx.view("datetime64[ns]"), name="Time_Interval")
+    return pd.DataFrame(matrix, index=index, columns=[name for name, _, _ in results])
 
-        gen_type = file.replace("_GENERATION.csv", "")
 
-        # Clean and convert time
-        df['Time_Interval'] = df['Time_Interval'].str.split(' - ').str[0]
-        df['Time_Interval'] = pd.to_datetime(df['Time_Interval'], format="%d/%m/%Y %H:%M:%S", errors='coerce')
-        df.dropna(subset=['Time_Interval'], inplace=True)
-        df.set_index('Time_Interval', inplace=True)
+def hourly_all_types(folder: str = input_folder, workers: int = None) -> pd.DataFrame:
+    """Parse and resample every per-type file, one process per file (workers=1 runs serially)."""
+    files = [os.path.join(folder, f) for f in os.listdir(folder) if f.endswith(".csv")]
+    workers = workers or os.cpu_count() or 1
 
-        # Resample to hourly
-        hourly_df = df['Generation_Value'].resample('H').sum().to_frame(name=gen_type)
+    if workers == 1 or len(files) <= 1:
+        results = [hourly_from_file(f) for f in files]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+            results = list(pool.map(hourly_from_file, files))
+    return build_wide_matrix(results)
 
-        hourly_dfs[gen_type] = hourly_df
 
-# Combine all generation types
-combined_hourly_df = pd.concat(hourly_dfs.values(), axis=1)
-combined_hourly_df.to_csv(output_path)
+if __name__ == "__main__":
+    # Combine all generation types
+    combined_hourly_df = hourly_all_types()
+    combined_hourly_df.to_csv(output_path)
@@ -0,0 +1,235 @@
+import numpy as np
+import pandas as pd
+
+# Regular-grid builder: every row gets an integer slot (t - origin) // step and values are
+# scatter-added into preallocated arrays with np.bincount. One linear pass collapses
+# duplicate timestamps (DST fall-back), converts 15-min → hourly and finds gaps, with
+# no sort, hash groupby or asfreq.
+
+_NAT = np.iinfo(np.int64).min
+
+
+def index_ints(idx) -> tuple:
+    """(int64 ticks, unit) of a DatetimeIndex in its own unit (tz-aware as UTC); NaT stays int64 min."""
+    idx = pd.DatetimeIndex(idx)
+    return idx.asi8, idx.unit
+
+
+def grid_slots(ticks: np.ndarray, step: int, origin: int = None) -> tuple:
+    """(slot per row, origin, number of slots) for int64 times; NaT rows and rows before `origin` get a negative slot."""
+    valid = ticks != _NAT
+    if not valid.any():
+        return np.full(len(ticks), -1, dtype=np.int64), origin or 0, 0
+    if origin is None:
+        origin = int(ticks[valid].min() // step * step)
+    slots = np.where(valid, (ticks - origin) // step, -1)
+    return slots, origin, max(int(slots.max()) + 1, 0)  # origin after every row: empty grid
+
+
+def scatter(slots: np.ndarray, values: np.ndarray, length: int, how: str = "mean") -> tuple:
+    """
+    Reduce a rows × columns float array into `length` slots. Returns (result, counts) where
+    counts are non-NaN samples per slot and column. how='mean' leaves empty slots NaN,
+    how='sum' leaves them 0 (like resample().sum()).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    keep = (slots >= 0) & (slots < length)
+    if not keep.all():
+        slots, values = slots[keep], values[keep]
+
+    out = np.empty((length, values.shape[1]))
+    counts = np.empty((length, values.shape[1]), dtype=np.int64)
+    rows = None
+    for j in range(values.shape[1]):
+        col = values[:, j]
+        ok = ~np.isnan(col)
+        if ok.all():  # common case: no masking copies, one shared row count
+            rows = np.bincount(slots, minlength=length) if rows is None else rows
+            out[:, j] = np.bincount(slots, weights=col, minlength=length)
+            counts[:, j] = rows
+        else:
+            out[:, j] = np.bincount(slots[ok], weights=col[ok], minlength=length)
+            counts[:, j] = np.bincount(slots[ok], minlength=length)
+
+    if how == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = np.where(counts > 0, out / counts, np.nan)
+    elif how != "sum":
+        raise ValueError(f"how must be 'mean' or 'sum', got {how!r}")
+    return out, counts
+
+
+# Statistics resample_stats() can return; "rows" counts source rows per bin (NaN values included)
+STATS = ("mean", "sum", "energy", "min", "max", "count", "coverage", "rows")
+
+
+def _ticks(freq: str, unit: str) -> int:
+    """Length of a fixed frequency in ticks of `unit`."""
+    return pd.tseries.frequencies.to_offset(freq).nanos // pd.Timedelta(1, unit=unit).value
+
+
+def _median_step(diffs: np.ndarray) -> int:
+    """Typical spacing of the source samples (median positive difference of the first 100k), or None."""
+    d = diffs[:100_000]
+    d = d[d > 0]
+    return int(np.median(d)) if len(d) else None
+
+
+def _reduce_regular(values, lead: int, k: int, need: set) -> dict:
+    """
+    Reshape-and-reduce for gap-free, evenly spaced input. Samples are laid out as
+    (k, bins, columns) so every reduction runs over k contiguous (bins, columns) slices.
+    """
+    n, cols = values.shape
+    bins = -(-(lead + n) // k)
+    blocks = np.full((k, bins, cols), np.nan)
+    rows = np.zeros(bins, dtype=np.int64)
+    for i in range(k):
+        first = (i - lead) % k  # first source row that lands on position i of its bin
+        part = values[first::k]
+        b0 = (lead + first) // k
+        blocks[i, b0:b0 + len(part)] = part
+        rows[b0:b0 + len(part)] += 1
+
+    nan = np.isnan(blocks)
+    filled = blocks.copy()
+    np.copyto(filled, 0.0, where=nan)
+    out = {"sum": np.add.reduce(filled, axis=0), "count": k - np.add.reduce(nan, axis=0, dtype=np.int64), "rows": rows}
+    if "min" in need:
+        out["min"] = np.fmin.reduce(blocks, axis=0)  # fmin/fmax skip NaN, all-NaN stays NaN
+    if "max" in need:
+        out["max"] = np.fmax.reduce(blocks, axis=0)
+    return out
+
+
+def _reduce_scatter(values, slots, length: int, need: set) -> dict:
+    """Scatter-add for arbitrary input (gaps, duplicates, unsorted); min/max via segment reduceat."""
+    out = {}
+    out["sum"], out["count"] = scatter(slots, values, length, how="sum")
+    keep = (slots >= 0) & (slots < length)
+    s, v = (slots, values) if keep.all() else (slots[keep], values[keep])
+    out["rows"] = np.bincount(s, minlength=length)
+
+    if need & {"min", "max"} and len(s):
+        order = None if (s[1:] >= s[:-1]).all() else np.argsort(s, kind="stable")
+        ss = s if order is None else s[order]
+        starts = np.flatnonzero(np.r_[True, ss[1:] != ss[:-1]])
+        for stat, ufunc in (("min", np.fmin), ("max", np.fmax)):
+            if stat in need:
+                res = np.full((length, v.shape[1]), np.nan)
+                for j in range(v.shape[1]):
+                    col = v[:, j] if order is None else v[order, j]
+                    res[ss[starts], j] = ufunc.reduceat(np.ascontiguousarray(col), starts)  # all-NaN bins stay NaN
+                out[stat] = res
+    else:
+        for stat in need & {"min", "max"}:
+            out[stat] = np.full((length, v.shape[1]), np.nan)
+    return out
+
+
+def resample_stats(frame, freq: str = "h", stats=("mean",), source_freq: str = None, origin=None) -> dict:
+    """
+    Several statistics of a time-indexed frame (or series) per `freq` bin from one scan:
+      mean     average power (MW)             sum       plain sum (0 for empty bins)
+      energy   sum × source interval (MWh)    min / max extremes
+      count    non-NaN samples                coverage  count / samples expected per bin
+      rows     source rows, NaN values included (one value per bin)
+    Gap-free, evenly spaced input is reduced by reshaping into (bins, samples per bin);
+    anything else (gaps, DST duplicates, unsorted) goes through a scatter-add.
+    `source_freq` defaults to the median sample spacing. Returns {stat: frame or series}.
+    """
+    stats = [stats] if isinstance(stats, str) else list(stats)
+    unknown = [s for s in stats if s not in STATS]
+    if unknown:
+        raise ValueError(f"Unknown statistics {unknown}; choose from {STATS}")
+
+    is_series = isinstance(frame, pd.Series)
+    df = frame.to_frame() if is_series else frame
+    ticks, unit = index_ints(df.index)
+    tz = pd.DatetimeIndex(df.index).tz
+    step = _ticks(freq, unit)
+    diffs = np.diff(ticks)
+    even = len(diffs) > 0 and ticks[0] != _NAT and diffs[0] > 0 and (diffs == diffs[0]).all()
+    if source_freq:
+        src = _ticks(source_freq, unit)
+    else:
+        src = int(diffs[0]) if even else _median_step(diffs[(ticks[1:] != _NAT) & (ticks[:-1] != _NAT)])
+    if src is None and ("energy" in stats or "coverage" in stats):
+        raise ValueError("energy/coverage need the sample interval; pass source_freq")
+    if origin is not None:
+        origin = int(pd.DatetimeIndex([origin], tz=tz).as_unit(unit).asi8[0])
+    elif even:
+        origin = int(ticks[0] // step * step)
+    values = df.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    if even and diffs[0] == src and step % src == 0 and (ticks[0] - origin) % src == 0 and ticks[0] >= origin:
+        red = _reduce_regular(values, int((ticks[0] - origin) // src), step // src, set(stats))
+        length = len(red["rows"])
+    else:
+        slots, origin, length = grid_slots(ticks, step, origin)
+        red = _reduce_scatter(values, slots, length, set(stats))
+
+    count = red["count"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        derived = {
+            "mean": lambda: np.where(count > 0, red["sum"] / count, np.nan),
+            "sum": lambda: red["sum"],
+            "energy": lambda: np.where(count > 0, red["sum"] * (src / _ticks("h", unit)), np.nan),
+            "min": lambda: red["min"],
+            "max": lambda: red["max"],
+            "count": lambda: count,
+            "coverage": lambda: count / (step / src),
+            "rows": lambda: red["rows"],
+        }
+        arrays = {s: derived[s]() for s in stats}
+
+    index = pd.DatetimeIndex((origin + np.arange(length, dtype=np.int64) * step).view(f"datetime64[{unit}]"),
+                             name=df.index.name)
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+
+    out = {}
+    for stat, arr in arrays.items():
+        if stat == "rows":
+            out[stat] = pd.Series(arr, index=index, name="rows")
+        elif is_series:
+            out[stat] = pd.Series(arr[:, 0], index=index, name=frame.name)
+        else:
+            out[stat] = pd.DataFrame(arr, index=index, columns=df.columns)
+    return out
+
+
+def resample_groups(df: pd.DataFrame, value_col: str, group_cols: list, freq: str = "h",
+                    stats=("mean",), source_freq: str = None) -> pd.DataFrame:
+    """
+    resample_stats() per group (e.g. Area × Production Type) of a datetime-indexed long table.
+    Returns one long frame: group columns, the bin start, then one column per statistic.
+    """
+    stats = [stats] if isinstance(stats, str) else list(stats)
+    groups = df.groupby(group_cols, sort=True) if group_cols else [((), df)]
+    parts = []
+    for key, g in groups:
+        res = resample_stats(g[value_col], freq, stats, source_freq)
+        part = pd.DataFrame({s: res[s] for s in stats})
+        part.index.name = df.index.name
+        part = part.reset_index()
+        for col, val in zip(group_cols, key if isinstance(key, tuple) else (key,)):
+            part.insert(len(part.columns) - len(stats) - 1, col, val)
+        parts.append(part)
+    cols = list(group_cols) + [df.index.name] + stats
+    return pd.concat(parts, ignore_index=True)[cols] if parts else pd.DataFrame(columns=cols)
+
+
+def to_grid(frame, freq: str = "h", how: str = "mean", origin=None) -> tuple:
+    """
+    Put a time-indexed frame (or series) on a regular `freq` grid from its first to its
+    last slot. Duplicate timestamps and finer samples within a slot are averaged
+    (how='mean') or summed (how='sum'). Returns (gridded frame, missing) where `missing`
+    is a boolean Series marking slots that had no source row at all.
+    """
+    if how not in ("mean", "sum"):
+        raise ValueError(f"how must be 'mean' or 'sum', got {how!r}")
+    res = resample_stats(frame, freq, (how, "rows"), origin=origin)
+    return res[how], (res["rows"] == 0).rename("missing")
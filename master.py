@@ -0,0 +1,156 @@
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from frame_cache import content_hash
+from grid import to_grid
+from mtu import LOCAL_TZ
+from schemas import read_typed
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pickle fallback: same API, but reads load every column
+    pa = None
+    feather = None
+
+# One aligned hourly table: load, forecast, total generation and every generation type
+# on a common UTC grid, written once as a columnar file and re-read column by column.
+MASTER_DIR = Path(os.environ.get("MASTER_DIR", ".master"))
+_DATA = "master_hourly" + (".feather" if feather is not None else ".pkl")
+_META = "meta.json"
+TIME_COL = "datetime_utc"
+
+# group: (source file, {source column: master column}); None keeps every numeric column
+SOURCES = {
+    "load": ("TotalLoad_DayAhead_Hourly.csv", {
+        "Actual Total Load (MW)": "Actual Total Load (MW)",
+        "Day-ahead Total Load Forecast (MW)": "Day-ahead Total Load Forecast (MW)",
+    }),
+    "total_gen": ("TotalGen_Hourly.csv", {"Average_Hourly_Generation": "Total_Generation"}),
+    "types": ("generation_hourly_all_types.csv", None),
+}
+LOAD_COLUMNS = list(SOURCES["load"][1].values())
+TOTAL_GEN = "Total_Generation"
+
+
+def _to_utc(df: pd.DataFrame) -> pd.DataFrame:
+    """Naive local wall-clock index → UTC. The spring-forward hour is dropped, a collapsed
+    fall-back hour is taken as the first (CEST) occurrence."""
+    idx = pd.DatetimeIndex(df.index)
+    if idx.tz is None:
+        idx = idx.tz_localize(LOCAL_TZ, ambiguous=np.ones(len(idx), dtype=bool), nonexistent="NaT")
+    df = df.set_axis(idx.tz_convert("UTC"), axis=0)
+    return df[df.index.notna()]
+
+
+def _instant(t) -> pd.Timestamp:
+    """Timestamp as an instant; naive values are local wall-clock time."""
+    t = pd.Timestamp(t)
+    return t.tz_localize(LOCAL_TZ) if t.tzinfo is None else t
+
+
+def _read_meta(master_dir: Path) -> dict:
+    try:
+        with open(master_dir / _META, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def build_master(master_dir: Path = MASTER_DIR, sources: dict = SOURCES, force: bool = False) -> Path:
+    """
+    Build (or reuse) the master table. Each source is scattered onto one preallocated
+    float32 UTC hourly matrix by slot, so there are no pairwise merges. Rebuilt only
+    when a source file's content changed.
+    """
+    master_dir = Path(master_dir)
+    hashes = {group: content_hash(path) for group, (path, _) in sources.items()}
+    meta = _read_meta(master_dir)
+    if not force and meta.get("sources") == hashes and (master_dir / _DATA).exists():
+        return master_dir / _DATA
+
+    frames, groups = {}, {}
+    for group, (path, columns) in sources.items():
+        df = read_typed(path).select_dtypes("number")
+        if columns is not None:
+            df = df[list(columns)].rename(columns=columns)
+        frames[group] = _to_utc(df)
+        groups[group] = [str(c) for c in df.columns]
+
+    start = min(f.index.min() for f in frames.values() if len(f))
+    end = max(f.index.max() for f in frames.values() if len(f))
+    index = pd.date_range(start.floor("h"), end.floor("h"), freq="h", name=TIME_COL)
+    columns = [c for cols in groups.values() for c in cols]
+    data = np.full((len(index), len(columns)), np.nan, dtype=np.float32)
+
+    j = 0
+    for group, df in frames.items():
+        gridded, _ = to_grid(df, "h", how="mean", origin=index[0])
+        data[:len(gridded), j:j + df.shape[1]] = gridded.to_numpy(np.float32)[:len(index)]
+        j += df.shape[1]
+
+    master = pd.DataFrame(data, index=index, columns=columns)
+    master_dir.mkdir(parents=True, exist_ok=True)
+    tmp = master_dir / (_DATA + ".tmp")
+    if feather is not None:
+        feather.write_feather(pa.Table.from_pandas(master.reset_index(), preserve_index=False), tmp)
+    else:
+        with open(tmp, "wb") as fh:
+            pickle.dump(master.reset_index(), fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, master_dir / _DATA)
+
+    meta = {"sources": hashes, "groups": groups, "rows": len(index),
+            "start": str(index[0]), "end": str(index[-1])}
+    with open(master_dir / _META, "w", encoding="utf-8") as fh:
+        json.dump(meta, fh, indent=1)
+    print(f"✅ Master table: {len(index)} hours × {len(columns)} series → {master_dir / _DATA}")
+    return master_dir / _DATA
+
+
+def master_groups(master_dir: Path = MASTER_DIR) -> dict:
+    """{group: [columns]} of the current master table, e.g. groups["types"]."""
+    build_master(master_dir)
+    return _read_meta(Path(master_dir))["groups"]
+
+
+def read_master(columns: list = None, start=None, end=None, local: bool = False,
+                master_dir: Path = MASTER_DIR) -> pd.DataFrame:
+    """
+    Columns of the master table for hours in [start, end), building it first if needed.
+    Only the requested columns are read from disk. Index is UTC, or naive local
+    wall-clock time (like the CSVs) with local=True.
+    """
+    path = build_master(master_dir)
+    if feather is not None:
+        table = feather.read_table(path, columns=None if columns is None else [TIME_COL] + list(columns),
+                                   memory_map=True)
+        df = table.to_pandas()
+    else:
+        with open(path, "rb") as fh:
+            df = pickle.load(fh)
+        if columns is not None:
+            df = df[[TIME_COL] + list(columns)]
+    df = df.set_index(TIME_COL)
+
+    if start is not None or end is not None:
+        i0 = 0 if start is None else df.index.searchsorted(_instant(start))
+        i1 = len(df) if end is None else df.index.searchsorted(_instant(end))
+        df = df.iloc[i0:i1]
+    if local:
+        df.index = df.index.tz_convert(LOCAL_TZ).tz_localize(None).rename("datetime")
+    return df
+
+
+if __name__ == "__main__":
+    # python master.py [--force]
+    path = build_master(force="--force" in sys.argv)
+    meta = _read_meta(MASTER_DIR)
+    print(f"{path}: {meta['rows']} hours, {meta['start']} → {meta['end']}")
+    for group, cols in meta["groups"].items():
+        print(f"  {group}: {', '.join(cols)}")
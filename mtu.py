@@ -0,0 +1,145 @@
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ENTSO-E MTU strings look like "dd/mm/YYYY HH:MM[:SS] [(CET|CEST)] - dd/mm/YYYY HH:MM[:SS] [(CET|CEST)]".
+# Only the interval start is needed downstream, and it always sits at a fixed offset,
+# so we decode it straight from the character codes instead of regex/split/strptime.
+
+# Local market time of the Spanish data (same CET/CEST rules as every ENTSO-E CET zone)
+LOCAL_TZ = "Europe/Madrid"
+
+# Widest start we need to look at: "dd/mm/YYYY HH:MM:SS (CEST)"
+_WIDTH = 26
+_NAT = np.iinfo(np.int64).min
+_NS_PER_S = 1_000_000_000
+
+
+def mtu_tz_for_column(col: str) -> str:
+    """Source timezone implied by an ENTSO-E time column name."""
+    return "UTC" if "UTC" in str(col) else LOCAL_TZ
+
+
+def _days_from_civil(y: np.ndarray, m: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """Days since 1970-01-01 for proleptic Gregorian dates (vectorized)."""
+    y = y - (m <= 2)
+    era = np.floor_divide(y, 400)
+    yoe = y - era * 400
+    doy = (153 * ((m + 9) % 12) + 2) // 5 + d - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _decode_fixed(strings: np.ndarray):
+    """
+    Decode the fixed-width interval start of each string.
+    Returns (wall-clock ns since epoch, is_cest, valid mask).
+    """
+    codes = strings.astype(f"U{_WIDTH}").view(np.uint32).reshape(len(strings), _WIDTH).astype(np.int64)
+    digits = codes - ord("0")
+
+    def num(a, b):
+        out = np.zeros(len(strings), dtype=np.int64)
+        for i in range(a, b):
+            out = out * 10 + digits[:, i]
+        return out
+
+    has_sec = codes[:, 16] == ord(":")
+    digit_pos = [0, 1, 3, 4, 6, 7, 8, 9, 11, 12, 14, 15]
+    valid = ((digits[:, digit_pos] >= 0) & (digits[:, digit_pos] <= 9)).all(axis=1)
+    valid &= (codes[:, 2] == ord("/")) & (codes[:, 5] == ord("/"))
+    valid &= (codes[:, 10] == ord(" ")) & (codes[:, 13] == ord(":"))
+    sec_ok = (digits[:, 17:19] >= 0).all(axis=1) & (digits[:, 17:19] <= 9).all(axis=1)
+    valid &= ~has_sec | sec_ok
+
+    d, m, y = num(0, 2), num(3, 5), num(6, 10)
+    hh, mm = num(11, 13), num(14, 16)
+    ss = np.where(has_sec, num(17, 19), 0)
+
+    m_safe = np.clip(m, 1, 12)
+    month_len = _days_from_civil(y + (m_safe == 12), m_safe % 12 + 1, 1) - _days_from_civil(y, m_safe, 1)
+    valid &= (m >= 1) & (m <= 12) & (d >= 1) & (d <= month_len)
+    valid &= (hh <= 23) & (mm <= 59) & (ss <= 59)
+
+    # " (CEST)" / " (CET)" right after the start, if present
+    p = np.where(has_sec, 19, 16)
+    rows = np.arange(len(strings))
+    is_cest = (
+        (codes[rows, np.minimum(p + 1, _WIDTH - 1)] == ord("("))
+        & (codes[rows, np.minimum(p + 4, _WIDTH - 1)] == ord("S"))
+    )
+
+    wall = (_days_from_civil(y, m_safe, 1) + d - 1) * 86400 + hh * 3600 + mm * 60 + ss
+    wall = np.where(valid, wall * _NS_PER_S, _NAT)
+    return wall, is_cest, valid
+
+
+def parse_mtu_start(values, tz: str = LOCAL_TZ, utc: bool = True) -> pd.DatetimeIndex:
+    """
+    Parse the interval start of ENTSO-E MTU strings.
+
+    Each distinct string is decoded once (files with many areas/types repeat
+    every interval), then broadcast back. With utc=True the result is tz-aware UTC,
+    using the (CET)/(CEST) suffixes to place the repeated fall-back hour correctly;
+    with utc=False the naive local wall-clock time is returned (the historic behaviour).
+    Unparseable entries become NaT.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, copy=False).astype(object), use_na_sentinel=True)
+    uniques = np.asarray(uniques, dtype=object)
+
+    wall, is_cest, valid = _decode_fixed(uniques)
+    if len(uniques) and not valid.any():
+        # Not MTU-shaped at all (e.g. an already-clean "datetime" column)
+        parsed = pd.to_datetime(pd.Series(uniques), format="mixed", errors="coerce")
+        wall = parsed.to_numpy("datetime64[ns]").view(np.int64)
+
+    local = pd.DatetimeIndex(wall.view("datetime64[ns]"))
+    if utc:
+        local = local.tz_localize(tz, ambiguous=is_cest, nonexistent="NaT").tz_convert("UTC")
+    uniq_i8 = local.asi8
+
+    out = np.where(codes >= 0, uniq_i8[np.maximum(codes, 0)], _NAT)
+    result = pd.DatetimeIndex(out.view("datetime64[ns]"))
+    return result.tz_localize("UTC") if utc else result
+
+
+# ---------- Benchmark ----------
+def _legacy_parse(s: pd.Series) -> pd.Series:
+    """The regex/split/to_datetime chain formerly used in DataPreProcessing.py."""
+    s = (
+        s.astype(str)
+        .str.replace(r"\s*\(CET\)|\s*\(CEST\)|\s*\(UTC\)", "", regex=True)
+        .str.split(" - ").str[0]
+        .str.strip()
+    )
+    return pd.to_datetime(s, format="%d/%m/%Y %H:%M", errors="coerce")
+
+
+def benchmark(years: int = 10, repeat: int = 3) -> None:
+    """Compare the legacy parser with parse_mtu_start on a multi-year 15-min MTU column."""
+    data_dir = Path("Load Data")
+    files = [data_dir / "TotalLoadDayAhead_15min_2023.csv", data_dir / "TotalLoadDayAhead_15min_2024.csv"]
+    base = pd.concat([pd.read_csv(f, usecols=["MTU (CET/CEST)"]) for f in files], ignore_index=True)["MTU (CET/CEST)"]
+    s = pd.concat([base] * max(1, years // 2), ignore_index=True)
+    print(f"Benchmarking on {len(s):,} MTU strings ({years} years of 15-min data)")
+
+    def best(fn):
+        times = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn(s)
+            times.append(time.perf_counter() - t0)
+        return min(times)
+
+    t_old = best(_legacy_parse)
+    t_wall = best(lambda x: parse_mtu_start(x, utc=False))
+    t_utc = best(parse_mtu_start)
+    print(f"  legacy regex/split : {t_old:8.3f} s")
+    print(f"  mtu (wall clock)   : {t_wall:8.3f} s  ({t_old / t_wall:5.1f}x)")
+    print(f"  mtu (UTC)          : {t_utc:8.3f} s  ({t_old / t_utc:5.1f}x)")
+
+
+if __name__ == "__main__":
+    benchmark()
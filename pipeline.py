@@ -0,0 +1,134 @@
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from frame_cache import content_hash
+from profiling import stage
+
+# Where each stage's last successful fingerprint is kept
+STATE_FILE = Path(os.environ.get("PIPELINE_STATE_FILE", ".pipeline_state.json"))
+
+
+@dataclass
+class Stage:
+    """
+    One step of a file-based pipeline.
+    `fn(prev)` is called with the stage's previous fingerprint (or None) so it can
+    work incrementally; whatever it returns is kept as prev["state"] for the next run
+    (e.g. byte offsets to resume from). Dependencies follow from shared file paths.
+    """
+    name: str
+    fn: Callable
+    inputs: list
+    outputs: list
+    params: dict = field(default_factory=dict)
+
+
+def load_state(path: Path = STATE_FILE) -> dict:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(state: dict, path: Path = STATE_FILE) -> None:
+    tmp = Path(str(path) + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(state, fh, indent=1)
+    os.replace(tmp, path)
+
+
+def _hashes(paths: list) -> dict:
+    """Ordered {path: content hash}; missing files hash to None."""
+    return {str(p): (content_hash(p) if Path(p).exists() else None) for p in paths}
+
+
+def tail_offset(path: Path, rows: int = 1) -> int:
+    """Byte offset where the last `rows` lines of a CSV start; never before the end of its header line."""
+    with open(path, "rb") as fh:
+        header_end = len(fh.readline())
+        end = fh.seek(0, os.SEEK_END)
+        if end <= header_end:
+            return end
+        fh.seek(end - 1)
+        need = rows + (fh.read(1) == b"\n")  # a trailing newline ends the last row, it does not start one
+        pos = end
+        while pos > header_end:
+            size = min(1 << 16, pos - header_end)
+            pos -= size
+            fh.seek(pos)
+            block = fh.read(size)
+            i = len(block)
+            while need:
+                i = block.rfind(b"\n", 0, i)
+                if i < 0:
+                    break
+                need -= 1
+            if not need:
+                return pos + i + 1
+    return header_end
+
+
+def truncate(path: Path, size: int) -> None:
+    """Cut a file back to its first `size` bytes (drop rows that are about to be rewritten)."""
+    with open(path, "r+b") as fh:
+        fh.truncate(size)
+
+
+def _toposort(stages: list) -> list:
+    """Order stages so that every producer runs before its consumers."""
+    producer = {}
+    for st in stages:
+        for out in st.outputs:
+            producer[str(out)] = st.name
+    deps = {st.name: {producer[str(i)] for i in st.inputs if str(i) in producer} - {st.name} for st in stages}
+
+    by_name = {st.name: st for st in stages}
+    ordered, done = [], set()
+    while len(ordered) < len(stages):
+        ready = [st for st in stages if st.name not in done and deps[st.name] <= done]
+        if not ready:
+            raise ValueError(f"Cycle between pipeline stages: {sorted(set(by_name) - done)}")
+        for st in ready:
+            ordered.append(st)
+            done.add(st.name)
+    return ordered
+
+
+def run_pipeline(stages: list, state_path: Path = STATE_FILE, force: bool = False) -> dict:
+    """
+    Run stages in dependency order, skipping any whose inputs, params and outputs
+    are unchanged since its last successful run. Returns {stage name: ran?}.
+    """
+    state = load_state(state_path)
+    ran = {}
+
+    for st in _toposort(stages):
+        prev = state.get(st.name)
+        fingerprint = {"inputs": _hashes(st.inputs), "params": repr(sorted(st.params.items()))}
+
+        up_to_date = (
+            not force
+            and prev is not None
+            and prev["inputs"] == fingerprint["inputs"]
+            and prev["params"] == fingerprint["params"]
+            and prev["outputs"] == _hashes(st.outputs)
+        )
+        if up_to_date:
+            print(f"⏭️  {st.name}: inputs unchanged, skipped.")
+            ran[st.name] = False
+            continue
+
+        with stage(st.name):
+            result = st.fn(None if force else prev)  # forced: no previous state to resume from
+        if result is not None:
+            fingerprint["state"] = result
+        fingerprint["outputs"] = _hashes(st.outputs)
+        state[st.name] = fingerprint
+        save_state(state, state_path)  # persist after every stage so a crash keeps finished work
+        ran[st.name] = True
+
+    return ran
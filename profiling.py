@@ -0,0 +1,221 @@
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, peak memory is reported as None
+    resource = None
+
+# Always-on stage instrumentation: wall/CPU time, memory and rows in/out per stage,
+# a few microseconds of overhead each. Per-stage memory is how far the stage raised the
+# process peak RSS (peak_growth; 0 for a stage that stayed below an earlier peak) and,
+# in deep mode, its tracemalloc peak (py_peak). peak_rss is the process-lifetime peak
+# when the stage ended, reported as "proc MB".
+# Deep profiling (cProfile + tracemalloc) is opt-in:
+#   PROFILE=0              -> disable instrumentation entirely
+#   PROFILE_DEEP=<stage>   -> cProfile + tracemalloc for that stage
+#   PROFILE_DEEP=auto      -> ... for the slowest stage of the previous report
+PROFILE_DIR = Path(os.environ.get("PROFILE_DIR", "profiles"))
+ENABLED = os.environ.get("PROFILE", "1") != "0"
+DEEP = os.environ.get("PROFILE_DEEP", "")
+
+# ru_maxrss is KiB on Linux, bytes on macOS
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss() -> int:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+
+
+def _rows(obj):
+    """len() of frames/series/arrays, None for anything else."""
+    if hasattr(obj, "shape") and getattr(obj, "ndim", 0) >= 1:
+        return int(obj.shape[0])
+    return None
+
+
+def _last_report() -> dict:
+    reports = sorted(PROFILE_DIR.glob("run_*.json"))
+    if not reports:
+        return {}
+    with open(reports[-1], encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+class StageRecord:
+    """Measurements of one stage call; set rows_in/rows_out from inside a `with stage(...)` block."""
+
+    def __init__(self, name: str, parent: str = None, rows_in: int = None):
+        self.name = name
+        self.parent = parent
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.wall_s = self.cpu_s = 0.0
+        self.peak_rss = self.peak_growth = self.py_peak = None
+        self.error = None
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+
+class Profiler:
+    """Collects StageRecords for one run and writes them as a JSON report."""
+
+    def __init__(self, enabled: bool = ENABLED, deep: str = DEEP):
+        self.enabled = enabled
+        self.records = []
+        self._stack = []
+        self._deep = deep
+        self._deep_done = False
+        self.started = datetime.now()
+
+    def _deep_target(self) -> str:
+        if self._deep == "auto":
+            summary = _last_report().get("summary", [])
+            top = [s for s in summary if s.get("parent") is None] or summary
+            self._deep = max(top, key=lambda s: s["wall_s"])["stage"] if top else ""
+        return self._deep
+
+    @contextmanager
+    def stage(self, name: str, rows_in: int = None):
+        """Time the enclosed block as stage `name`."""
+        rec = StageRecord(name, self._stack[-1].name if self._stack else None, rows_in)
+        if not self.enabled:
+            yield rec
+            return
+
+        deep = not self._deep_done and name == self._deep_target()
+        prof = None
+        if deep:
+            self._deep_done = True  # first call only: later calls stay cheap
+            prof = cProfile.Profile()
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            prof.enable()
+
+        self._stack.append(rec)
+        rss0 = _peak_rss()
+        c0, t0 = time.process_time(), time.perf_counter()
+        try:
+            yield rec
+        except BaseException as exc:
+            rec.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            rec.wall_s = time.perf_counter() - t0
+            rec.cpu_s = time.process_time() - c0
+            rec.peak_rss = _peak_rss()
+            rec.peak_growth = rec.peak_rss - rss0 if rss0 is not None else None
+            self._stack.pop()
+            if prof is not None:
+                prof.disable()
+                rec.py_peak = tracemalloc.get_traced_memory()[1]
+                self._dump_deep(name, prof, tracemalloc.take_snapshot())
+                tracemalloc.stop()
+            self.records.append(rec)
+
+    def wrap(self, fn=None, name: str = None):
+        """Decorator form of stage(); rows in/out come from the first argument and the return value."""
+        if fn is None:
+            return functools.partial(self.wrap, name=name)
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            with self.stage(label, _rows(args[0]) if args else None) as rec:
+                out = fn(*args, **kwargs)
+                rec.rows_out = _rows(out)
+                return out
+        return wrapper
+
+    def _dump_deep(self, name: str, prof, snapshot) -> None:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        safe = "".join(c if c.isalnum() else "_" for c in name)
+        prof.dump_stats(PROFILE_DIR / f"{safe}.prof")
+        text = io.StringIO()
+        pstats.Stats(prof, stream=text).sort_stats("cumulative").print_stats(25)
+        text.write("\nTop allocations (tracemalloc):\n")
+        for stat in snapshot.statistics("lineno")[:15]:
+            text.write(f"{stat}\n")
+        with open(PROFILE_DIR / f"{safe}_profile.txt", "w", encoding="utf-8") as fh:
+            fh.write(text.getvalue())
+        print(f"🔍 Deep profile of '{name}' → {PROFILE_DIR / (safe + '_profile.txt')}")
+
+    def summary(self) -> list:
+        """Per-stage totals (all calls of the same stage name summed), slowest first."""
+        agg = {}
+        for r in self.records:
+            s = agg.setdefault(r.name, {
+                "stage": r.name, "parent": r.parent, "calls": 0, "wall_s": 0.0, "cpu_s": 0.0,
+                "rows_in": 0, "rows_out": 0, "peak_growth": 0, "py_peak": None, "peak_rss": 0, "errors": 0,
+            })
+            s["calls"] += 1
+            s["wall_s"] += r.wall_s
+            s["cpu_s"] += r.cpu_s
+            s["rows_in"] += r.rows_in or 0
+            s["rows_out"] += r.rows_out or 0
+            s["peak_growth"] = max(s["peak_growth"], r.peak_growth or 0)
+            if r.py_peak is not None:
+                s["py_peak"] = max(s["py_peak"] or 0, r.py_peak)
+            s["peak_rss"] = max(s["peak_rss"], r.peak_rss or 0)
+            s["errors"] += r.error is not None
+        return sorted(agg.values(), key=lambda s: -s["wall_s"])
+
+    def report(self, run_name: str = "run", print_table: bool = True) -> Path:
+        """Write profiles/run_<timestamp>_<run_name>.json and print the summary table."""
+        if not self.enabled or not self.records:
+            return None
+        summary = self.summary()
+        report = {
+            "run": run_name,
+            "started": self.started.isoformat(timespec="seconds"),
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "argv": sys.argv,
+            "summary": summary,
+            "stages": [r.to_dict() for r in self.records],
+        }
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        path = PROFILE_DIR / f"run_{self.started:%Y%m%d_%H%M%S}_{run_name}.json"
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=1)
+
+        if print_table:
+            # +peak MB: growth of the process peak during the stage; py MB: tracemalloc peak (deep
+            # stage only); proc MB: process-lifetime peak, which never goes down
+            print(f"\n{'stage':36s} {'calls':>5s} {'wall s':>8s} {'cpu s':>8s} {'rows in':>11s} {'rows out':>11s} "
+                  f"{'+peak MB':>8s} {'py MB':>7s} {'proc MB':>8s}")
+            for s in summary:
+                label = ("  " if s["parent"] else "") + s["stage"]
+                py = "-" if s["py_peak"] is None else f"{s['py_peak'] / 2**20:.0f}"
+                print(f"{label[:36]:36s} {s['calls']:5d} {s['wall_s']:8.3f} {s['cpu_s']:8.3f} "
+                      f"{s['rows_in']:11,d} {s['rows_out']:11,d} {s['peak_growth'] / 2**20:8.0f} {py:>7s} "
+                      f"{s['peak_rss'] / 2**20:8.0f}")
+            print(f"✅ Profile report saved: {path}")
+        return path
+
+
+# Process-wide profiler used by the pipeline scripts
+PROFILER = Profiler()
+stage = PROFILER.stage
+instrument = PROFILER.wrap
+report = PROFILER.report
+
+
+def profiled(fn, name: str = None):
+    """Instrumented version of a third-party callable, e.g. savefig = profiled(plt.savefig)."""
+    return instrument(fn, name=name or getattr(fn, "__name__", "call"))
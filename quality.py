@@ -0,0 +1,411 @@
+import argparse
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from mtu import LOCAL_TZ, mtu_tz_for_column, parse_mtu_start
+from rollups import DEFAULT_AREA
+from schemas import SCHEMAS, detect_schema, to_float32
+
+# Data-quality pass for load and generation inputs. A file is read chunk by chunk as text
+# into flat arrays (series id, time, value); everything after that is one sort by
+# (series, time) and array arithmetic over all series together:
+#   bad_time / bad_value   timestamps or MW values that do not parse (rows the cleaning
+#                          steps would silently drop or turn into NaN)
+#   duplicates / gaps      repeated and missing slots on the file's own grid (15-min or hourly)
+#   missing_values         present slots without a value ("", N/A, n/e)
+#   stuck                  runs of the same non-zero value lasting ≥ STUCK_HOURS
+#   negative / out_of_range  MW below 0 or outside the series limits
+#   spike                  robust z-score (median/MAD) against the series' hour-of-week profile
+# MTU files are checked on their UTC grid, so DST changes are neither gaps nor duplicates
+# (unmarked fall-back hours are placed by file order, see _place_unmarked);
+# already-hourly files with naive local times are checked on their wall-clock grid.
+# Every series of a file is checked against one common span (by default the whole calendar
+# years the file touches), so data missing at the start or end of a series is a gap too.
+QUALITY_DIR = Path(os.environ.get("QUALITY_DIR", "quality"))
+COVERAGE_FILE = "coverage.csv"
+
+CHUNK_SIZE = 500_000
+# "year": whole calendar years of the file's data, "file": first to last timestamp of any series
+PERIOD = "year"
+NA_MARKERS = ("", "N/A", "n/e", "NaN", "nan", "-")
+
+STUCK_HOURS = 6
+MAX_MW = 200_000.0
+Z_MAX = 8.0
+MIN_PROFILE = 8  # samples an hour-of-week cell needs before spikes are judged against it
+MAD_FLOOR = 0.01  # MAD never below 1% of the series' median |MW| (flat night-time solar etc.)
+
+_TYPE_COLUMNS = ("Production Type", "Production_Type")
+_AREA_COLUMNS = ("Area", "Country_Area")
+_COUNTS = ("duplicates", "missing_slots", "missing_values", "stuck", "negative", "out_of_range", "spikes")
+
+
+def _place_unmarked(times: pd.DatetimeIndex, text: np.ndarray, series: pd.DataFrame, seen: set) -> pd.DatetimeIndex:
+    """
+    MTU strings without a (CET)/(CEST) suffix (e.g. TotalGen.csv) put both fall-back hours
+    on the second, CET instant. Per series (area/type columns), the first time such a wall
+    time appears in file order is the earlier CEST hour, so it is moved back there.
+    """
+    wall = times.tz_convert(LOCAL_TZ).tz_localize(None)
+    cest = wall.tz_localize(LOCAL_TZ, ambiguous=np.ones(len(wall), dtype=bool), nonexistent="NaT")
+    cest = cest.tz_convert("UTC").as_unit(times.unit)
+    rows = np.flatnonzero(np.asarray(cest != times) & ~np.asarray(times.isna()))  # ambiguous, placed on CET
+    if not len(rows):
+        return times
+    i8 = times.asi8.copy()
+    for r in rows:
+        if "(CE" in text[r]:
+            continue  # marked: already on the right instant
+        key = (tuple(series.iloc[r]), wall[r])
+        if key not in seen:
+            seen.add(key)
+            i8[r] = cest.asi8[r]
+    return pd.DatetimeIndex(i8.view(f"datetime64[{times.unit}]")).tz_localize("UTC")
+
+
+def _read(path: Path, area: str, chunksize: int) -> tuple:
+    """
+    Flat arrays of a whole file: (labels, key, seconds, hour of week, value, row, bad-time rows,
+    bad-value mask, schema, utc grid?). Only numeric arrays are kept between chunks.
+    """
+    schema = detect_schema(pd.read_csv(path, nrows=0).columns)
+    if schema is None:
+        raise ValueError(f"No registered schema matches the columns of {path.name}")
+    spec = SCHEMAS[schema]
+    labels, ids = [], {}
+    parts = {k: [] for k in ("key", "t", "how", "v", "row", "bad")}
+    bad_time = []
+    offset = 0
+    seen = set()  # (series, wall time) of unmarked fall-back hours already placed
+    for chunk in pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=False):
+        rows = np.arange(offset, offset + len(chunk)) + 2  # CSV line numbers (header is line 1)
+        offset += len(chunk)
+        time_col = next(c for c in spec["time"] if c in chunk.columns)
+        area_col = next((c for c in _AREA_COLUMNS if c in chunk.columns), None)
+        type_col = next((c for c in _TYPE_COLUMNS if c in chunk.columns), None)
+        text = chunk[time_col].str.strip()
+        if spec["time_kind"] == "mtu":
+            times = parse_mtu_start(text, tz=mtu_tz_for_column(time_col), utc=True)
+            if mtu_tz_for_column(time_col) != "UTC":
+                times = _place_unmarked(times, text.to_numpy(), chunk[[c for c in (area_col, type_col) if c]], seen)
+            local = times.tz_convert(LOCAL_TZ)
+        else:
+            times = local = pd.DatetimeIndex(pd.to_datetime(text, errors="coerce", format="mixed"))
+        nat = np.asarray(times.isna())
+        bad_time.extend(zip(rows[nat], text.to_numpy()[nat]))
+        ok = ~nat
+        t = times[ok].as_unit("s").asi8
+        how = (local[ok].dayofweek * 24 + local[ok].hour).to_numpy(np.int16)
+
+        areas = chunk[area_col].to_numpy()[ok] if area_col else np.full(ok.sum(), area, dtype=object)
+        a_codes, a_uniques = pd.factorize(areas)
+        values = spec["values"] or [c for c in chunk.columns if c not in (time_col, area_col)]
+        if type_col:
+            columns = [(values[0], chunk[type_col].to_numpy()[ok])]
+        else:
+            columns = [(c, np.full(ok.sum(), c, dtype=object)) for c in values]
+
+        for col, series in columns:
+            raw = chunk[col].str.strip().str.strip('"').to_numpy()[ok]
+            v = to_float32(pd.Series(raw)).to_numpy(np.float64)
+            s_codes, s_uniques = pd.factorize(series)
+            codes, pairs = pd.factorize(a_codes.astype(np.int64) * len(s_uniques) + s_codes)
+            remap = np.empty(len(pairs), dtype=np.int32)
+            for j, pair in enumerate(pairs):
+                label = (str(a_uniques[pair // len(s_uniques)]), str(s_uniques[pair % len(s_uniques)]))
+                if label not in ids:
+                    ids[label] = len(labels)
+                    labels.append(label)
+                remap[j] = ids[label]
+            parts["key"].append(remap[codes])
+            parts["t"].append(t)
+            parts["how"].append(how)
+            parts["v"].append(v)
+            parts["row"].append(rows[ok])
+            parts["bad"].append(np.isnan(v) & ~np.isin(raw, NA_MARKERS))
+
+    arrays = {k: np.concatenate(p) if p else np.empty(0) for k, p in parts.items()}
+    return labels, arrays, bad_time, schema, spec["time_kind"] == "mtu"
+
+
+def _group_median(values: np.ndarray, groups: np.ndarray, n_groups: int) -> tuple:
+    """
+    (median, count) of `values` per group id; empty groups get NaN. One plain float sort:
+    each group is shifted into its own band (group·span + value), so no argsort is needed.
+    """
+    count = np.bincount(groups, minlength=n_groups)
+    med = np.full(n_groups, np.nan)
+    if not len(values):
+        return med, count
+    lo_v = values.min()
+    span = values.max() - lo_v + 1.0
+    sv = np.sort(groups * span + (values - lo_v))
+    start = np.r_[0, np.cumsum(count)[:-1]]
+    has = count > 0
+    lo, hi = start[has] + (count[has] - 1) // 2, start[has] + count[has] // 2
+    base = np.flatnonzero(has) * span - lo_v
+    med[has] = (sv[lo] + sv[hi]) / 2 - base
+    return med, count
+
+
+def _runs(brk: np.ndarray) -> tuple:
+    """(run start positions, run lengths) for a boolean 'new run starts here' array."""
+    starts = np.flatnonzero(brk)
+    return starts, np.diff(np.r_[starts, len(brk)])
+
+
+def check_arrays(labels: list, a: dict, limits: dict = None, step: int = None, span: tuple = None) -> tuple:
+    """
+    Run every check over the flat arrays of one file. Returns (series frame, issues frame,
+    step in seconds). `limits` maps a series name to its (low, high) MW range. Every series
+    is expected on one grid from the earliest to the latest timestamp of the file, widened
+    to `span` (start, end) in seconds when given.
+    """
+    limits = limits or {}
+    n_keys = len(labels)
+    order = np.lexsort((a["t"], a["key"]))
+    key, t, how, v, row = (a[k][order] for k in ("key", "t", "how", "v", "row"))
+    n = len(key)
+    first = np.r_[True, key[1:] != key[:-1]] if n else np.zeros(0, bool)
+    if step is None:
+        d = np.diff(t)[~first[1:]]
+        d = d[d > 0]
+        step = int(np.median(d)) if len(d) else 3600
+
+    # one grid for all series: [t_lo, t_hi) in slots of `step`
+    t_lo, t_hi = (int(t.min()), int(t.max()) + step) if n else (0, 0)
+    if span is not None:
+        t_lo, t_hi = min(t_lo, int(span[0])), max(t_hi, int(span[1]))
+    n_slots = -(-(t_hi - t_lo) // step)
+    slot = (t - t_lo) // step
+    same = ~first & np.r_[False, slot[1:] == slot[:-1]]
+    expected = np.full(n_keys, n_slots, dtype=np.int64)
+    last = np.r_[np.flatnonzero(first)[1:] - 1, n - 1] if n else np.zeros(0, np.int64)
+
+    finite = ~np.isnan(v)
+    neg = finite & (v < 0)
+    lo = np.array([limits.get(s, (0.0, MAX_MW))[0] for _, s in labels])
+    hi = np.array([limits.get(s, (0.0, MAX_MW))[1] for _, s in labels])
+    out = finite & ~neg & ((v < lo[key]) | (v > hi[key])) if n else neg
+
+    # covered slots: distinct (series, slot) with at least one value
+    fk, fs = key[finite], slot[finite]
+    new_slot = np.r_[True, (fk[1:] != fk[:-1]) | (fs[1:] != fs[:-1])] if len(fk) else np.zeros(0, bool)
+    covered = np.bincount(fk[new_slot], minlength=n_keys)
+
+    issues = []
+
+    def add(kind, idx, start, end, count, value):
+        """One issue row per position in `idx` (row = CSV line of that sample)."""
+        issues.append(pd.DataFrame({"kind": kind, "key": key[idx], "start": start, "end": end, "n": count,
+                                    "value": value, "row": row[idx]}))
+
+    # gaps: consecutive rows of a series more than one slot apart, plus missing slots
+    # before a series' first and after its last row
+    jump = np.r_[0, np.diff(slot)] if n else slot
+    gap = ~first & (jump > 1)
+    g = np.flatnonzero(gap)
+    add("gap", g, t[g] - (jump[g] - 1) * step, t[g], jump[g] - 1, np.nan)
+    f = np.flatnonzero(first)
+    lead = f[slot[f] > 0]
+    add("gap", lead, np.full(len(lead), t_lo), t[lead], slot[lead], np.nan)
+    tail = last[slot[last] < n_slots - 1]
+    add("gap", tail, t[tail] + step, np.full(len(tail), t_lo + n_slots * step), n_slots - 1 - slot[tail], np.nan)
+    edge_gaps = np.r_[lead, tail]
+    edge_len = np.r_[slot[lead], n_slots - 1 - slot[tail]]
+
+    # stuck: runs of one non-zero value on consecutive slots (duplicate rows left out)
+    u = np.flatnonzero(~same)
+    uv = v[u]
+    brk = first[u] | (jump[u] != 1) | np.r_[True, uv[1:] != uv[:-1]]  # NaN != NaN, so NaN never runs
+    starts, lengths = _runs(brk)
+    min_len = max(int(np.ceil(STUCK_HOURS * 3600 / step)), 2)
+    stuck = (lengths >= min_len) & (uv[starts] != 0) & ~np.isnan(uv[starts])
+    s0, s1 = u[starts[stuck]], u[starts[stuck] + lengths[stuck] - 1]
+    add("stuck", s0, t[s0], t[s1] + step, lengths[stuck], v[s0])
+    stuck_rows = np.bincount(key[s0], weights=lengths[stuck], minlength=n_keys).astype(np.int64)
+
+    # spikes: robust z against the median/MAD of the series' hour-of-week cell
+    cell = key.astype(np.int64) * 168 + how
+    fv, fc = v[finite], cell[finite]
+    med, count = _group_median(fv, fc, n_keys * 168)
+    mad, _ = _group_median(np.abs(fv - med[fc]), fc, n_keys * 168)
+    scale, _ = _group_median(np.abs(fv), key[finite].astype(np.int64), n_keys)
+    mad = np.maximum(mad, MAD_FLOOR * np.repeat(scale, 168))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = 0.6745 * (v - med[cell]) / mad[cell]
+    spike = finite & (count[cell] >= MIN_PROFILE) & (np.abs(z) > Z_MAX)
+
+    bad = a["bad"][order]
+    for kind, mask, value in (("duplicate", same, v), ("missing_value", ~finite & ~bad, v), ("bad_value", bad, v),
+                              ("negative", neg, v), ("out_of_range", out, v), ("spike", spike, np.round(z, 1))):
+        i = np.flatnonzero(mask)
+        add(kind, i, t[i], t[i] + step, 1, value[i])
+    issues = pd.concat(issues, ignore_index=True)
+
+    def per_key(mask):
+        return np.bincount(key[mask], minlength=n_keys)
+
+    first_t = np.full(n_keys, np.iinfo(np.int64).min)
+    last_t = np.full(n_keys, np.iinfo(np.int64).min)
+    first_t[key[first]], last_t[key[first]] = t[first], t[last]
+    longest = np.zeros(n_keys, np.int64)
+    np.maximum.at(longest, key[g], jump[g] - 1)
+    np.maximum.at(longest, key[edge_gaps], edge_len)
+    series = pd.DataFrame({
+        "area": [a_ for a_, _ in labels],
+        "series": [s_ for _, s_ in labels],
+        "start": first_t,
+        "end": last_t + step,
+        "expected": expected,
+        "rows": np.bincount(key, minlength=n_keys),
+        "covered": covered,
+        "coverage": np.where(expected > 0, covered / np.maximum(expected, 1), np.nan),
+        "duplicates": per_key(same),
+        "missing_slots": expected - (np.bincount(key, minlength=n_keys) - per_key(same)),
+        "gaps": per_key(gap) + np.bincount(key[edge_gaps], minlength=n_keys),
+        "longest_gap_h": longest * step / 3600,
+        "missing_values": per_key(~finite),
+        "stuck": stuck_rows,
+        "negative": per_key(neg),
+        "out_of_range": per_key(out),
+        "spikes": per_key(spike),
+    })
+    return series, issues, step
+
+
+def _to_local(seconds, utc: bool) -> pd.DatetimeIndex:
+    """Report times as naive local wall clock, like every other output of the repo."""
+    s = pd.Series(seconds)
+    idx = pd.DatetimeIndex(pd.to_datetime(s.where(s != np.iinfo(np.int64).min), unit="s"))
+    return idx.tz_localize("UTC").tz_convert(LOCAL_TZ).tz_localize(None) if utc else idx
+
+
+def _span(period, t: np.ndarray, utc: bool) -> tuple:
+    """
+    Expected (start, end) in grid seconds: None for "file", the calendar years (local time)
+    of the data for "year", or an explicit (start, end) of local times.
+    """
+    if period == "file" or not len(t):
+        return None
+    if period == "year":
+        first, last = _to_local([t.min(), t.max()], utc)
+        bounds = [pd.Timestamp(first.year, 1, 1), pd.Timestamp(last.year + 1, 1, 1)]
+    else:
+        bounds = [pd.Timestamp(p) for p in period]
+    idx = pd.DatetimeIndex(bounds)
+    if utc:
+        idx = idx.tz_localize(LOCAL_TZ).tz_convert("UTC")
+    return tuple(idx.as_unit("s").asi8)
+
+
+def check_file(path, area: str = DEFAULT_AREA, limits: dict = None, chunksize: int = CHUNK_SIZE,
+               period=PERIOD) -> tuple:
+    """
+    Quality-check one load/generation CSV. Returns (summary dict, per-series frame,
+    issues frame with one row per gap, stuck run or flagged sample). `period` is the span
+    every series is expected to cover: "year", "file" or a (start, end) pair of local times.
+    """
+    path = Path(path)
+    t_start = time.perf_counter()
+    labels, arrays, bad_time, schema, utc = _read(path, area, chunksize)
+    span = _span(period, arrays["t"], utc)
+    series, issues, step = check_arrays(labels, arrays, limits, span=span)
+
+    keys = issues.pop("key").to_numpy()
+    issues.insert(1, "area", [labels[k][0] for k in keys])
+    issues.insert(2, "series", [labels[k][1] for k in keys])
+    issues["start"] = _to_local(issues["start"], utc)
+    issues["end"] = _to_local(issues["end"], utc)
+    bad = pd.DataFrame({"kind": "bad_time", "area": area, "series": None, "start": pd.NaT, "end": pd.NaT,
+                        "n": 1, "value": np.nan, "row": [r for r, _ in bad_time], "text": [x for _, x in bad_time]})
+    issues = pd.concat([bad, issues], ignore_index=True) if len(bad) else issues.assign(text=None)
+    series["start"] = _to_local(series["start"], utc)
+    series["end"] = _to_local(series["end"], utc)
+
+    flagged = {c: int(series[c].sum()) for c in _COUNTS}
+    summary = {
+        "file": path.name,
+        "schema": schema,
+        "rows": int(series["rows"].sum()) + len(bad_time),
+        "series": len(series),
+        "step_min": step / 60,
+        "grid": "utc" if utc else "local",
+        "start": str(series["start"].min()),
+        "end": str(series["end"].max()),
+        "period": str(period) if span is None else f"{_to_local([span[0]], utc)[0]} – {_to_local([span[1]], utc)[0]}",
+        "expected": int(series["expected"].sum()),
+        "coverage": float(series["covered"].sum() / max(series["expected"].sum(), 1)),
+        "bad_time": len(bad_time),
+        "bad_value": int((issues["kind"] == "bad_value").sum()),
+        **flagged,
+        "seconds": round(time.perf_counter() - t_start, 3),
+    }
+    return summary, series, issues
+
+
+def write_reports(summary: dict, series: pd.DataFrame, issues: pd.DataFrame, out_dir: Path = QUALITY_DIR) -> tuple:
+    """
+    Write <stem>_series.csv and <stem>_issues.csv, and update the file's row in
+    coverage.csv (one row per checked file). Returns the two per-file paths.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(summary["file"]).stem
+    series_path, issues_path = out_dir / f"{stem}_series.csv", out_dir / f"{stem}_issues.csv"
+    series.to_csv(series_path, index=False)
+    issues.to_csv(issues_path, index=False)
+
+    cov_path = out_dir / COVERAGE_FILE
+    cov = pd.read_csv(cov_path) if cov_path.exists() else pd.DataFrame(columns=list(summary))
+    cov = cov[cov["file"] != summary["file"]]
+    cov = pd.concat([cov, pd.DataFrame([summary])], ignore_index=True) if len(cov) else pd.DataFrame([summary])
+    cov.sort_values("file").to_csv(cov_path, index=False)
+    return series_path, issues_path
+
+
+def print_summary(summary: dict) -> None:
+    flagged = {k: summary[k] for k in ("bad_time", "bad_value") + _COUNTS if summary[k]}
+    line = f"{summary['file']}: {summary['coverage']:.2%} coverage of {summary['expected']:,} slots"
+    if flagged:
+        print(f"⚠️ {line}; " + ", ".join(f"{k}={v:,}" for k, v in flagged.items()))
+    else:
+        print(f"✅ {line}; no issues.")
+
+
+def default_inputs() -> list:
+    """Raw load sources of DataPreProcessing plus the generation inputs that exist here."""
+    from DataPreProcessing import SOURCES
+
+    paths = [p for p, _, _ in SOURCES]
+    paths += sorted(Path("generation_by_type").glob("*.csv"))
+    paths += [Path(p) for p in ("TotalLoad_DayAhead.csv", "TotalGen.csv")]
+    return [p for p in paths if p.exists()]
+
+
+def check_files(paths: list = None, area: str = DEFAULT_AREA, out_dir: Path = QUALITY_DIR,
+                period=PERIOD) -> pd.DataFrame:
+    """Check and report every file; returns the summaries as a frame."""
+    rows = []
+    for path in paths or default_inputs():
+        summary, series, issues = check_file(path, area, period=period)
+        write_reports(summary, series, issues, out_dir)
+        print_summary(summary)
+        rows.append(summary)
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Data-quality, gap and anomaly report for load/generation inputs.")
+    parser.add_argument("files", nargs="*", type=Path, help="defaults to the known raw load and generation inputs")
+    parser.add_argument("--area", default=DEFAULT_AREA, help="area for files without an area column")
+    parser.add_argument("--out", type=Path, default=QUALITY_DIR)
+    parser.add_argument("--period", nargs="+", default=[PERIOD], metavar="SPAN",
+                        help="'year', 'file' or START END (local times) every series should cover")
+    args = parser.parse_args()
+    check_files(args.files, args.area, args.out, args.period[0] if len(args.period) == 1 else tuple(args.period))
+    print(f"✅ Coverage report → {args.out / COVERAGE_FILE}")
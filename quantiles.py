@@ -0,0 +1,301 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from mtu import mtu_tz_for_column, parse_mtu_start
+from rollups import DEFAULT_AREA
+from schemas import SCHEMAS, detect_schema
+
+# Mergeable quantile sketches (t-digest) per (area, series, hour of day, month). All keys
+# live in one flat centroid table (key id, mean, weight) that is compressed in a single
+# vectorized pass: sort by (key, mean), map each point's cumulative quantile through the
+# t-digest scale function k(q) = δ/2π·asin(2q-1) and merge points that share ⌊k⌋. Each key
+# keeps at most about δ/2 centroids whatever the input size, tails stay nearly exact, and
+# sketches built from separate chunks, files or processes merge by concatenation.
+SKETCH_DIR = Path(os.environ.get("SKETCH_DIR", ".quantile_sketches"))
+COMPRESSION = 200
+
+# Rows per CSV chunk when sketching a file; memory depends on this, not the file size
+CHUNK_SIZE = 500_000
+# Buffered points before a compress pass
+BUFFER = 1_000_000
+
+KEY_FIELDS = ("area", "series", "hour", "month")
+_TYPE_COLUMNS = ("Production Type", "Production_Type")
+_AREA_COLUMNS = ("Area", "Country_Area")
+
+
+def _k(q: np.ndarray, compression: float) -> np.ndarray:
+    return compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0.0, 1.0) - 1) + compression / 4
+
+
+def _compress(key: np.ndarray, mean: np.ndarray, weight: np.ndarray, compression: float) -> tuple:
+    """Merge points/centroids of every key into t-digest centroids; returns sorted (key, mean, weight)."""
+    if not len(key):
+        return key, mean, weight
+    order = np.lexsort((mean, key))
+    key, mean, weight = key[order], mean[order], weight[order]
+
+    first = np.r_[True, key[1:] != key[:-1]]
+    group = np.cumsum(first) - 1
+    cum = np.cumsum(weight)
+    left = cum - weight
+    base = left[first][group]
+    total = (cum[np.r_[np.flatnonzero(first)[1:] - 1, len(cum) - 1]])[group] - base
+    cid = np.floor(_k((left - base) / total, compression)).astype(np.int64)
+
+    new = first | np.r_[True, cid[1:] != cid[:-1]]
+    starts = np.flatnonzero(new)
+    w = np.add.reduceat(weight, starts)
+    m = np.add.reduceat(weight * mean, starts) / w
+    return key[starts], m, w
+
+
+def _quantiles(mean: np.ndarray, weight: np.ndarray, lo: float, hi: float, qs) -> np.ndarray:
+    """Quantiles from centroids sorted by mean: interpolate between centroid centres, exact min/max at the ends."""
+    qs = np.asarray(qs, dtype=np.float64)
+    if not len(mean):
+        return np.full(qs.shape, np.nan)
+    order = np.argsort(mean, kind="stable")
+    mean, weight = mean[order], weight[order]
+    total = weight.sum()
+    centres = np.cumsum(weight) - weight / 2
+    return np.interp(qs * total, np.r_[0.0, centres, total], np.r_[lo, mean, hi])
+
+
+class QuantileSketches:
+    """
+    t-digest sketches for many (area, series, hour, month) keys.
+
+        sk = QuantileSketches()
+        sk.add(hourly_frame, area="ES")         # any number of times, any chunking
+        sk.merge(other)                         # e.g. from another file or worker
+        sk.bands("Actual Total Load (MW)")      # P5/P50/P95 per hour of day
+        sk.duration_curve("Actual Total Load (MW)")
+
+    Weights are hours (a 15-min sample counts 0.25), so 15-min and hourly inputs mix and
+    duration curves read in hours.
+    """
+
+    def __init__(self, compression: float = COMPRESSION):
+        self.compression = compression
+        self.keys = []  # (area, series, hour, month) per key id
+        self._ids = {}
+        self._key = np.empty(0, np.int64)
+        self._mean = np.empty(0)
+        self._weight = np.empty(0)
+        self._min = np.empty(0)
+        self._max = np.empty(0)
+        self._buffer = []
+        self._buffered = 0
+
+    # ---------- building ----------
+    def _key_ids(self, keys: list) -> np.ndarray:
+        for k in keys:
+            if k not in self._ids:
+                self._ids[k] = len(self.keys)
+                self.keys.append(k)
+        n = len(self.keys)
+        if len(self._min) < n:
+            self._min = np.r_[self._min, np.full(n - len(self._min), np.inf)]
+            self._max = np.r_[self._max, np.full(n - len(self._max), -np.inf)]
+        return np.array([self._ids[k] for k in keys], dtype=np.int64)
+
+    def _push(self, key: np.ndarray, value: np.ndarray, weight: np.ndarray) -> None:
+        ok = ~np.isnan(value)
+        key, value, weight = key[ok], value[ok], weight[ok]
+        if not len(key):
+            return
+        np.minimum.at(self._min, key, value)
+        np.maximum.at(self._max, key, value)
+        self._buffer.append((key, value, weight))
+        self._buffered += len(key)
+        if self._buffered >= BUFFER:
+            self.compress()
+
+    def add(self, frame, area: str = DEFAULT_AREA, hours: float = None) -> "QuantileSketches":
+        """
+        Add a datetime-indexed frame (one column per series) or series. `hours` is the
+        duration each sample stands for (default: median spacing, e.g. 0.25 for 15-min).
+        """
+        df = frame.to_frame() if isinstance(frame, pd.Series) else frame.select_dtypes("number")
+        idx = pd.DatetimeIndex(df.index)
+        if hours is None:
+            diffs = np.diff(idx.asi8[:10_000])
+            diffs = diffs[diffs > 0]
+            unit = pd.Timedelta(1, unit=idx.unit).value
+            hours = float(np.median(diffs)) * unit / 3.6e12 if len(diffs) else 1.0
+        hour = idx.hour.to_numpy(np.int64)
+        month = idx.month.to_numpy(np.int64)
+        slot = hour * 12 + (month - 1)  # 288 (hour, month) cells
+        for col in df.columns:
+            ids = self._key_ids([(str(area), str(col), h, m) for h in range(24) for m in range(1, 13)])
+            self._push(ids[slot], df[col].to_numpy(np.float64), np.full(len(df), hours))
+        return self
+
+    def add_long(self, times: pd.DatetimeIndex, values: np.ndarray, series: np.ndarray, areas: np.ndarray,
+                 hours: float = 1.0) -> "QuantileSketches":
+        """Add long-format rows (one value per row with its own series and area labels)."""
+        times = pd.DatetimeIndex(times)
+        cell = times.hour.to_numpy(np.int64) * 12 + times.month.to_numpy(np.int64) - 1
+        labels = pd.MultiIndex.from_arrays([pd.Index(areas).astype(str), pd.Index(series).astype(str)])
+        codes, uniques = pd.factorize(labels)
+        for j, (area, name) in enumerate(uniques):
+            rows = codes == j
+            ids = self._key_ids([(area, name, h, m) for h in range(24) for m in range(1, 13)])
+            self._push(ids[cell[rows]], np.asarray(values, np.float64)[rows], np.full(int(rows.sum()), hours))
+        return self
+
+    def compress(self) -> "QuantileSketches":
+        if self._buffer:
+            key = np.concatenate([self._key] + [b[0] for b in self._buffer])
+            mean = np.concatenate([self._mean] + [b[1] for b in self._buffer])
+            weight = np.concatenate([self._weight] + [b[2] for b in self._buffer])
+            self._buffer, self._buffered = [], 0
+            self._key, self._mean, self._weight = _compress(key, mean, weight, self.compression)
+        return self
+
+    def merge(self, other: "QuantileSketches") -> "QuantileSketches":
+        """Fold another sketch set in (keys matched by name)."""
+        other.compress()
+        if not other.keys:
+            return self
+        remap = self._key_ids(other.keys)
+        n = len(other.keys)
+        np.minimum.at(self._min, remap, other._min[:n])
+        np.maximum.at(self._max, remap, other._max[:n])
+        self._buffer.append((remap[other._key], other._mean, other._weight))
+        self._buffered += len(other._key)
+        return self.compress()
+
+    # ---------- queries ----------
+    def _select(self, series: str, area=None, hour=None, month=None) -> np.ndarray:
+        want = {"series": series, "area": area, "hour": hour, "month": month}
+        ids = [i for i, k in enumerate(self.keys)
+               if all(v is None or k[KEY_FIELDS.index(f)] in (v if isinstance(v, (list, tuple, range)) else [v])
+                      for f, v in want.items())]
+        return np.array(ids, dtype=np.int64)
+
+    def quantile(self, qs, series: str, area=None, hour=None, month=None) -> np.ndarray:
+        """Quantiles of one series over every key matching area/hour/month (None = all; lists allowed)."""
+        self.compress()
+        ids = self._select(series, area, hour, month)
+        sel = np.isin(self._key, ids)
+        lo = self._min[ids].min() if len(ids) else np.nan
+        hi = self._max[ids].max() if len(ids) else np.nan
+        return _quantiles(self._mean[sel], self._weight[sel], lo, hi, qs)
+
+    def total_hours(self, series: str, area=None, hour=None, month=None) -> float:
+        self.compress()
+        return float(self._weight[np.isin(self._key, self._select(series, area, hour, month))].sum())
+
+    def bands(self, series: str, by: str = "hour", qs=(0.05, 0.5, 0.95), area=None) -> pd.DataFrame:
+        """Percentile bands (columns P5, P50, P95 by default) per hour of day (0-23) or month (1-12)."""
+        groups = range(24) if by == "hour" else range(1, 13)
+        rows = [self.quantile(qs, series, area, **{by: g}) for g in groups]
+        cols = [f"P{q * 100:g}" for q in qs]
+        return pd.DataFrame(rows, index=pd.Index(list(groups), name=by), columns=cols)
+
+    def duration_curve(self, series: str, points: int = 1000, area=None, hour=None, month=None) -> pd.Series:
+        """Level exceeded for at least x hours, x from 0 to the total hours (load/generation-duration curve)."""
+        total = self.total_hours(series, area, hour, month)
+        exceed = np.linspace(0.0, 1.0, points)
+        levels = self.quantile(1.0 - exceed, series, area, hour, month)
+        return pd.Series(levels, index=pd.Index(exceed * total, name="hours"), name=series)
+
+    def memory(self) -> int:
+        """Bytes held by the centroid table."""
+        self.compress()
+        return self._key.nbytes + self._mean.nbytes + self._weight.nbytes + self._min.nbytes + self._max.nbytes
+
+    # ---------- persistence ----------
+    def save(self, path: Path = SKETCH_DIR / "sketches.npz") -> Path:
+        self.compress()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        keys = np.array([list(map(str, k)) for k in self.keys], dtype=str).reshape(-1, 4)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez_compressed(tmp, keys=keys, key=self._key, mean=self._mean, weight=self._weight,
+                            min=self._min, max=self._max, compression=self.compression)
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path = SKETCH_DIR / "sketches.npz") -> "QuantileSketches":
+        data = np.load(path)
+        sk = cls(float(data["compression"]))
+        sk.keys = [(a, s, int(h), int(m)) for a, s, h, m in data["keys"]]
+        sk._ids = {k: i for i, k in enumerate(sk.keys)}
+        sk._key, sk._mean, sk._weight = data["key"], data["mean"], data["weight"]
+        sk._min, sk._max = data["min"], data["max"]
+        return sk
+
+
+# ---------- Feeding from files ----------
+def sketch_file(path, area: str = DEFAULT_AREA, chunksize: int = CHUNK_SIZE,
+                compression: float = COMPRESSION) -> QuantileSketches:
+    """
+    Stream a known load/generation CSV (raw 15-min/hourly ENTSO-E exports, per-type files
+    or the hourly outputs) chunk by chunk into sketches. Area and production-type columns
+    become the area/series keys; the whole file is never in memory.
+    """
+    path = Path(path)
+    spec = SCHEMAS[detect_schema(pd.read_csv(path, nrows=0).columns)]
+    sk = QuantileSketches(compression)
+    hours = None
+    for chunk in pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=False):
+        time_col = next(c for c in spec["time"] if c in chunk.columns)
+        if spec["time_kind"] == "mtu":
+            times = parse_mtu_start(chunk[time_col], tz=mtu_tz_for_column(time_col), utc=False)
+        else:
+            times = pd.DatetimeIndex(pd.to_datetime(chunk[time_col], errors="coerce", format="mixed"))
+        ok = ~times.isna()
+        chunk, times = chunk[ok], times[ok]
+        if hours is None and len(times) > 1:
+            diffs = np.diff(np.unique(times.asi8[:10_000]))
+            hours = float(np.median(diffs)) * pd.Timedelta(1, unit=times.unit).value / 3.6e12 if len(diffs) else 1.0
+
+        area_col = next((c for c in _AREA_COLUMNS if c in chunk.columns), None)
+        areas = chunk[area_col].replace("", area).to_numpy() if area_col else np.full(len(chunk), area)
+        type_col = next((c for c in _TYPE_COLUMNS if c in chunk.columns), None)
+        values = spec["values"] or [c for c in chunk.columns if c not in (time_col, area_col)]
+        if type_col:
+            series = chunk[type_col].to_numpy()
+            sk.add_long(times, pd.to_numeric(chunk[values[0]], errors="coerce").to_numpy(), series, areas, hours or 1.0)
+        else:
+            for col in values:
+                sk.add_long(times, pd.to_numeric(chunk[col], errors="coerce").to_numpy(),
+                            np.full(len(chunk), col), areas, hours or 1.0)
+    return sk.compress()
+
+
+def sketch_files(paths: list, area: str = DEFAULT_AREA, workers: int = 1) -> QuantileSketches:
+    """Sketch several files (one process each when workers > 1) and merge the results."""
+    if workers == 1 or len(paths) <= 1:
+        parts = [sketch_file(p, area) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            parts = list(pool.map(sketch_file, paths, [area] * len(paths)))
+    merged = QuantileSketches()
+    for part in parts:
+        merged.merge(part)
+    return merged
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build quantile sketches and print P5/P50/P95 by hour of day.")
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--area", default=DEFAULT_AREA, help="area for files without an area column")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--out", type=Path, default=SKETCH_DIR / "sketches.npz")
+    args = parser.parse_args()
+
+    sk = sketch_files(args.files, args.area, args.workers)
+    path = sk.save(args.out)
+    print(f"✅ {len(sk.keys)} sketches ({sk.memory() / 1e6:.1f} MB) → {path}")
+    for series in dict.fromkeys(k[1] for k in sk.keys):
+        print(f"\n{series}\n{sk.bands(series).round(1).T.to_string()}")
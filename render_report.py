@@ -0,0 +1,366 @@
+import hashlib
+import inspect
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+# Batch report mode: every EDA figure is a PlotJob rendered headless (Agg) on a process
+# pool. A job is skipped when the hash of its input data slice, its parameters and its
+# code equals the hash stored for the PNG it rendered last time, so after a small data
+# update only the affected figures are redrawn. Daily, monthly and hour-of-day figures
+# read the rollup cube (like EDA_Adv.py) instead of re-aggregating the hourly rows, and
+# hash that rollup slice. "Code" covers the plot function, the
+# module-level functions it calls, the source of the repo modules it imports (e.g.
+# downsample, correlation) or lists in `deps`, and the worker style setup.
+HERE = Path(__file__).resolve().parent
+REPORT_DIR = Path(os.environ.get("REPORT_DIR", "plots/report"))
+MANIFEST = ".render_manifest.json"
+DPI = 300
+STYLE = "ggplot"
+
+# Combined 2022-2024 hourly load file written by DataPreProcessing.py
+COMBINED_LOAD = Path("Load Data") / "TotalLoadDayAhead_Hour_2022_2024_combined.csv"
+
+
+@dataclass
+class PlotJob:
+    """
+    One figure of the report. `fn(data, **params)` returns a matplotlib Figure; `data`
+    is the `columns` slice of the source ("master" table or a CSV path) in [start, end),
+    or with `rollup` set ("day", "month", "hour_of_day") the mean rollup of those columns.
+    `deps` names extra repo modules whose source changes should redraw the figure
+    (modules imported inside `fn` are found automatically). A `fn` with a `dpi`
+    parameter gets the render dpi (e.g. to size downsampling to the output pixels).
+    """
+    name: str
+    fn: Callable
+    columns: list
+    params: dict = field(default_factory=dict)
+    source: str = "master"
+    start: str = None
+    end: str = None
+    deps: tuple = ()
+    rollup: str = None
+
+
+# ---------- Plot functions (top level so workers can unpickle them) ----------
+def plot_daily_load_vs_gen(data: pd.DataFrame, load_cols: list, gen_col: str):
+    import matplotlib.pyplot as plt
+
+    daily = data / 1000
+    fig, ax = plt.subplots(figsize=(14, 5))
+    ax.plot(daily.index, daily[load_cols[0]], label="Actual Load")
+    ax.plot(daily.index, daily[load_cols[1]], label="Forecast Load", linestyle="--")
+    ax.plot(daily.index, daily[gen_col], label="Total Generation", alpha=0.7)
+    ax.set_title("Daily Load vs Forecast vs Total Generation")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Power (GW)")
+    ax.legend()
+    fig.tight_layout()
+    return fig
+
+
+def plot_gen_types_stacked(data: pd.DataFrame):
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(14, 6))
+    (data / 1000).plot.area(ax=ax, stacked=True, alpha=0.85)
+    ax.set_title("Daily Generation by Type (Stacked Area)")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Power (GW)")
+    fig.tight_layout()
+    return fig
+
+
+def plot_monthly_gen_load(data: pd.DataFrame, load_cols: list, gen_col: str):
+    import matplotlib.pyplot as plt
+
+    monthly = data / 1000
+    monthly = pd.DataFrame({
+        "Actual Load": monthly[load_cols[0]],
+        "Forecast Load": monthly[load_cols[1]],
+        "Total Generation": monthly[gen_col],
+    })
+    monthly.index = monthly.index.strftime("%Y-%m")
+    fig, ax = plt.subplots(figsize=(14, 6))
+    monthly.plot(kind="bar", ax=ax)
+    ax.set_title("Monthly Average: Load and Generation")
+    ax.set_ylabel("Power (GW)")
+    ax.tick_params(axis="x", rotation=45)
+    fig.tight_layout()
+    return fig
+
+
+def plot_peak_hour(data: pd.DataFrame, load_col: str, gen_col: str):
+    import matplotlib.pyplot as plt
+
+    by_hour = data / 1000
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.plot(by_hour.index, by_hour[load_col], label="Load by Hour")
+    ax.plot(by_hour.index, by_hour[gen_col], label="Generation by Hour", linestyle="--")
+    ax.set_title("Average Load and Generation by Hour of Day")
+    ax.set_xlabel("Hour")
+    ax.set_ylabel("Power (GW)")
+    ax.set_xticks(range(0, 24))
+    ax.legend()
+    ax.grid(True)
+    fig.tight_layout()
+    return fig
+
+
+def plot_correlation(data: pd.DataFrame):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    from correlation import CorrelationEngine
+
+    fig, ax = plt.subplots(figsize=(12, 10))
+    sns.heatmap(CorrelationEngine.from_frame(data).corr(), annot=True, cmap="coolwarm", fmt=".2f", ax=ax)
+    ax.set_title("Correlation Heatmap: Generation Types and Load (hourly)")
+    fig.tight_layout()
+    return fig
+
+
+def plot_actual_vs_dayahead(data: pd.DataFrame, title: str, dpi: int = DPI):
+    import matplotlib.pyplot as plt
+
+    from downsample import plot_downsampled
+
+    actual = next(c for c in data.columns if "actual" in c.lower())
+    forecast = next(c for c in data.columns if "day" in c.lower() or "forecast" in c.lower())
+    fig, ax = plt.subplots(figsize=(14, 6))
+    plot_downsampled(ax, data.index, data[actual], dpi=dpi, label="Actual Load")
+    plot_downsampled(ax, data.index, data[forecast], dpi=dpi, label="Day-Ahead Forecast", alpha=0.8)
+    ax.set_title(title)
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Load [MW]")
+    ax.legend(frameon=False)
+    ax.grid(True)
+    fig.tight_layout()
+    return fig
+
+
+def default_jobs() -> list:
+    """The EDA figures as report jobs."""
+    from master import LOAD_COLUMNS, TOTAL_GEN, master_groups
+
+    types = master_groups()["types"]
+    both = {"load_cols": LOAD_COLUMNS, "gen_col": TOTAL_GEN}
+    return [
+        PlotJob("daily_load_vs_gen", plot_daily_load_vs_gen, LOAD_COLUMNS + [TOTAL_GEN], both, rollup="day"),
+        PlotJob("gen_type", plot_gen_types_stacked, types, rollup="day"),
+        PlotJob("monthly_gen_load", plot_monthly_gen_load, LOAD_COLUMNS + [TOTAL_GEN], both, rollup="month"),
+        PlotJob("Peak_analysis", plot_peak_hour, [LOAD_COLUMNS[0], TOTAL_GEN],
+                {"load_col": LOAD_COLUMNS[0], "gen_col": TOTAL_GEN}, rollup="hour_of_day"),
+        PlotJob("correlation_matrix", plot_correlation, types + [LOAD_COLUMNS[0]]),
+        PlotJob("TotalLoad_Actual_vs_DayAhead", plot_actual_vs_dayahead, LOAD_COLUMNS,
+                {"title": "Electric Load – Actual vs Day-Ahead Forecast"}, source=str(COMBINED_LOAD)),
+        PlotJob("TotalLoad_Zoom", plot_actual_vs_dayahead, LOAD_COLUMNS,
+                {"title": "Zoomed View: 2023-01-01 to 2023-12-01"}, source=str(COMBINED_LOAD),
+                start="2023-01-01", end="2023-12-01"),
+    ]
+
+
+# ---------- Hashing ----------
+def _code_hash(code) -> bytes:
+    """Bytecode, names and constants; nested code objects (lambdas, generators) recursively,
+    since their repr carries a memory address."""
+    consts = [_code_hash(c) if hasattr(c, "co_code") else repr(c).encode() for c in code.co_consts]
+    return code.co_code + repr(code.co_names).encode() + b"|".join(consts)
+
+
+def _names(code) -> set:
+    """Global and imported names used by a code object and the code objects nested in it."""
+    names = set(code.co_names)
+    for c in code.co_consts:
+        if hasattr(c, "co_code"):
+            names |= _names(c)
+    return names
+
+
+def _deps_hash(fn, deps: tuple = ()) -> bytes:
+    """
+    Code of `fn` and of the module-level functions it reaches, plus the file contents of
+    every repo module it imports or lists in `deps`.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    seen, todo, modules = set(), [fn], set(deps)
+    while todo:
+        f = todo.pop()
+        if f in seen:
+            continue
+        seen.add(f)
+        h.update(_code_hash(f.__code__))
+        for name in sorted(_names(f.__code__)):
+            obj = f.__globals__.get(name)
+            if hasattr(obj, "__code__") and getattr(obj, "__module__", None) == f.__module__:
+                todo.append(obj)  # helper function of the same module
+            if (HERE / f"{name}.py").exists():
+                modules.add(name)
+    for name in sorted(modules):
+        h.update(name.encode())
+        h.update((HERE / f"{name}.py").read_bytes())
+    return h.digest()
+
+
+def job_key(job: PlotJob, data: pd.DataFrame, dpi: int) -> str:
+    """Hash of the data slice (index, columns, values), parameters, dpi, plotting code and its dependencies."""
+    h = hashlib.blake2b(digest_size=16)
+    idx = data.index
+    h.update((idx.as_unit("ns").asi8 if isinstance(idx, pd.DatetimeIndex) else idx.to_numpy(np.int64)).tobytes())
+    h.update(repr(list(data.columns)).encode())
+    h.update(np.ascontiguousarray(data.to_numpy(np.float64, na_value=np.nan)).tobytes())
+    h.update(repr(sorted(job.params.items())).encode())
+    h.update(f"{dpi}|{job.start}|{job.end}|{job.rollup}".encode())
+    h.update(_deps_hash(job.fn, tuple(job.deps)))
+    h.update(STYLE.encode() + _code_hash(_init_worker.__code__))
+    return h.hexdigest()
+
+
+def _load_data(jobs: list) -> dict:
+    """
+    Read every source once with the union of the columns its jobs need. Columns of
+    rollup jobs are folded into the rollup cube (new hours only), kept as "<source>:cube".
+    """
+    from master import read_master
+    from rollups import update_cube
+    from schemas import read_typed
+
+    frames = {}
+    for source in dict.fromkeys(j.source for j in jobs):
+        cols = list(dict.fromkeys(c for j in jobs if j.source == source for c in j.columns))
+        if source == "master":
+            frames[source] = read_master(cols, local=True)
+        else:
+            frames[source] = read_typed(source)[cols].sort_index(kind="stable")
+        rolled = list(dict.fromkeys(c for j in jobs if j.source == source and j.rollup for c in j.columns))
+        if rolled:
+            frames[f"{source}:cube"] = update_cube(frames[source][rolled])
+    return frames
+
+
+def _slice(frames: dict, job: PlotJob) -> pd.DataFrame:
+    if job.rollup:
+        from rollups import rollup
+
+        data = rollup(frames[f"{job.source}:cube"], job.rollup, columns=job.columns)
+        if job.rollup == "hour_of_day":
+            return data
+    else:
+        data = frames[job.source][job.columns]
+    if job.start is not None or job.end is not None:
+        i0 = 0 if job.start is None else data.index.searchsorted(pd.Timestamp(job.start))
+        i1 = len(data) if job.end is None else data.index.searchsorted(pd.Timestamp(job.end))
+        data = data.iloc[i0:i1]
+    return data
+
+
+# ---------- Rendering ----------
+def _call_params(job: PlotJob, dpi: int) -> dict:
+    """job.params, plus the render dpi when the plot function takes one."""
+    if "dpi" in inspect.signature(job.fn).parameters:
+        return {"dpi": dpi, **job.params}
+    return job.params
+
+
+def _init_worker() -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    plt.style.use(STYLE)
+
+
+def _render(fn, data: pd.DataFrame, params: dict, out_path: str, dpi: int) -> float:
+    import matplotlib.pyplot as plt
+
+    t0 = time.perf_counter()
+    fig = fn(data, **params)
+    tmp = out_path + ".tmp.png"
+    fig.savefig(tmp, dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+    os.replace(tmp, out_path)
+    return time.perf_counter() - t0
+
+
+def _read_manifest(out_dir: Path) -> dict:
+    try:
+        with open(out_dir / MANIFEST, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def render_report(jobs: list = None, out_dir: Path = REPORT_DIR, workers: int = None,
+                  force: bool = False, dpi: int = DPI) -> dict:
+    """
+    Render every job to <out_dir>/<name>.png, skipping unchanged ones. Returns
+    {name: seconds spent rendering, or None if skipped}. Failed jobs are reported and
+    left out of the manifest so they are retried next time.
+    """
+    from profiling import stage
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = default_jobs() if jobs is None else jobs
+    with stage("report_inputs"):
+        frames = _load_data(jobs)
+    manifest = _read_manifest(out_dir)
+
+    todo, done = {}, {}
+    for job in jobs:
+        data = _slice(frames, job)
+        key = job_key(job, data, dpi)
+        png = out_dir / f"{job.name}.png"
+        if not force and manifest.get(job.name) == key and png.exists():
+            print(f"⏭️  {job.name}: inputs unchanged, skipped.")
+            done[job.name] = None
+            continue
+        todo[job.name] = (job, data, key, str(png))
+
+    workers = min(workers or os.cpu_count() or 1, max(len(todo), 1))
+    with stage("render", rows_in=len(todo)):
+        if workers == 1:
+            _init_worker()
+            results = {}
+            for name, (job, data, _, png) in todo.items():
+                try:
+                    results[name] = _render(job.fn, data, _call_params(job, dpi), png, dpi)
+                except Exception as exc:
+                    results[name] = exc
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = {pool.submit(_render, job.fn, data, _call_params(job, dpi), png, dpi): name
+                           for name, (job, data, _, png) in todo.items()}
+                results = {}
+                for fut in as_completed(futures):
+                    try:
+                        results[futures[fut]] = fut.result()
+                    except Exception as exc:
+                        results[futures[fut]] = exc
+
+    for name, res in results.items():
+        if isinstance(res, Exception):
+            print(f"⚠️ {name}: failed ({type(res).__name__}: {res}); other plots continue.")
+            manifest.pop(name, None)
+        else:
+            print(f"✅ {name}: rendered in {res:.2f} s → {todo[name][3]}")
+            manifest[name] = todo[name][2]
+            done[name] = res
+
+    with open(out_dir / MANIFEST, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=1)
+    return done
+
+
+if __name__ == "__main__":
+    from profiling import report
+
+    render_report()
+    report("render_report")
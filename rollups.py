@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Persisted cube: one row per (area, series, granularity, bucket) with sum/count/min/max
+CUBE_DIR = Path(os.environ.get("ROLLUP_CUBE_DIR", ".rollup_cube"))
+DEFAULT_AREA = "default"
+
+# bucket keys: day / month start as int64 ns, hour of day as 0-23
+GRANULARITIES = ("day", "month", "hour_of_day")
+STATS = ("sum", "count", "min", "max")
+KEY_COLS = ["area", "series", "granularity", "bucket"]
+
+
+def _bucket_keys(idx: pd.DatetimeIndex) -> dict:
+    return {
+        "day": idx.floor("D").as_unit("ns").asi8,
+        "month": idx.to_period("M").to_timestamp().as_unit("ns").asi8,
+        "hour_of_day": idx.hour.to_numpy(np.int64),
+    }
+
+
+def _partial_cube(frame: pd.DataFrame, area: str) -> pd.DataFrame:
+    """sum/count/min/max of every numeric column for every granularity, in long form."""
+    frame = frame.select_dtypes("number")
+    keys = _bucket_keys(pd.DatetimeIndex(frame.index))
+    parts = []
+    for gran, key in keys.items():
+        agg = frame.groupby(key).agg(list(STATS))  # columns: (series, stat)
+        long = agg.stack(level=0, future_stack=True).reset_index()
+        long.columns = ["bucket", "series"] + list(STATS)
+        long["granularity"] = gran
+        parts.append(long)
+    cube = pd.concat(parts, ignore_index=True)
+    cube["area"] = area
+    cube = cube[cube["count"] > 0]
+    return cube[KEY_COLS + list(STATS)]
+
+
+def _merge(cubes: list) -> pd.DataFrame:
+    cube = pd.concat(cubes, ignore_index=True)
+    return cube.groupby(KEY_COLS, sort=False, as_index=False).agg(
+        sum=("sum", "sum"), count=("count", "sum"), min=("min", "min"), max=("max", "max")
+    )
+
+
+def _slice_hash(ns: np.ndarray, values: pd.Series, mark: int) -> str:
+    """Content hash of one series' hours up to and including `mark` (timestamps and values)."""
+    keep = ns <= mark
+    h = hashlib.blake2b(digest_size=16)
+    h.update(ns[keep].tobytes())
+    h.update(values.to_numpy(np.float64)[keep].tobytes())
+    return h.hexdigest()
+
+
+def load_cube(cube_dir: Path = CUBE_DIR) -> tuple:
+    """
+    (cube frame, watermarks {"area|series": {"mark": last hour included as int64 ns,
+    "hash": content hash of the hours up to it}}).
+    """
+    try:
+        cube = pd.read_pickle(cube_dir / "cube.pkl")
+        with open(cube_dir / "watermarks.json", encoding="utf-8") as fh:
+            marks = json.load(fh)
+    except FileNotFoundError:
+        cube = pd.DataFrame(columns=KEY_COLS + list(STATS))
+        marks = {}
+    return cube, marks
+
+
+def save_cube(cube: pd.DataFrame, marks: dict, cube_dir: Path = CUBE_DIR) -> None:
+    cube_dir.mkdir(parents=True, exist_ok=True)
+    cube.to_pickle(cube_dir / "cube.pkl")
+    with open(cube_dir / "watermarks.json", "w", encoding="utf-8") as fh:
+        json.dump(marks, fh)
+
+
+def update_cube(frames, area: str = DEFAULT_AREA, cube_dir: Path = CUBE_DIR, rebuild: bool = False) -> pd.DataFrame:
+    """
+    Fold hourly frames (datetime index, one numeric column per series, full history) into
+    the cube. Only hours after each series' watermark are added, so re-running on a file
+    that merely grew is incremental. If the hours already folded in no longer hash the
+    same (a source was corrected), that series is dropped from the cube and refolded.
+    """
+    if isinstance(frames, pd.DataFrame):
+        frames = [frames]
+    cube, marks = (pd.DataFrame(columns=KEY_COLS + list(STATS)), {}) if rebuild else load_cube(cube_dir)
+
+    partials, stale = [], []
+    for frame in frames:
+        frame = frame.select_dtypes("number")
+        if frame.empty:
+            continue
+        ns = pd.DatetimeIndex(frame.index).as_unit("ns").asi8
+        new = frame.copy()
+        for col in frame.columns:
+            entry = marks.get(f"{area}|{col}")
+            if entry is not None and (not isinstance(entry, dict)
+                                      or _slice_hash(ns, frame[col], entry["mark"]) != entry["hash"]):
+                print(f"⚠️ {col}: hours already in the rollup cube changed; rebuilding this series.")
+                stale.append(col)
+                del marks[f"{area}|{col}"]
+                entry = None
+            if entry is not None:
+                new.loc[ns <= entry["mark"], col] = np.nan  # already folded in
+        lowest = min(marks[f"{area}|{c}"]["mark"] if f"{area}|{c}" in marks else np.iinfo(np.int64).min
+                     for c in frame.columns)
+        new = new[ns > lowest]
+        if len(new):
+            partials.append(_partial_cube(new, area))
+        for col in frame.columns:
+            prev = marks.get(f"{area}|{col}", {}).get("mark", ns.max())
+            mark = int(max(ns.max(), prev))
+            marks[f"{area}|{col}"] = {"mark": mark, "hash": _slice_hash(ns, frame[col], mark)}
+
+    if stale and len(cube):
+        cube = cube[~((cube["area"] == area) & cube["series"].isin(stale))]
+    if partials:
+        cube = _merge([cube] + partials) if len(cube) else _merge(partials)
+        save_cube(cube, marks, cube_dir)
+    elif rebuild or stale:
+        save_cube(cube, marks, cube_dir)
+    return cube
+
+
+def rollup(cube: pd.DataFrame, granularity: str, stat: str = "mean", columns: list = None,
+           area: str = DEFAULT_AREA) -> pd.DataFrame:
+    """
+    Wide bucket × series table of one statistic ("mean", "sum", "count", "min", "max").
+    Day/month buckets come back as a contiguous DatetimeIndex (months labelled at
+    month end like resample("M")); hour_of_day as 0-23.
+    """
+    sel = cube[(cube["granularity"] == granularity) & (cube["area"] == area)]
+    if columns is not None:
+        sel = sel[sel["series"].isin(columns)]
+    values = sel["sum"] / sel["count"] if stat == "mean" else sel[stat]
+
+    wide = pd.DataFrame({"bucket": sel["bucket"], "series": sel["series"], "v": values.astype(float)})
+    wide = wide.pivot(index="bucket", columns="series", values="v").sort_index()
+    wide.columns.name = None
+    if columns is not None:
+        wide = wide.reindex(columns=columns)
+
+    if granularity == "hour_of_day":
+        wide.index = wide.index.astype(int)
+        wide.index.name = "hour"
+        return wide
+
+    wide.index = pd.DatetimeIndex(wide.index.to_numpy(np.int64).view("datetime64[ns]"), name="datetime")
+    if len(wide):
+        freq = "D" if granularity == "day" else "MS"
+        wide = wide.reindex(pd.date_range(wide.index[0], wide.index[-1], freq=freq, name="datetime"))
+    if granularity == "month":
+        wide.index = wide.index + pd.offsets.MonthEnd(0)
+    return wide
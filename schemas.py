@@ -0,0 +1,136 @@
+from pathlib import Path
+
+import pandas as pd
+
+from frame_cache import load_cached
+from mtu import parse_mtu_start, mtu_tz_for_column
+
+# ---------- Schema registry ----------
+# time:       candidate time columns, first match wins
+# time_kind:  "mtu" for ENTSO-E interval strings, "datetime" for already-clean timestamps
+# categories: low-cardinality text columns (area / production type)
+# values:     MW columns stored as float32; None means "every other column"
+SCHEMAS = {
+    "entsoe_load": {
+        "time": ["MTU (CET/CEST)", "MTU (UTC)"],
+        "time_kind": "mtu",
+        "categories": ["Area"],
+        "values": ["Actual Total Load (MW)", "Day-ahead Total Load Forecast (MW)"],
+    },
+    "load_hourly": {
+        "time": ["datetime"],
+        "time_kind": "datetime",
+        "categories": ["Area"],
+        "values": ["Actual Total Load (MW)", "Day-ahead Total Load Forecast (MW)"],
+    },
+    "entsoe_generation": {
+        "time": ["MTU (CET/CEST)", "MTU (UTC)"],
+        "time_kind": "mtu",
+        "categories": ["Area", "Production Type"],
+        "values": ["Generation (MW)"],
+    },
+    "generation_by_type": {
+        "time": ["Time_Interval"],
+        "time_kind": "mtu",
+        "categories": ["Country_Area", "Production_Type"],
+        "values": ["Generation_Value"],
+    },
+    "total_gen": {
+        "time": ["Time_Interval"],
+        "time_kind": "mtu",
+        "categories": ["Country_Area"],
+        "values": ["Total_Generation"],
+    },
+    "total_gen_hourly": {
+        "time": ["Hourly_Time_Start"],
+        "time_kind": "datetime",
+        "categories": ["Country_Area"],
+        "values": ["Average_Hourly_Generation"],
+    },
+    # Wide time × type matrix (generation_hourly_all_types.csv); keep last, it matches loosely
+    "generation_wide": {
+        "time": ["Time_Interval", "datetime"],
+        "time_kind": "datetime",
+        "categories": [],
+        "values": None,
+    },
+}
+
+
+def detect_schema(columns) -> str:
+    """Name of the first registered schema whose columns are all present, else None."""
+    columns = set(columns)
+    for name, spec in SCHEMAS.items():
+        if not any(c in columns for c in spec["time"]):
+            continue
+        required = spec["categories"] + (spec["values"] or [])
+        if all(c in columns for c in required):
+            return name
+    return None
+
+
+def to_float32(s: pd.Series) -> pd.Series:
+    """Numeric text (decimal commas, stray quotes/spaces) → float32; anything else → NaN."""
+    s = s.astype(str).str.strip().str.strip('"').str.replace(",", ".", regex=False)
+    return pd.to_numeric(s, errors="coerce").astype("float32")
+
+
+def _load_typed(path: Path, schema: str, index: bool) -> pd.DataFrame:
+    spec = SCHEMAS[schema]
+    header = list(pd.read_csv(path, nrows=0).columns)
+    time_col = next(c for c in spec["time"] if c in header)
+    values = spec["values"] or [c for c in header if c != time_col]
+    cats = [c for c in spec["categories"] if c in header]
+
+    dtype = {time_col: str, **{c: "category" for c in cats}, **{c: "float32" for c in values}}
+    try:
+        df = pd.read_csv(path, dtype=dtype)
+    except ValueError:
+        # Decimal commas or text in a numeric column: parse those columns as text once
+        df = pd.read_csv(path, dtype={**dtype, **{c: str for c in values}})
+        for c in values:
+            df[c] = to_float32(df[c])
+
+    if spec["time_kind"] == "mtu":
+        df[time_col] = parse_mtu_start(df[time_col], tz=mtu_tz_for_column(time_col), utc=False)
+    else:
+        df[time_col] = pd.to_datetime(df[time_col], errors="coerce")
+
+    return df.set_index(time_col) if index else df
+
+
+def memory_report(df: pd.DataFrame, label: str = "") -> tuple:
+    """Print and return (typed bytes, bytes with pandas' default object/float64 dtypes)."""
+    typed = int(df.memory_usage(deep=True).sum())
+    default = int(df.index.memory_usage(deep=True))
+    for c in df.columns:
+        col = df[c]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            default += int(col.astype(object).memory_usage(deep=True, index=False))
+        elif col.dtype == "float32":
+            default += col.size * 8
+        else:
+            default += int(col.memory_usage(deep=True, index=False))
+    saved = 1 - typed / default if default else 0.0
+    print(f"{label or 'frame'}: {typed / 1e6:.2f} MB typed vs {default / 1e6:.2f} MB default ({saved:.0%} saved)")
+    return typed, default
+
+
+def read_typed(path, schema: str = None, index: bool = True, cache: bool = True, report: bool = False) -> pd.DataFrame:
+    """
+    Read a known load/generation table with compact dtypes: categorical area/type,
+    float32 MW values and a datetime64 time column (set as index unless index=False).
+    """
+    path = Path(path)
+    if schema is None:
+        schema = detect_schema(pd.read_csv(path, nrows=0).columns)
+        if schema is None:
+            raise ValueError(f"No registered schema matches the columns of {path.name}")
+
+    if cache:
+        df = load_cached(path, _load_typed, schema=schema, index=index)
+    else:
+        df = _load_typed(path, schema=schema, index=index)
+    if report:
+        memory_report(df, path.name)
+    return df
@@ -0,0 +1,224 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from frame_cache import content_hash
+from grid import scatter
+from schemas import read_typed
+
+# Stores live here unless a directory is given; one sub-directory per store
+STORE_ROOT = Path(os.environ.get("SERIES_STORE_DIR", ".series_store"))
+
+_META = "meta.json"
+_DATA = "data.f32"
+_DTYPE = np.float32
+
+
+def _to_naive_ns(idx: pd.DatetimeIndex) -> tuple:
+    """Naive int64 ns values plus the tz they were in (converted to UTC first if tz-aware)."""
+    idx = pd.DatetimeIndex(idx)
+    if idx.tz is not None:
+        return idx.tz_convert("UTC").tz_localize(None).as_unit("ns").asi8, "UTC"
+    return idx.as_unit("ns").asi8, None
+
+
+def _write_meta(path: Path, meta: dict) -> None:
+    tmp = path / (_META + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(meta, fh, indent=1)
+    os.replace(tmp, path / _META)
+
+
+def _grid_values(frame: pd.DataFrame, origin: int, step: int, columns: list) -> tuple:
+    """Scatter frame rows onto grid slots. Returns (slots, float32 values); duplicate slots are averaged."""
+    ns, _ = _to_naive_ns(frame.index)
+    keep = ns != np.iinfo(np.int64).min
+    slots = (ns[keep] - origin) // step
+    values = frame.loc[keep, columns].to_numpy(dtype=np.float64)
+    if not len(slots):
+        return slots, values.astype(_DTYPE)
+
+    lo = int(slots.min())
+    rows = np.bincount(slots - lo)
+    if rows.max() > 1:
+        means, _ = scatter(slots - lo, values, len(rows), how="mean")
+        occupied = np.flatnonzero(rows)
+        slots, values = occupied + lo, means[occupied]
+    return slots, values.astype(_DTYPE)
+
+
+def write_store(path, frame: pd.DataFrame, freq: str = "h", source_hash: str = None) -> "SeriesStore":
+    """
+    Write a time-indexed frame as a regular grid: row i is origin + i*step, one float32
+    column per series, gaps as NaN. Duplicate timestamps are averaged.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    frame = frame.select_dtypes("number")
+    columns = [str(c) for c in frame.columns]
+    frame.columns = columns
+
+    step = int(pd.Timedelta(pd.tseries.frequencies.to_offset(freq)).value)
+    ns, tz = _to_naive_ns(frame.index)
+    ns = ns[ns != np.iinfo(np.int64).min]
+    origin = int(ns.min() // step * step) if len(ns) else 0
+    length = int((ns.max() - origin) // step + 1) if len(ns) else 0
+
+    data = np.full((length, len(columns)), np.nan, dtype=_DTYPE)
+    if length:
+        slots, values = _grid_values(frame, origin, step, columns)
+        data[slots] = values
+    data.tofile(path / _DATA)
+
+    _write_meta(path, {
+        "origin_ns": origin, "step_ns": step, "freq": freq, "tz": tz,
+        "columns": columns, "length": length, "source_hash": source_hash,
+    })
+    return SeriesStore(path)
+
+
+def append_store(path, frame: pd.DataFrame) -> "SeriesStore":
+    """Write new rows into an existing store, growing it if they lie past the current end."""
+    store = SeriesStore(path)
+    unknown = [c for c in frame.columns if str(c) not in store.columns]
+    if unknown:
+        raise ValueError(f"Columns not in store {store.path}: {unknown}")
+    frame = frame.rename(columns=str)
+
+    cols = [c for c in store.columns if c in frame.columns]
+    slots, values = _grid_values(frame, store.origin_ns, store.step_ns, cols)
+    if len(slots) and slots.min() < 0:
+        raise ValueError("Rows before the store origin cannot be appended; rebuild the store instead.")
+
+    new_length = max(store.length, int(slots.max()) + 1 if len(slots) else 0)
+    if new_length > store.length:
+        pad = np.full((new_length - store.length, len(store.columns)), np.nan, dtype=_DTYPE)
+        with open(store.path / _DATA, "ab") as fh:
+            pad.tofile(fh)
+
+    if len(slots):
+        data = np.memmap(store.path / _DATA, dtype=_DTYPE, mode="r+", shape=(new_length, len(store.columns)))
+        col_idx = [store.columns.index(c) for c in cols]
+        data[slots[:, None], col_idx] = values
+        data.flush()
+        del data
+
+    store.meta["length"] = new_length
+    _write_meta(store.path, store.meta)
+    return SeriesStore(store.path)
+
+
+class SeriesStore:
+    """Read-only, memory-mapped view of a regular time × series grid."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path / _META, encoding="utf-8") as fh:
+            self.meta = json.load(fh)
+        self.origin_ns = self.meta["origin_ns"]
+        self.step_ns = self.meta["step_ns"]
+        self.tz = self.meta["tz"]
+        self.columns = self.meta["columns"]
+        self.length = self.meta["length"]
+        shape = (self.length, len(self.columns))
+        if self.length:
+            self.data = np.memmap(self.path / _DATA, dtype=_DTYPE, mode="r", shape=shape)
+        else:
+            self.data = np.empty(shape, dtype=_DTYPE)
+
+    def offset(self, t) -> int:
+        """Grid slot of timestamp `t` (first slot at or after it), clipped to the store."""
+        t = pd.Timestamp(t)
+        if t.tzinfo is not None:
+            t = t.tz_convert("UTC").tz_localize(None)
+        i = -((self.origin_ns - t.as_unit("ns").value) // self.step_ns)  # ceil division
+        return int(min(max(i, 0), self.length))
+
+    def index(self, i0: int = 0, i1: int = None) -> pd.DatetimeIndex:
+        i1 = self.length if i1 is None else i1
+        idx = pd.DatetimeIndex(
+            (self.origin_ns + np.arange(i0, i1, dtype=np.int64) * self.step_ns).view("datetime64[ns]"),
+            name="datetime",
+        )
+        return idx.tz_localize(self.tz) if self.tz else idx
+
+    def _rows(self, start, end) -> tuple:
+        i0 = 0 if start is None else self.offset(start)
+        return i0, max(i0, self.length if end is None else self.offset(end))
+
+    def _column_slice(self, columns: list):
+        """Basic slice selecting `columns` (evenly spaced, in order), or None if there is none."""
+        idx = [self.columns.index(c) for c in columns]
+        if len(idx) == 1:
+            return slice(idx[0], idx[0] + 1)
+        step = idx[1] - idx[0]
+        if step > 0 and all(b - a == step for a, b in zip(idx, idx[1:])):
+            return slice(idx[0], idx[-1] + 1, step)
+        return None
+
+    def window_array(self, start=None, end=None, columns: list = None) -> np.ndarray:
+        """
+        Rows in [start, end) as a 2-D slice of the memory map, no scan. Zero-copy for all
+        columns or any evenly spaced selection (one column, adjacent columns, ...); other
+        column selections need a gather and come back as a copy — use window_columns() for
+        per-column views instead.
+        """
+        i0, i1 = self._rows(start, end)
+        block = self.data[i0:i1]
+        if columns is None:
+            return block
+        cols = self._column_slice(columns)
+        return block[:, cols] if cols is not None else block[:, [self.columns.index(c) for c in columns]]
+
+    def window_columns(self, start=None, end=None, columns: list = None) -> dict:
+        """{column: 1-D zero-copy view of rows in [start, end)} for any column selection."""
+        i0, i1 = self._rows(start, end)
+        return {c: self.data[i0:i1, self.columns.index(c)] for c in (columns or self.columns)}
+
+    def window(self, start=None, end=None, columns: list = None) -> pd.DataFrame:
+        """Rows in [start, end) as a datetime-indexed frame backed by the memory map (no copy of the values)."""
+        i0, i1 = self._rows(start, end)
+        index = self.index(i0, i1)
+        if columns is None or self._column_slice(columns) is not None:
+            return pd.DataFrame(self.window_array(start, end, columns), index=index,
+                                columns=columns or self.columns, copy=False)
+        return pd.DataFrame(self.window_columns(start, end, columns), index=index, copy=False)
+
+
+def store_for_csv(csv_path, freq: str = "h", store_dir=None) -> SeriesStore:
+    """Open the store mirroring a time-indexed CSV, (re)building it when the CSV content changed."""
+    csv_path = Path(csv_path)
+    store_dir = Path(store_dir) if store_dir else STORE_ROOT / f"{csv_path.stem}_{freq}"
+    digest = content_hash(csv_path)
+    try:
+        store = SeriesStore(store_dir)
+        if store.meta.get("source_hash") == digest and store.meta.get("freq") == freq:
+            return store
+    except (FileNotFoundError, json.JSONDecodeError, ValueError):
+        pass
+    return write_store(store_dir, read_typed(csv_path), freq=freq, source_hash=digest)
+
+
+def build_hourly_store(store_dir=None) -> SeriesStore:
+    """Hourly store with actual load, day-ahead forecast and every generation type."""
+    load = read_typed("TotalLoad_DayAhead_Hourly.csv").select_dtypes("number")
+    types = read_typed("generation_hourly_all_types.csv").select_dtypes("number")
+    load = load.groupby(level=0).mean()
+    types = types.groupby(level=0).mean()
+    frame = load.join(types, how="outer")
+    return write_store(store_dir or STORE_ROOT / "hourly", frame, freq="h")
+
+
+if __name__ == "__main__":
+    # python series_store.py [csv ...] -> build stores for the given CSVs (default: the hourly master store)
+    if len(sys.argv) > 1:
+        for f in sys.argv[1:]:
+            s = store_for_csv(f)
+            print(f"✅ {f} → {s.path} ({s.length} rows × {len(s.columns)} series)")
+    else:
+        s = build_hourly_store()
+        print(f"✅ Hourly store → {s.path} ({s.length} rows × {len(s.columns)} series)")
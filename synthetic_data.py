@@ -0,0 +1,211 @@
+import argparse
+import csv
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from mtu import LOCAL_TZ
+
+# Seeded generator of ENTSO-E-shaped CSVs for benchmarks: MTU strings with (CET)/(CEST)
+# suffixes around DST changes (so the fall-back hour repeats), missing slots, "N/A" values,
+# optional decimal commas, many areas and production types. Written one year at a time
+# so memory stays bounded even for 20 years × 30 zones.
+
+LOAD_COLUMNS = ["MTU (CET/CEST)", "Area", "Actual Total Load (MW)", "Day-ahead Total Load Forecast (MW)"]
+GENERATION_COLUMNS = ["Time_Interval", "Country_Area", "Production_Type", "Generation_Value"]
+
+# name: (mean MW, shape)
+PRODUCTION_TYPES = {
+    "Biomass": (800, "flat"),
+    "Energy storage": (50, "noise"),
+    "Fossil Brown coal/Lignite": (0, "flat"),
+    "Fossil Coal-derived gas": (0, "flat"),
+    "Fossil Gas": (4800, "daily"),
+    "Fossil Hard coal": (900, "flat"),
+    "Fossil Oil": (0, "flat"),
+    "Fossil Oil shale": (0, "flat"),
+    "Fossil Peat": (0, "flat"),
+    "Geothermal": (0, "flat"),
+    "Hydro Pumped Storage": (900, "daily"),
+    "Hydro Run-of-river and poundage": (3000, "flat"),
+    "Hydro Water Reservoir": (3500, "daily"),
+    "Marine": (0, "flat"),
+    "Nuclear": (6000, "flat"),
+    "Other": (300, "flat"),
+    "Other renewable": (400, "flat"),
+    "Solar": (5400, "solar"),
+    "Waste": (250, "flat"),
+    "Wind Onshore": (6100, "wind"),
+}
+
+
+def zone_names(n: int) -> list:
+    """Area labels in ENTSO-E style, e.g. 'Zone 01 (Z01)'."""
+    return [f"Zone {i:02d} (Z{i:02d})" for i in range(1, n + 1)]
+
+
+def mtu_strings(starts_utc: pd.DatetimeIndex, step: pd.Timedelta, seconds: bool = False, tz: str = LOCAL_TZ) -> np.ndarray:
+    """
+    ENTSO-E MTU labels for UTC interval starts. Endpoints on either side of a DST change,
+    and local times that occur twice, carry a (CET)/(CEST) suffix like the real exports.
+    """
+    ends_utc = starts_utc + step
+    ls, le = starts_utc.tz_convert(tz), ends_utc.tz_convert(tz)
+    fmt = "%d/%m/%Y %H:%M:%S" if seconds else "%d/%m/%Y %H:%M"
+
+    s_off = ls.tz_localize(None) - starts_utc.tz_localize(None)
+    e_off = le.tz_localize(None) - ends_utc.tz_localize(None)
+    crossing = np.asarray(s_off != e_off)
+    marked = set(starts_utc[crossing].asi8) | set(ends_utc[crossing].asi8)
+
+    wall_s, wall_e = ls.tz_localize(None), le.tz_localize(None)
+    all_wall = wall_s.append(wall_e[-1:])
+    ambiguous = set(all_wall[all_wall.duplicated(keep=False)].asi8)
+
+    def label(local, wall, utc, off):
+        txt = pd.Series(local.strftime(fmt), dtype=object)
+        flag = np.isin(utc.asi8, list(marked)) | np.isin(wall.asi8, list(ambiguous))
+        suffix = np.where(np.asarray(off) == pd.Timedelta(hours=2), " (CEST)", " (CET)")
+        return (txt + np.where(flag, suffix, "")).to_numpy()
+
+    s_txt = label(ls, wall_s, starts_utc, s_off)
+    e_txt = label(le, wall_e, ends_utc, e_off)
+    return (pd.Series(s_txt) + " - " + pd.Series(e_txt)).to_numpy()
+
+
+def _year_starts(year: int, freq: str) -> pd.DatetimeIndex:
+    """UTC interval starts covering one local calendar year."""
+    start = pd.Timestamp(f"{year}-01-01", tz=LOCAL_TZ).tz_convert("UTC")
+    end = pd.Timestamp(f"{year + 1}-01-01", tz=LOCAL_TZ).tz_convert("UTC")
+    return pd.date_range(start, end, freq=freq, inclusive="left")
+
+
+def _fmt_values(values: np.ndarray, decimal_comma: bool, na_mask: np.ndarray) -> np.ndarray:
+    txt = np.char.mod("%.2f", values).astype(object)
+    if decimal_comma:
+        txt = pd.Series(txt).str.replace(".", ",", regex=False).to_numpy()
+    txt[na_mask] = "N/A"
+    return txt
+
+
+def _load_profile(starts_utc: pd.DatetimeIndex, rng, base: float) -> tuple:
+    local = starts_utc.tz_convert(LOCAL_TZ)
+    hour = local.hour.to_numpy() + local.minute.to_numpy() / 60
+    dow = local.dayofweek.to_numpy()
+    doy = local.dayofyear.to_numpy()
+    daily = 0.15 * np.sin((hour - 8) / 24 * 2 * np.pi)
+    weekly = np.where(dow >= 5, -0.08, 0.0)
+    annual = 0.08 * np.cos((doy - 20) / 365.25 * 2 * np.pi)
+    actual = base * (1 + daily + weekly + annual) + rng.normal(0, base * 0.01, len(hour))
+    forecast = actual + rng.normal(0, base * 0.02, len(hour))
+    return np.round(actual), np.round(forecast, 2)
+
+
+def _generation_profile(starts_utc: pd.DatetimeIndex, rng, mean: float, shape: str) -> np.ndarray:
+    n = len(starts_utc)
+    if mean == 0:
+        return np.zeros(n)
+    local = starts_utc.tz_convert(LOCAL_TZ)
+    hour = local.hour.to_numpy() + local.minute.to_numpy() / 60
+    if shape == "solar":
+        v = mean * 3 * np.clip(np.sin((hour - 7) / 13 * np.pi), 0, None)
+    elif shape == "wind":
+        walk = np.cumsum(rng.normal(0, 0.02, n))
+        v = mean * np.clip(1 + walk - np.convolve(walk, np.ones(96) / 96, mode="same"), 0.05, None)
+    elif shape == "daily":
+        v = mean * (1 + 0.4 * np.sin((hour - 10) / 24 * 2 * np.pi))
+    elif shape == "noise":
+        v = mean * np.abs(rng.normal(1, 1, n))
+    else:
+        v = np.full(n, float(mean))
+    return np.round(np.clip(v + rng.normal(0, mean * 0.02, n), 0, None))
+
+
+def _drop_gaps(n: int, rng, gap_rate: float) -> np.ndarray:
+    return rng.random(n) >= gap_rate
+
+
+def write_load_csv(path, years: int = 1, start_year: int = 2023, freq: str = "15min", areas: int = 1,
+                   seed: int = 0, decimal_comma: bool = False, gap_rate: float = 0.001,
+                   na_rate: float = 0.001) -> int:
+    """Write an ENTSO-E 'Total Load - Day Ahead / Actual' export. Returns rows written."""
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    zones = zone_names(areas)
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh, quoting=csv.QUOTE_ALL)
+        writer.writerow(LOAD_COLUMNS)
+        for year in range(start_year, start_year + years):
+            starts = _year_starts(year, freq)
+            labels = mtu_strings(starts, pd.Timedelta(pd.tseries.frequencies.to_offset(freq)))
+            for z, zone in enumerate(zones):
+                actual, forecast = _load_profile(starts, rng, base=20000 + 1500 * z)
+                keep = _drop_gaps(len(starts), rng, gap_rate)
+                frame = pd.DataFrame({
+                    LOAD_COLUMNS[0]: labels,
+                    LOAD_COLUMNS[1]: zone,
+                    LOAD_COLUMNS[2]: _fmt_values(actual, decimal_comma, rng.random(len(starts)) < na_rate),
+                    LOAD_COLUMNS[3]: _fmt_values(forecast, decimal_comma, rng.random(len(starts)) < na_rate),
+                })[keep]
+                frame.to_csv(fh, header=False, index=False, quoting=csv.QUOTE_ALL)
+                rows += len(frame)
+    return rows
+
+
+def write_generation_csv(path, years: int = 1, start_year: int = 2023, freq: str = "15min", areas: int = 1,
+                         types: list = None, seed: int = 0, decimal_comma: bool = False,
+                         gap_rate: float = 0.001, na_rate: float = 0.002) -> int:
+    """
+    Write an AGGREGATED_GENERATION_PER_TYPE export (the layout Type.py and temp.py read):
+    Time_Interval, Country_Area, Production_Type, Generation_Value. Returns rows written.
+    """
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    types = list(PRODUCTION_TYPES) if types is None else types
+    zones = zone_names(areas)
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        fh.write(",".join(GENERATION_COLUMNS) + "\n")
+        for year in range(start_year, start_year + years):
+            starts = _year_starts(year, freq)
+            labels = mtu_strings(starts, pd.Timedelta(pd.tseries.frequencies.to_offset(freq)), seconds=True)
+            n = len(starts)
+            for zone in zones:
+                # time-major within a zone, like the real exports
+                values = np.column_stack([
+                    _generation_profile(starts, rng, *PRODUCTION_TYPES.get(t, (500, "flat"))) for t in types
+                ]).ravel()
+                na = rng.random(len(values)) < na_rate
+                txt = np.char.mod("%.1f", values).astype(object)
+                if decimal_comma:
+                    txt = pd.Series(txt).str.replace(".", ",", regex=False).to_numpy()  # quoted by to_csv
+                txt[na] = ""
+                frame = pd.DataFrame({
+                    GENERATION_COLUMNS[0]: np.repeat(labels, len(types)),
+                    GENERATION_COLUMNS[1]: zone,
+                    GENERATION_COLUMNS[2]: np.tile(np.array(types, dtype=object), n),
+                    GENERATION_COLUMNS[3]: txt,
+                })[_drop_gaps(len(values), rng, gap_rate)]
+                frame.to_csv(fh, header=False, index=False)
+                rows += len(frame)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic ENTSO-E-format CSVs.")
+    parser.add_argument("kind", choices=["load", "generation"])
+    parser.add_argument("out")
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--start-year", type=int, default=2023)
+    parser.add_argument("--freq", default="15min")
+    parser.add_argument("--areas", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--decimal-comma", action="store_true")
+    args = parser.parse_args()
+
+    write = write_load_csv if args.kind == "load" else write_generation_csv
+    n = write(args.out, years=args.years, start_year=args.start_year, freq=args.freq, areas=args.areas,
+              seed=args.seed, decimal_comma=args.decimal_comma)
+    print(f"✅ Wrote {n:,} rows → {args.out}")
@@ -1,6 +1,10 @@
+import time
+
 import pandas as pd
 import numpy as np
 
+from mtu import parse_mtu_start
+
 # 定义输入和输出文件名
 # 请将 'your_new_large_file.csv' 替换为您实际的文件名
 input_file = 'AGGREGATED_GENERATION_PER_TYPE_GENERATION_202312312300-202412312300.csv'
@@ -9,46 +13,111 @@ output_file = 'TotalGen.csv'
 # 定义列名，与原始程序保持一致
 COLUMNS = ['Time_Interval', 'Country_Area', 'Generation_Type', 'Generation_Value']
 
-try:
-    # Step 1: 读取 CSV 文件并处理混合类型问题
-    # 使用 dtype=str 读取所有列，防止混合类型报错
-    # 也可以直接在 read_csv 后使用 pd.to_numeric()
-    df = pd.read_csv(
+# 流式模式：每块读取的行数（None = 一次性读入整个文件）
+CHUNK_SIZE = 1_000_000
+# 部分和累计超过该行数时先合并一次，使内存只与 (时间, 地区) 键的数量有关
+MERGE_ROWS = 2_000_000
+
+
+def _has_header(path: str) -> bool:
+    """只读第一行判断是否为标题行（数据行以日期数字开头）。"""
+    with open(path, encoding='utf-8-sig') as fh:
+        first = fh.readline().lstrip('"')
+    return not first[:1].isdigit()
+
+
+def _merge(parts: list) -> pd.DataFrame:
+    """合并若干 (start, area) 部分和。"""
+    if len(parts) == 1:
+        return parts[0]
+    return pd.concat(parts).groupby(level=['start', 'area'], sort=False).agg(
+        total=('total', 'sum'), label=('label', 'first')
+    )
+
+
+def aggregate_total_generation(input_file: str, output_file: str, chunksize: int = CHUNK_SIZE) -> pd.DataFrame:
+    """
+    按 (时间间隔起点, 国家/地区) 对所有发电类型求和。
+    分块读取，每块先局部聚合为紧凑的 int64 时间键 + int32 地区编码 + float64 部分和，最后合并。
+    """
+    t0 = time.perf_counter()
+    reader = pd.read_csv(
         input_file,
         header=None,
         usecols=[0, 1, 2, 3],
-        names=COLUMNS,  # 直接指定列名
-        skiprows=1 if pd.read_csv(input_file, nrows=1).iloc[0, 0] == COLUMNS[0] else 0  # 检查并跳过可能的标题行
+        names=COLUMNS,
+        skiprows=1 if _has_header(input_file) else 0,
+        dtype={'Time_Interval': str, 'Country_Area': str, 'Generation_Type': str},
+        chunksize=chunksize,
     )
+    chunks = [reader] if chunksize is None else reader
 
-    # Step 2: 强制将 'Generation_Value' 列转换为数值类型
-    # errors='coerce' 是关键：它会将所有无法转换为数字的值（如文本、空字符串）
-    # 自动转换为 NaN (Not a Number，即缺失值)
-    df['Generation_Value'] = pd.to_numeric(
-        df['Generation_Value'],
-        errors='coerce'
-    )
+    area_codes = {}
+    parts = []
+    buffered = 0
+    n_rows = 0
+    n_bad = 0
 
-    # 由于求和 (sum) 会自动忽略 NaN 值，所以无需手动删除或填充它们。
-    # 如果您希望将缺失的发电量视为 0，可以添加：
-    # df['Generation_Value'] = df['Generation_Value'].fillna(0)
+    for chunk in chunks:
+        n_rows += len(chunk)
 
-    # Step 3: 按时间间隔和国家/地区分组求和
-    df_aggregated = df.groupby(['Time_Interval', 'Country_Area'])['Generation_Value'].sum().reset_index()
+        # 时间键：UTC 起点（int64 纳秒），同一时刻的不同写法也会归为一组
+        start = parse_mtu_start(chunk['Time_Interval']).asi8
+        valid = start != np.iinfo(np.int64).min
+        n_bad += int((~valid).sum())
 
-    # 重命名聚合后的列
-    df_aggregated.rename(columns={'Generation_Value': 'Total_Generation'}, inplace=True)
+        for area in chunk['Country_Area'].dropna().unique():
+            area_codes.setdefault(area, len(area_codes))
+        area = chunk['Country_Area'].map(area_codes).fillna(-1).to_numpy(np.int32)
 
-    # Step 4: 保存结果
+        # 无法转换为数字的值会变为 NaN，求和时自动忽略
+        value = pd.to_numeric(chunk['Generation_Value'], errors='coerce').to_numpy(np.float64)
+
+        part = pd.DataFrame({
+            'start': start[valid],
+            'area': area[valid],
+            'total': value[valid],
+            'label': chunk['Time_Interval'].to_numpy()[valid],
+        })
+        part = part.groupby(['start', 'area'], sort=False).agg(total=('total', 'sum'), label=('label', 'first'))
+        parts.append(part)
+        buffered += len(part)
+
+        if buffered > MERGE_ROWS:
+            parts = [_merge(parts)]
+            buffered = len(parts[0])
+
+    if n_bad:
+        print(f"⚠️ {n_bad} 行时间间隔无法解析，已跳过。")
+
+    merged = _merge(parts).sort_index() if parts else pd.DataFrame(
+        {'total': [], 'label': []}, index=pd.MultiIndex.from_arrays([[], []], names=['start', 'area'])
+    )
+    area_names = np.array([None] + list(area_codes), dtype=object)  # 编码 -1 -> None
+
+    df_aggregated = pd.DataFrame({
+        'Time_Interval': merged['label'].to_numpy(),
+        'Country_Area': area_names[merged.index.get_level_values('area').to_numpy() + 1],
+        'Total_Generation': merged['total'].to_numpy(),
+    })
     df_aggregated.to_csv(output_file, index=False, encoding='utf-8')
 
-    print("-" * 50)
-    print(f"✅ 成功！数据处理已完成。")
-    print(f"聚合后的数据已保存到文件: {output_file}")
-    print(f"最终表格列名: Time_Interval, Country_Area, Total_Generation")
-    print("-" * 50)
+    elapsed = time.perf_counter() - t0
+    print(f"处理 {n_rows:,} 行，用时 {elapsed:.2f} 秒（{n_rows / max(elapsed, 1e-9):,.0f} 行/秒）。")
+    return df_aggregated
+
+
+if __name__ == "__main__":
+    try:
+        aggregate_total_generation(input_file, output_file)
+
+        print("-" * 50)
+        print(f"✅ 成功！数据处理已完成。")
+        print(f"聚合后的数据已保存到文件: {output_file}")
+        print(f"最终表格列名: Time_Interval, Country_Area, Total_Generation")
+        print("-" * 50)
 
-except FileNotFoundError:
-    print(f"错误：文件未找到。请确保文件名 '{input_file}' 正确且文件存在。")
-except Exception as e:
-    print(f"处理过程中发生未知错误: {e}")
\ No newline at end of file
+    except FileNotFoundError:
+        print(f"错误：文件未找到。请确保文件名 '{input_file}' 正确且文件存在。")
+    except Exception as e:
+        print(f"处理过程中发生未知错误: {e}")
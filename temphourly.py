@@ -1,13 +1,13 @@
 import pandas as pd
 
+from grid import resample_groups
+from mtu import parse_mtu_start
+
 # 定义输入和输出文件名
 # 请注意：这里假设您新文件的名称是 'TotalGen.csv'
 input_file = 'generation_by_type/Fossil_Gas_GENERATION.csv'
 output_file = 'generation_by_type/Fossil_Gas_Hourly.csv'
 
-# 定义正确的时间格式字符串 (日/月/年 时:分:秒)
-DATE_FORMAT = "%d/%m/%Y %H:%M:%S"
-
 try:
     # Step 1: 读取 CSV 文件
     df = pd.read_csv(input_file)
@@ -20,16 +20,8 @@ try:
 
     # Step 2: 准备时间戳列以进行时间序列操作
 
-    # 提取每个间隔的起始时间点（分隔符 '-' 之前的部分）
-    # 使用更健壮的逻辑来防止解析错误（如之前讨论的）
-    df['Start_Time_Str'] = df['Time_Interval'].apply(lambda x: x.split('-')[0].strip())
-
-    # 将提取的起始时间字符串转换为 datetime 对象，并指定正确的格式，使用 errors='coerce' 作为安全网
-    df['Start_Time'] = pd.to_datetime(
-        df['Start_Time_Str'],
-        format=DATE_FORMAT,
-        errors='coerce'
-    )
+    # 提取每个间隔的起始时间点（本地时间），直接按固定位置解析，无法解析的记为 NaT
+    df['Start_Time'] = parse_mtu_start(df['Time_Interval'], utc=False)
 
     # 清理：移除时间戳无法解析的行
     df.dropna(subset=['Start_Time'], inplace=True)
@@ -40,7 +32,9 @@ try:
     # Step 3: 按 'Country_Area' 和 'Production_Type' 分组，并进行时间重采样 (Resampling)
     # **【核心改进】**：在 resample 之前，将 'Production_Type' 添加到分组键中。
     # 这样，重采样操作就会对每种发电类型的每小时数据独立进行平均。
-    df_hourly = df.groupby(['Country_Area', 'Production_Type']).resample('H')['Total_Generation'].mean().reset_index()
+    # 单次扫描的重采样内核；如需同时得到电量 (MWh)、最小/最大值，在 stats 中加入即可。
+    df_hourly = resample_groups(df, 'Total_Generation', ['Country_Area', 'Production_Type'], 'h', ['mean'])
+    df_hourly = df_hourly.rename(columns={'mean': 'Total_Generation'})
 
     # Step 4: 清理和准备输出数据
 
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import ACTUAL, DAY_AHEAD, RIDGE_LAGS, WEEK, backtest, make_origins, ridge, ridge_features, seasonal_naive
+
+
+def _series(n: int = 14 * WEEK, seed: int = 0) -> tuple:
+    idx = pd.date_range("2023-01-02", periods=n, freq="h")
+    rng = np.random.default_rng(seed)
+    hours = np.arange(n)
+    y = 25_000 + 4_000 * np.sin(2 * np.pi * hours / 24) + 1_500 * np.sin(2 * np.pi * hours / WEEK) \
+        + rng.normal(0, 300, n)
+    y[rng.random(n) < 0.01] = np.nan
+    return idx, y
+
+
+def _loop_ridge(y, x, origins, window, alpha, horizon):
+    """Plain per-origin fit and recursive forecast, one origin at a time."""
+    out = np.empty((len(origins), horizon))
+    for i, o in enumerate(origins):
+        xs, ys = x[o - window:o], y[o - window:o]
+        ok = ~np.isnan(ys) & ~np.isnan(xs).any(axis=1)
+        beta = np.linalg.solve(xs[ok].T @ xs[ok] + alpha * np.eye(x.shape[1]), xs[ok].T @ ys[ok])
+        for h in range(horizon):
+            row = x[o + h].copy()
+            for col, lag in RIDGE_LAGS:
+                if h >= lag:
+                    row[col] = out[i, h - lag]
+            out[i, h] = row @ beta
+    return out
+
+
+@pytest.mark.parametrize("horizon", [24, 48, 200])
+def test_ridge_matches_loop_solve(horizon):
+    idx, y = _series()
+    scale = np.nanmean(y)
+    x = ridge_features(y, idx.hour.to_numpy(), idx.dayofweek.to_numpy(), scale)
+    origins = make_origins(len(y), horizon, step=24, hour=idx.hour.to_numpy())
+    got = ridge(y / scale, x, origins, horizon=horizon)
+    want = _loop_ridge(y / scale, x, origins, 8 * WEEK, 1.0, horizon)
+    np.testing.assert_allclose(got, want, rtol=1e-7, atol=1e-9)
+
+
+@pytest.mark.parametrize("horizon", [24, 48])
+def test_forecasts_do_not_read_actuals_after_origin(horizon):
+    idx, y = _series()
+    frame = pd.DataFrame({ACTUAL: y, DAY_AHEAD: y}, index=idx)
+    _, base = backtest(frame, horizon=horizon)
+    o = 11 * WEEK
+    origin_time = idx[o]
+    assert origin_time in base["ridge"].index
+
+    leaked = frame.copy()
+    leaked.iloc[o:o + horizon, 0] += 5_000
+    _, moved = backtest(leaked, horizon=horizon)
+    for model in ("naive_daily", "naive_weekly", "hour_of_week", "ridge"):
+        np.testing.assert_array_equal(moved[model].loc[origin_time], base[model].loc[origin_time])
+
+
+def test_seasonal_naive_reaches_back_whole_seasons():
+    y = np.arange(1000, dtype=float)
+    origins = np.array([500])
+    pred = seasonal_naive(y, origins, 24, horizon=50)
+    np.testing.assert_array_equal(pred[0, :24], y[476:500])
+    np.testing.assert_array_equal(pred[0, 24:48], y[476:500])
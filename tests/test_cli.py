@@ -0,0 +1,19 @@
+import pandas as pd
+
+import cli
+from synthetic_data import write_generation_csv
+
+
+def test_generation_ingest_writes_quality_reports(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    raw = tmp_path / "gen.csv"
+    write_generation_csv(raw, types=["Solar", "Nuclear"])
+
+    assert cli.main(["total-gen", str(raw), "--out", str(tmp_path / "TotalGen.csv")]) == 0
+    assert cli.main(["split-types", str(raw), "--out-dir", str(tmp_path / "by_type")]) == 0
+    assert cli.main(["hourly-types", "--in-dir", str(tmp_path / "by_type"), "--out", str(tmp_path / "h.csv"),
+                     "--workers", "1"]) == 0
+
+    coverage = pd.read_csv(tmp_path / "quality" / "coverage.csv").set_index("file")
+    assert {"gen.csv", "Solar_GENERATION.csv", "Nuclear_GENERATION.csv"} <= set(coverage.index)
+    assert (tmp_path / "quality" / "gen_issues.csv").exists()
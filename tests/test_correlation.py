@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from correlation import CorrelationEngine, lagged_corr
+
+
+def _frame(days: int = 90, seed: int = 0) -> pd.DataFrame:
+    idx = pd.date_range("2023-01-01", periods=24 * days, freq="h")
+    rng = np.random.default_rng(seed)
+    base = rng.normal(0, 1, len(idx)).cumsum()
+    df = pd.DataFrame({
+        "load": 28_000 + 500 * base + rng.normal(0, 300, len(idx)),
+        "wind": 8_000 - 200 * base + rng.normal(0, 900, len(idx)),
+        "solar": np.clip(rng.normal(3_000, 1_500, len(idx)), 0, None),
+    }, index=idx)
+    for col, frac in (("load", 0.02), ("wind", 0.1), ("solar", 0.05)):
+        df.loc[rng.random(len(idx)) < frac, col] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("start,end", [
+    (None, None),
+    ("2023-01-01 05:00", "2023-01-01 20:00"),  # inside one block
+    ("2023-01-10 13:00", "2023-02-20 07:00"),  # partial blocks at both edges
+    ("2023-02-01", "2023-03-01"),  # whole blocks only
+])
+def test_window_corr_and_cov_match_pandas(start, end):
+    df = _frame()
+    eng = CorrelationEngine.from_frame(df)
+    win = df[(df.index >= (start or df.index[0])) & (df.index < (end or df.index[-1] + pd.Timedelta("1h")))]
+    np.testing.assert_allclose(eng.corr(start, end).to_numpy(), win.corr().to_numpy(), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(eng.cov(start, end).to_numpy(), win.cov().to_numpy(), rtol=1e-9)
+
+
+def test_append_in_pieces_equals_one_pass():
+    df = _frame()
+    whole = CorrelationEngine.from_frame(df)
+    eng = CorrelationEngine.from_frame(df.iloc[:500])  # ends mid-block
+    for lo, hi in ((500, 1000), (1000, 1001), (1001, len(df))):
+        eng.append(df.iloc[lo:hi])
+    np.testing.assert_allclose(eng.prefix, whole.prefix, rtol=1e-12, atol=1e-6)
+    np.testing.assert_allclose(eng.corr("2023-01-15", "2023-03-15").to_numpy(),
+                               df.loc["2023-01-15":"2023-03-14"].corr().to_numpy(), rtol=1e-9)
+
+
+def test_rolling_corr_matches_daily_windows():
+    df = _frame()
+    eng = CorrelationEngine.from_frame(df)
+    got = eng.rolling_corr("load", "wind", "30D")
+    for day in (got.index[5], got.index[40], got.index[-1]):
+        end = day + pd.Timedelta("1D")
+        win = df[(df.index >= end - pd.Timedelta("30D")) & (df.index < end)]
+        assert got[day] == pytest.approx(win["load"].corr(win["wind"]), rel=1e-9)
+
+
+def test_lagged_corr_matches_shifted_pandas_corr():
+    df = _frame(days=30)
+    target = df["load"].shift(3) + np.random.default_rng(1).normal(0, 100, len(df))
+    got = lagged_corr(df, target, max_lag=24)
+    for lag in (-24, -5, 0, 3, 24):
+        for col in df.columns:
+            assert got.loc[lag, col] == pytest.approx(df[col].corr(target.shift(-lag)), rel=1e-7)
+    assert got["load"].idxmax() == 3
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from dataset import aggregate, partitions, query, to_long, write_table
+
+
+def _wide(seed: int = 0) -> pd.DataFrame:
+    idx = pd.date_range("2023-11-01", "2024-03-01", freq="h", inclusive="left", name="datetime")
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Solar": rng.uniform(0, 5_000, len(idx)),
+        "Wind Onshore": rng.uniform(500, 15_000, len(idx)),
+        "Nuclear": rng.uniform(6_000, 7_000, len(idx)),
+    }, index=idx)
+    df.iloc[::37, 0] = np.nan
+    return df
+
+
+def test_write_is_incremental(tmp_path):
+    wide = _wide()
+    assert write_table(to_long(wide), "generation", "ES", tmp_path) == 4
+    assert write_table(to_long(wide), "generation", "ES", tmp_path) == 0
+    wide.loc["2024-01-15", "Nuclear"] += 1
+    assert write_table(to_long(wide), "generation", "ES", tmp_path) == 1
+
+
+def test_partition_pruning(tmp_path):
+    write_table(to_long(_wide()), "generation", "ES", tmp_path)
+    write_table(to_long(_wide(1)), "generation", "PT", tmp_path)
+    assert partitions("generation", "2024-01-10", "2024-02-01", root=tmp_path) == [
+        "area=ES/year=2024/month=01", "area=PT/year=2024/month=01"]
+    assert partitions("generation", areas="PT", start="2024-02-01", root=tmp_path) == ["area=PT/year=2024/month=02"]
+    assert partitions("generation", types="Hydro", root=tmp_path) == []
+    assert query("generation", start="2030-01-01", root=tmp_path).empty
+
+
+def test_query_matches_pandas_filter(tmp_path):
+    wide = _wide()
+    write_table(to_long(wide), "generation", "ES", tmp_path)
+    got = query("generation", ["datetime", "type", "value"], "2023-12-20 06:00", "2024-01-03",
+                types=["Solar", "Nuclear"], root=tmp_path)
+    want = to_long(wide.loc["2023-12-20 06:00":"2024-01-02 23:00", ["Solar", "Nuclear"]])
+    got = got.sort_values(["type", "datetime"]).reset_index(drop=True)
+    want = want.sort_values(["type", "datetime"]).reset_index(drop=True)
+    assert got["datetime"].equals(want["datetime"].astype("datetime64[us]"))
+    assert (got["type"].astype(str) == want["type"].astype(str)).all()
+    np.testing.assert_array_equal(got["value"].to_numpy(), want["value"].to_numpy())
+
+
+def test_aggregate_matches_groupby(tmp_path):
+    wide = _wide()
+    write_table(to_long(wide), "generation", "ES", tmp_path)
+    write_table(wide, "load", "ES", tmp_path)
+
+    got = aggregate("generation", ["year", "month", "type"], "value", "mean", root=tmp_path)
+    long = to_long(wide)
+    t = long["datetime"]
+    want = (long.assign(type=long["type"].astype(str)).groupby([t.dt.year.rename("year"), t.dt.month.rename("month"), "type"])
+            ["value"].mean().reset_index())
+    assert len(got) == len(want) == 12
+    np.testing.assert_allclose(got["value"].to_numpy(), want["value"].to_numpy(), rtol=1e-6)
+    assert got["type"].astype(str).tolist() == want["type"].tolist()
+
+    got = aggregate("load", ["hour"], ["Solar", "Nuclear"], "max", start="2024-01-01", root=tmp_path)
+    want = wide.loc["2024-01-01":].astype(np.float32).groupby(wide.loc["2024-01-01":].index.hour).max()
+    np.testing.assert_array_equal(got[["Solar", "Nuclear"]].to_numpy(), want[["Solar", "Nuclear"]].to_numpy())
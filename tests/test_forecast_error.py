@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecast_error import StreamingErrorMetrics, hour_of_day_metrics, rolling_metrics
+
+
+def _pair(n: int = 24 * 60, seed: int = 0) -> tuple:
+    idx = pd.date_range("2024-01-01", periods=n, freq="h")
+    rng = np.random.default_rng(seed)
+    actual = pd.Series(rng.uniform(20_000, 35_000, n), index=idx)
+    forecast = actual + rng.normal(200, 800, n)
+    actual[rng.random(n) < 0.03] = np.nan
+    forecast[rng.random(n) < 0.03] = np.nan
+    return actual, forecast
+
+
+def _pandas_metrics(actual: pd.Series, forecast: pd.Series, window: str) -> pd.DataFrame:
+    e = forecast - actual
+    ok = e.notna()
+    ape = (e.abs() / actual.abs()).where(actual != 0)
+    return pd.DataFrame({
+        "bias": e.rolling(window, min_periods=1).mean(),
+        "mae": e.abs().rolling(window, min_periods=1).mean(),
+        "rmse": np.sqrt((e ** 2).rolling(window, min_periods=1).mean()),
+        "mape": 100 * ape.rolling(window, min_periods=1).mean(),
+    }).where(ok.rolling(window, min_periods=1).sum() > 0)
+
+
+@pytest.mark.parametrize("window", ["24h", "7D", "30D"])
+def test_rolling_metrics_match_pandas_rolling(window):
+    actual, forecast = _pair()
+    got = rolling_metrics(actual, forecast, windows=(window,))
+    want = _pandas_metrics(actual, forecast, window)
+    for metric in ("bias", "mae", "rmse", "mape"):
+        np.testing.assert_allclose(got[f"{metric}_{window}"].to_numpy(), want[metric].to_numpy(), rtol=1e-9, atol=1e-6)
+
+
+def test_gappy_input_is_gridded_before_windowing():
+    actual, forecast = _pair()
+    drop = actual.index[100:150]
+    got = rolling_metrics(actual.drop(drop), forecast.drop(drop), windows=("24h",))
+    want = rolling_metrics(actual.where(~actual.index.isin(drop)), forecast, windows=("24h",))
+    assert got.index.equals(want.index)
+    np.testing.assert_allclose(got.to_numpy(), want.to_numpy(), rtol=1e-9)
+
+
+def test_hour_of_day_matches_groupby():
+    actual, forecast = _pair()
+    got = hour_of_day_metrics(actual, forecast)
+    e = forecast - actual
+    np.testing.assert_allclose(got["mae"].to_numpy(), e.abs().groupby(e.index.hour).mean().to_numpy())
+    np.testing.assert_allclose(got["bias"].to_numpy(), e.groupby(e.index.hour).mean().to_numpy())
+
+
+def test_streaming_matches_batch_with_gaps():
+    actual, forecast = _pair(n=24 * 40)
+    keep = np.ones(len(actual), bool)
+    keep[300:310] = False  # hours that never arrive
+    stream = StreamingErrorMetrics(windows=("24h", "7D"))
+    for t, a, f in zip(actual.index[keep], actual[keep], forecast[keep]):
+        last = stream.update(a, f, t)
+    batch = rolling_metrics(actual.where(keep), forecast, windows=("24h", "7D")).iloc[-1]
+    for k, v in last.items():
+        assert v == pytest.approx(batch[k], rel=1e-9, nan_ok=True)
+    np.testing.assert_allclose(stream.hour_of_day()["mae"].to_numpy(),
+                               hour_of_day_metrics(actual.where(keep), forecast)["mae"].to_numpy(), rtol=1e-9)
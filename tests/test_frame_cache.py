@@ -0,0 +1,43 @@
+import importlib
+import sys
+
+import pandas as pd
+
+import frame_cache
+
+
+def _write_module(path, factor: int) -> None:
+    path.write_text(
+        "import pandas as pd\n\n\n"
+        "def loader(path):\n"
+        f"    return pd.read_csv(path) * {factor}\n",
+        encoding="utf-8",
+    )
+
+
+def test_loader_source_edit_invalidates_entry(tmp_path, monkeypatch):
+    monkeypatch.setattr(frame_cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    csv = tmp_path / "data.csv"
+    pd.DataFrame({"x": [1, 2, 3]}).to_csv(csv, index=False)
+
+    mod_path = tmp_path / "cache_loader_mod.py"
+    _write_module(mod_path, 1)
+    mod = importlib.import_module("cache_loader_mod")
+    try:
+        assert frame_cache.load_cached(csv, mod.loader)["x"].tolist() == [1, 2, 3]
+        assert frame_cache.load_cached(csv, mod.loader)["x"].tolist() == [1, 2, 3]  # cache hit
+
+        _write_module(mod_path, 10)
+        mod = importlib.reload(mod)
+        assert frame_cache.load_cached(csv, mod.loader)["x"].tolist() == [10, 20, 30]
+    finally:
+        sys.modules.pop("cache_loader_mod", None)
+
+
+def test_key_covers_sibling_modules_of_loader():
+    import DataPreProcessing
+    import mtu
+
+    key = frame_cache._code_key(DataPreProcessing.clean_load_frame)
+    assert frame_cache._file_digest(frame_cache.Path(mtu.__file__)) in key  # parse_mtu_start
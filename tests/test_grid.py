@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from grid import grid_slots, resample_stats, to_grid
+
+
+def _frame(index) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    values = rng.uniform(1_000, 30_000, (len(index), 2))
+    values[rng.random(values.shape) < 0.02] = np.nan
+    return pd.DataFrame(values, index=index, columns=["a", "b"])
+
+
+def _assert_same(got: pd.DataFrame, want: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(got, want, check_freq=False, check_names=False, check_dtype=False)
+
+
+@pytest.mark.parametrize("how", ["mean", "sum"])
+def test_regular_15min_matches_pandas_resample(how):
+    df = _frame(pd.date_range("2023-01-01", periods=4 * 24 * 40, freq="15min"))
+    got, missing = to_grid(df, "h", how=how)
+    _assert_same(got, getattr(df.resample("h"), how)())
+    assert not missing.any()
+
+
+def test_gaps_duplicates_and_unsorted_rows_match_groupby():
+    idx = pd.date_range("2023-03-01", periods=4 * 24 * 20, freq="15min")
+    df = _frame(idx)
+    df = df.drop(df.index[500:700])  # gap of 50 hours
+    df = pd.concat([df, df.iloc[[10, 11, 300]]]).sample(frac=1, random_state=1)  # duplicates, shuffled
+    res = resample_stats(df, "h", ("mean", "min", "max", "count", "rows"))
+
+    want = df.groupby(df.index.floor("h")).agg(["mean", "min", "max", "count"])
+    want = want.reindex(pd.date_range(want.index.min(), want.index.max(), freq="h"))
+    for stat in ("mean", "min", "max"):
+        _assert_same(res[stat], want.xs(stat, axis=1, level=1))
+    _assert_same(res["count"], want.xs("count", axis=1, level=1).fillna(0))
+    rows = df.groupby(df.index.floor("h")).size().reindex(res["rows"].index, fill_value=0)
+    np.testing.assert_array_equal(res["rows"].to_numpy(), rows.to_numpy())
+
+
+def test_dst_fall_back_naive_local_duplicates_are_averaged():
+    # naive local wall clock: 02:00-02:45 appears twice on 2023-10-29, 02:00 is skipped on 2023-03-26
+    utc = pd.date_range("2023-03-25", "2023-10-30", freq="15min", tz="UTC", inclusive="left")
+    local = utc.tz_convert("Europe/Madrid").tz_localize(None)
+    df = _frame(local)
+    got, missing = to_grid(df, "h")
+    want = df.groupby(df.index.floor("h")).mean()
+    want = want.reindex(pd.date_range(want.index.min(), want.index.max(), freq="h"))
+    _assert_same(got, want)
+    assert missing[missing].index.tolist() == [pd.Timestamp("2023-03-26 02:00")]
+
+
+def test_tz_aware_dst_matches_pandas():
+    idx = pd.date_range("2023-10-28", "2023-10-31", freq="15min", tz="Europe/Madrid", inclusive="left")
+    df = _frame(idx)
+    got, _ = to_grid(df, "h")
+    _assert_same(got, df.resample("h").mean())
+
+
+def test_origin_before_data_pads_leading_slots():
+    df = _frame(pd.date_range("2023-01-02", periods=48, freq="h"))
+    got, missing = to_grid(df, "h", origin=pd.Timestamp("2023-01-01"))
+    assert got.index[0] == pd.Timestamp("2023-01-01") and len(got) == 72
+    assert missing.iloc[:24].all() and not missing.iloc[24:].any()
+    _assert_same(got.iloc[24:], df)
+
+
+def test_origin_after_all_data_gives_empty_grid():
+    slots, _, length = grid_slots(np.array([0, 10, 20], dtype=np.int64), 10, origin=100)
+    assert length == 0 and (slots < 0).all()
+
+    df = _frame(pd.date_range("2023-01-01", periods=48, freq="h"))
+    for frame in (df, df.iloc[::2], df.sample(frac=1, random_state=0)):  # regular and scatter paths
+        got, missing = to_grid(frame, "h", origin=pd.Timestamp("2024-01-01"))
+        assert got.empty and list(got.columns) == ["a", "b"] and missing.empty
+        res = resample_stats(frame, "h", ("mean", "min", "max", "rows"), origin=pd.Timestamp("2024-01-01"))
+        assert all(len(v) == 0 for v in res.values())
@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+
+import DataPreProcessing as dp
+from synthetic_data import write_load_csv
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # pipeline state, frame cache, quality reports and sketches
+    raw = {2022: tmp_path / "Hour_2022.csv", 2023: tmp_path / "15min_2023.csv", 2024: tmp_path / "15min_2024.csv"}
+    write_load_csv(raw[2022], start_year=2022, freq="h", seed=1)
+    write_load_csv(raw[2023], start_year=2023, seed=2)
+    write_load_csv(raw[2024], start_year=2024, seed=3)
+    return [
+        (raw[2022], tmp_path / "Hour_2022_aligned.csv", "hour"),
+        (raw[2023], tmp_path / "Hour_2023.csv", "15min"),
+        (raw[2024], tmp_path / "Hour_2024.csv", "15min"),
+    ]
+
+
+def _run(sources, combined):
+    return dp.run_pipeline(dp.build_stages(sources, combined))
+
+
+def _edit(path, line: int, old: str, new: str) -> None:
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    assert old in lines[line]
+    lines[line] = lines[line].replace(old, new, 1)
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def test_new_15min_values_do_not_realign_other_years(sources, tmp_path):
+    combined = tmp_path / "combined.csv"
+    _run(sources, combined)
+    raw_2024 = sources[2][0]
+    line = raw_2024.read_text(encoding="utf-8").splitlines()[500]
+    value = line.split('","')[2]
+    _edit(raw_2024, 500, value, "12345.00")
+
+    ran = _run(sources, combined)
+    assert ran["hourly:15min_2024.csv"]
+    assert not ran["align:Hour_2022.csv"]
+    assert not ran["hourly:15min_2023.csv"]
+
+
+def _outputs(sources, combined) -> dict:
+    return {p: p.read_bytes() for p in [out for _, out, _ in sources] + [combined]}
+
+
+def test_grown_15min_file_appends_like_a_full_rebuild(sources, tmp_path, capsys):
+    combined = tmp_path / "combined.csv"
+    raw_2024 = sources[2][0]
+    full = raw_2024.read_text(encoding="utf-8").splitlines(keepends=True)
+    cut = next(i for i, line in enumerate(full) if line.startswith('"01/12/2024 00:30'))  # mid-hour
+    raw_2024.write_text("".join(full[:cut]), encoding="utf-8")
+    _run(sources, combined)
+
+    raw_2024.write_text("".join(full), encoding="utf-8")  # December arrives
+    capsys.readouterr()
+    ran = _run(sources, combined)
+    out = capsys.readouterr().out
+    assert ran["hourly:15min_2024.csv"] and ran["combine"] and not ran["hourly:15min_2023.csv"]
+    assert "Hourly resampling done" not in out and "Combined file saved" not in out
+    incremental = _outputs(sources, combined)
+
+    dp.run_pipeline(dp.build_stages(sources, combined), force=True)
+    assert incremental == _outputs(sources, combined)
+
+
+def test_changed_part_is_cut_and_reappended(sources, tmp_path):
+    combined = tmp_path / "combined.csv"
+    _run(sources, combined)
+    raw_2023 = sources[1][0]
+    line = raw_2023.read_text(encoding="utf-8").splitlines()[20000]
+    _edit(raw_2023, 20000, line.split('","')[2], "1.00")
+
+    ran = _run(sources, combined)
+    assert ran["combine"] and not ran["align:Hour_2022.csv"]
+    incremental = combined.read_bytes()
+    dp.run_pipeline(dp.build_stages(sources, combined), force=True)
+    assert incremental == combined.read_bytes()
+
+
+def test_pipeline_refreshes_the_load_dataset(sources, tmp_path):
+    from dataset import query
+
+    combined = tmp_path / "combined.csv"
+    ran = _run(sources, combined)
+    assert ran["dataset:load"]
+    load = query("load", ["datetime", "Actual Total Load (MW)"])
+    assert sorted(load["datetime"].dt.year.unique()) == [2022, 2023, 2024]
+    assert len(load) == len(pd.read_csv(combined))
+    assert not _run(sources, combined)["dataset:load"]
@@ -0,0 +1,33 @@
+from profiling import Profiler
+
+MB = 2 ** 20
+
+
+def test_table_reports_per_stage_growth_not_process_peak(tmp_path, monkeypatch, capsys):
+    import profiling
+
+    # process high-water mark before/after each stage: heavy raises it, light stays below it
+    peaks = iter([100 * MB, 400 * MB, 400 * MB, 400 * MB])
+    monkeypatch.setattr(profiling, "_peak_rss", lambda: next(peaks))
+    monkeypatch.setattr(profiling, "PROFILE_DIR", tmp_path)
+    prof = Profiler(enabled=True, deep="light")
+    with prof.stage("heavy"):
+        pass
+    with prof.stage("light"):
+        small = [0] * 100_000
+        del small
+
+    by_stage = {s["stage"]: s for s in prof.summary()}
+    assert by_stage["heavy"]["peak_growth"] == 300 * MB
+    assert by_stage["light"]["peak_growth"] == 0
+    assert by_stage["light"]["peak_rss"] == 400 * MB
+    assert by_stage["light"]["py_peak"] > 0 and by_stage["heavy"]["py_peak"] is None
+
+    prof.report("t")
+    lines = capsys.readouterr().out.splitlines()
+    header = next(line for line in lines if line.startswith("stage")).split()
+    assert header[-3:] == ["MB", "proc", "MB"] and "+peak" in header and "py" in header
+    heavy = next(line for line in lines if line.startswith("heavy")).split()
+    light = next(line for line in lines if line.startswith("light")).split()
+    assert (heavy[6], heavy[7], heavy[8]) == ("300", "-", "400")
+    assert (light[6], light[8]) == ("0", "400")
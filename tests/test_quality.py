@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quality import check_file
+from synthetic_data import write_load_csv
+
+ACTUAL = "Actual Total Load (MW)"
+
+
+def _set(lines: list, i: int, value: str) -> None:
+    """Replace the actual-load field of CSV line i (0 = header)."""
+    parts = lines[i].split('","')
+    parts[2] = value
+    lines[i] = '","'.join(parts)
+
+
+@pytest.fixture
+def faulty_csv(tmp_path):
+    path = tmp_path / "load.csv"
+    write_load_csv(path, years=1, start_year=2023, freq="15min", gap_rate=0.0, na_rate=0.0)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    lines[101] = '"garbage","CTA|ES","1","2"'
+    _set(lines, 2001, "abc")
+    _set(lines, 3001, "-50")
+    _set(lines, 4001, "900000")
+    _set(lines, 9001, "60000")  # in range, far off the profile
+    for i in range(5001, 5041):  # 10 h of one value
+        _set(lines, i, "12345.00")
+    lines.insert(6001, lines[6001])  # duplicated slot
+    del lines[7001:7011]  # 10 missing slots in the middle
+    del lines[1:97]  # first day missing
+    del lines[-96:]  # last day missing
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_detects_injected_faults(faulty_csv):
+    summary, series, issues = check_file(faulty_csv)
+    row = series.set_index("series").loc[ACTUAL]
+    kinds = issues[issues["series"].isin([ACTUAL, None]) | issues["kind"].eq("bad_time")]["kind"].value_counts()
+
+    assert summary["bad_time"] == 1
+    assert summary["bad_value"] == 1
+    assert row["duplicates"] == 1
+    assert row["negative"] == 1
+    assert row["out_of_range"] == 1
+    assert row["stuck"] == 40
+    assert kinds["spike"] >= 1
+    spikes = issues[(issues["kind"] == "spike") & (issues["series"] == ACTUAL)]
+    # data row 9000: 2023-01-01 00:00 CET + 93 d 18 h = 2023-04-04 19:00 CEST (DST skipped an hour)
+    assert pd.Timestamp("2023-04-04 19:00") in set(spikes["start"])
+
+    # 365 days of 15-min slots; first/last day, 10 interior slots and the bad-time row are missing
+    assert summary["period"].startswith("2023-01-01 00:00:00")
+    assert row["expected"] == 365 * 96
+    assert row["missing_slots"] == 96 + 96 + 10 + 1
+    gaps = issues[(issues["kind"] == "gap") & (issues["series"] == ACTUAL)].sort_values("start")
+    assert gaps.iloc[0]["start"] == pd.Timestamp("2023-01-01 00:00") and gaps.iloc[0]["n"] == 96
+    assert gaps.iloc[-1]["end"] == pd.Timestamp("2024-01-01 00:00") and gaps.iloc[-1]["n"] == 96
+    assert 10 in gaps["n"].to_numpy()
+
+
+def test_file_period_hides_edge_gaps(faulty_csv):
+    _, series, _ = check_file(faulty_csv, period="file")
+    assert series.set_index("series").loc[ACTUAL, "missing_slots"] == 10 + 1
+
+
+def test_clean_file_has_full_coverage(tmp_path):
+    path = tmp_path / "clean.csv"
+    write_load_csv(path, years=1, start_year=2024, freq="15min", gap_rate=0.0, na_rate=0.0)
+    summary, series, issues = check_file(path)
+    assert summary["coverage"] == 1.0
+    assert (series[["duplicates", "missing_slots", "negative", "out_of_range"]].to_numpy() == 0).all()
+    assert not (issues["kind"] == "gap").any()
+    np.testing.assert_array_equal(series["expected"], 366 * 96)
+
+
+def test_unmarked_fall_back_hour_is_not_a_duplicate(tmp_path):
+    path = tmp_path / "unmarked.csv"
+    write_load_csv(path, years=1, start_year=2023, freq="15min", gap_rate=0.0, na_rate=0.0)
+    text = path.read_text(encoding="utf-8")
+    assert " (CET)" in text
+    path.write_text(text.replace(" (CEST)", "").replace(" (CET)", ""), encoding="utf-8")
+
+    summary, series, issues = check_file(path)
+    assert summary["duplicates"] == 0
+    assert summary["missing_slots"] == 0
+    assert summary["coverage"] == 1.0
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quantiles import QuantileSketches, sketch_file, sketch_files
+from synthetic_data import write_load_csv
+
+QS = np.array([0.001, 0.05, 0.25, 0.5, 0.75, 0.95, 0.999])
+
+
+def _frame(years: int = 3, seed: int = 0) -> pd.DataFrame:
+    idx = pd.date_range("2021-01-01", periods=24 * 365 * years, freq="h")
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"load": rng.gamma(4, 6_000, len(idx)), "solar": rng.exponential(2_000, len(idx))},
+                        index=idx)
+
+
+def _rank_error(values: np.ndarray, estimates: np.ndarray, qs: np.ndarray) -> np.ndarray:
+    return np.abs((values[:, None] <= estimates).mean(axis=0) - qs)
+
+
+def test_merged_chunks_match_exact_quantiles():
+    df = _frame()
+    merged = QuantileSketches()
+    for i in range(0, len(df), 5_000):  # chunk sketches merged like files or workers
+        merged.merge(QuantileSketches().add(df.iloc[i:i + 5_000]))
+    whole = QuantileSketches().add(df)
+
+    for col in df.columns:
+        for sk in (merged, whole):
+            assert _rank_error(df[col].to_numpy(), sk.quantile(QS, col), QS).max() < 2e-3
+        assert sk.quantile([0.0], col)[0] == df[col].min()
+        assert sk.quantile([1.0], col)[0] == df[col].max()
+        assert sk.total_hours(col) == len(df)
+
+
+def test_bands_per_hour_and_month_filters():
+    df = _frame()
+    sk = QuantileSketches().add(df)
+    bands = sk.bands("load", qs=(0.05, 0.5, 0.95))
+    assert list(bands.columns) == ["P5", "P50", "P95"] and list(bands.index) == list(range(24))
+    for hour in (0, 13):
+        values = df["load"][df.index.hour == hour].to_numpy()
+        assert _rank_error(values, bands.loc[hour].to_numpy(), np.array([0.05, 0.5, 0.95])).max() < 5e-3
+
+    values = df["load"][(df.index.hour == 3) & df.index.month.isin([1, 2])].to_numpy()
+    est = sk.quantile([0.5], "load", hour=3, month=[1, 2])
+    assert _rank_error(values, est, np.array([0.5])).max() < 5e-3
+
+
+def test_memory_is_bounded_by_compression():
+    # ≥ 600 samples per (series, hour, month) key, far more than a digest keeps
+    small = QuantileSketches().add(_frame(years=20))
+    large = QuantileSketches().add(_frame(years=40, seed=1))
+    assert len(large.keys) == len(small.keys) == 2 * 24 * 12
+    per_key = np.bincount(large._key, minlength=len(large.keys))
+    assert per_key.max() <= large.compression / 2 + 2
+    assert large.memory() < 1.1 * small.memory()
+
+
+def test_duration_curve_is_decreasing_in_hours():
+    df = _frame(years=1)
+    curve = QuantileSketches().add(df).duration_curve("load", points=101)
+    assert curve.index[-1] == pytest.approx(len(df))
+    assert (np.diff(curve.to_numpy()) <= 0).all()
+    assert curve.iloc[0] == df["load"].max() and curve.iloc[-1] == df["load"].min()
+
+
+def test_save_load_round_trip(tmp_path):
+    sk = QuantileSketches().add(_frame(years=1))
+    loaded = QuantileSketches.load(sk.save(tmp_path / "s.npz"))
+    np.testing.assert_array_equal(loaded.quantile(QS, "load", hour=5), sk.quantile(QS, "load", hour=5))
+
+
+def test_15min_and_hourly_files_merge_with_hour_weights(tmp_path):
+    quarter, hourly = tmp_path / "q.csv", tmp_path / "h.csv"
+    write_load_csv(quarter, start_year=2023, freq="15min", gap_rate=0.0, na_rate=0.0)
+    write_load_csv(hourly, start_year=2022, freq="h", gap_rate=0.0, na_rate=0.0, seed=1)
+    series = "Actual Total Load (MW)"
+    assert sketch_file(quarter).total_hours(series) == pytest.approx(8760)
+
+    merged = sketch_files([quarter, hourly])
+    assert merged.total_hours(series) == pytest.approx(2 * 8760)
+    values = np.concatenate([pd.read_csv(quarter)[series].to_numpy(), np.repeat(pd.read_csv(hourly)[series].to_numpy(), 4)])
+    assert _rank_error(values, merged.quantile(QS, series), QS).max() < 3e-3
@@ -0,0 +1,82 @@
+import pandas as pd
+
+import render_report
+from render_report import PlotJob, job_key, plot_actual_vs_dayahead, plot_correlation
+
+
+def _data() -> pd.DataFrame:
+    idx = pd.date_range("2024-01-01", periods=48, freq="h")
+    return pd.DataFrame({"Actual Load": range(48), "Day-ahead": range(48)}, index=idx, dtype=float)
+
+
+def test_key_is_stable_for_unchanged_inputs():
+    job = PlotJob("x", plot_actual_vs_dayahead, ["Actual Load", "Day-ahead"], {"title": "t"})
+    assert job_key(job, _data(), 100) == job_key(job, _data(), 100)
+
+
+def test_key_changes_with_imported_module_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_report, "HERE", tmp_path)
+    (tmp_path / "downsample.py").write_text("def plot_downsampled(*a, **k):\n    pass\n", encoding="utf-8")
+    (tmp_path / "correlation.py").write_text("class CorrelationEngine:\n    pass\n", encoding="utf-8")
+    job = PlotJob("x", plot_actual_vs_dayahead, ["Actual Load", "Day-ahead"], {"title": "t"})
+    corr_job = PlotJob("c", plot_correlation, ["Actual Load", "Day-ahead"])
+    before, corr_before = job_key(job, _data(), 100), job_key(corr_job, _data(), 100)
+
+    (tmp_path / "downsample.py").write_text("def plot_downsampled(*a, **k):\n    return 1\n", encoding="utf-8")
+    assert job_key(job, _data(), 100) != before
+    assert job_key(corr_job, _data(), 100) == corr_before  # does not import downsample
+
+    (tmp_path / "correlation.py").write_text("class CorrelationEngine:\n    x = 1\n", encoding="utf-8")
+    assert job_key(corr_job, _data(), 100) != corr_before
+
+
+def test_key_changes_with_explicit_deps_and_style(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_report, "HERE", tmp_path)
+    (tmp_path / "palette.py").write_text("COLOR = 'red'\n", encoding="utf-8")
+    job = PlotJob("x", plot_actual_vs_dayahead, ["Actual Load", "Day-ahead"], {"title": "t"}, deps=("palette",))
+    before = job_key(job, _data(), 100)
+    (tmp_path / "palette.py").write_text("COLOR = 'blue'\n", encoding="utf-8")
+    after = job_key(job, _data(), 100)
+    assert after != before
+
+    monkeypatch.setattr(render_report, "STYLE", "classic")
+    assert job_key(job, _data(), 100) != after
+
+
+def test_render_dpi_reaches_downsampling(tmp_path, monkeypatch):
+    import downsample
+
+    seen = []
+    real = downsample.plot_downsampled
+
+    def spy(ax, x, y, dpi=None, **kwargs):
+        seen.append(dpi)
+        return real(ax, x, y, dpi=dpi, **kwargs)
+
+    monkeypatch.setattr(downsample, "plot_downsampled", spy)
+    monkeypatch.setattr(render_report, "_load_data", lambda jobs: {"master": _data()})
+    job = PlotJob("x", plot_actual_vs_dayahead, ["Actual Load", "Day-ahead"], {"title": "t"})
+    render_report.render_report([job], tmp_path, workers=1, dpi=60)
+    assert seen == [60, 60]
+
+
+def test_rollup_jobs_read_the_cube(tmp_path):
+    from rollups import rollup, update_cube
+
+    idx = pd.date_range("2024-01-01", periods=24 * 70, freq="h")
+    hourly = pd.DataFrame({"load": range(len(idx)), "gen": 2.0}, index=idx, dtype=float)
+    frames = {"master": hourly, "master:cube": update_cube(hourly, cube_dir=tmp_path)}
+
+    for gran in ("day", "month", "hour_of_day"):
+        job = PlotJob("m", render_report.plot_monthly_gen_load, ["load", "gen"], rollup=gran)
+        data = render_report._slice(frames, job)
+        pd.testing.assert_frame_equal(data, rollup(frames["master:cube"], gran, columns=["load", "gen"]))
+        assert job_key(job, data, 100)  # hour-of-day index hashes too
+    monthly = render_report._slice(frames, PlotJob("m", render_report.plot_monthly_gen_load, ["load"], rollup="month"))
+    assert monthly["load"].iloc[0] == hourly.loc["2024-01", "load"].mean()
+
+    hourly.iloc[-1, 0] += 1  # a newly corrected hour changes the rollup slice and the key
+    job = PlotJob("d", render_report.plot_daily_load_vs_gen, ["load", "gen"], rollup="day")
+    before = job_key(job, render_report._slice(frames, job), 100)
+    frames["master:cube"] = update_cube(hourly, cube_dir=tmp_path)
+    assert job_key(job, render_report._slice(frames, job), 100) != before
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from rollups import load_cube, rollup, save_cube, update_cube
+
+
+def _hourly(periods: int = 24 * 62) -> pd.DataFrame:
+    idx = pd.date_range("2024-01-01", periods=periods, freq="h", name="datetime")
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"load": rng.uniform(20_000, 40_000, periods), "gen": rng.uniform(15_000, 35_000, periods)},
+                        index=idx)
+
+
+def _expected(frame: pd.DataFrame) -> pd.DataFrame:
+    """Monthly means straight from pandas."""
+    return frame.resample("MS").mean()
+
+
+def test_incremental_append_matches_full(tmp_path):
+    df = _hourly()
+    update_cube(df.iloc[:500], cube_dir=tmp_path)
+    cube = update_cube(df, cube_dir=tmp_path)
+    got = rollup(cube, "month", columns=["load", "gen"])
+    np.testing.assert_allclose(got.to_numpy(), _expected(df).to_numpy())
+
+
+def test_edited_old_hour_rebuilds_series(tmp_path):
+    df = _hourly()
+    update_cube(df, cube_dir=tmp_path)
+
+    edited = df.copy()
+    edited.iloc[10, 0] += 1e6  # an hour that is already folded into the cube
+    cube = update_cube(edited, cube_dir=tmp_path)
+    got = rollup(cube, "month", columns=["load", "gen"])
+    np.testing.assert_allclose(got.to_numpy(), _expected(edited).to_numpy())
+
+    doubled = edited * 2
+    cube = update_cube(doubled, cube_dir=tmp_path)
+    got = rollup(cube, "month", columns=["load", "gen"])
+    np.testing.assert_allclose(got.to_numpy(), _expected(doubled).to_numpy())
+    np.testing.assert_allclose(rollup(cube, "hour_of_day", columns=["load"])["load"].to_numpy(),
+                               doubled.groupby(doubled.index.hour)["load"].mean().to_numpy())
+
+
+def test_legacy_integer_watermarks_are_refolded(tmp_path):
+    df = _hourly()
+    cube = update_cube(df, cube_dir=tmp_path)
+    _, marks = load_cube(tmp_path)
+    legacy = {k: v["mark"] for k, v in marks.items()}
+    save_cube(cube, legacy, tmp_path)
+
+    cube = update_cube(df, cube_dir=tmp_path)
+    np.testing.assert_allclose(rollup(cube, "month", columns=["load", "gen"]).to_numpy(), _expected(df).to_numpy())
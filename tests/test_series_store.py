@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from series_store import SeriesStore, write_store
+
+
+@pytest.fixture
+def store(tmp_path) -> SeriesStore:
+    idx = pd.date_range("2024-01-01", periods=24 * 30, freq="h", name="datetime")
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.uniform(0, 1000, (len(idx), 4)), index=idx, columns=["a", "b", "c", "d"])
+    return write_store(tmp_path / "store", frame, freq="h")
+
+
+@pytest.mark.parametrize("columns", [None, ["b"], ["b", "c"], ["a", "c"], ["d", "a"], ["a", "b", "d"]])
+def test_window_values_are_views_of_the_memory_map(store, columns):
+    start, end = "2024-01-03", "2024-01-05 12:00"
+    df = store.window(start, end, columns)
+    i0, i1 = store.offset(start), store.offset(end)
+    assert len(df) == i1 - i0 and list(df.columns) == (columns or store.columns)
+    for c in df.columns:
+        values = df[c].to_numpy()
+        assert np.shares_memory(values, store.data)
+        np.testing.assert_array_equal(values, store.data[i0:i1, store.columns.index(c)])
+
+    for c, view in store.window_columns(start, end, columns).items():
+        assert np.shares_memory(view, store.data)
+
+
+@pytest.mark.parametrize("columns", [None, ["b"], ["b", "c"], ["a", "c"], ["a", "b", "c", "d"]])
+def test_window_array_slices_without_copy(store, columns):
+    arr = store.window_array("2024-01-02", "2024-01-03", columns)
+    assert np.shares_memory(arr, store.data) and arr.shape == (24, len(columns or store.columns))